@@ -7,13 +7,22 @@ Designed for semantic search and document analysis workflows.
 
 __version__ = "1.0.0"
 
+import os
+
 from .core.chunker import DocumentChunk
 from .integrations.meilisearch_indexer import MeiliSearchIndexer
 from .processor import DocumentProcessor, ProcessResult
+from .warmup import warm_up
 
 __all__ = [
     "DocumentProcessor",
     "ProcessResult",
     "MeiliSearchIndexer",
     "DocumentChunk",
+    "warm_up",
 ]
+
+# Opt-in: preload models in the background as soon as the package is imported;
+# DOCPROCESSOR_WARMUP_EMBED_MODEL names a sentence-transformers model to preload too
+if os.environ.get("DOCPROCESSOR_WARMUP") == "1":
+    warm_up(embed_model=os.environ.get("DOCPROCESSOR_WARMUP_EMBED_MODEL") or None)
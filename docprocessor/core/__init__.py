@@ -1,16 +1,22 @@
 """Core document processing modules."""
 
-from .chunker import DocumentChunk, DocumentChunker
+from .chunker import ChunkBatch, ChunkStats, DocumentChunk, DocumentChunker
+from .extraction_cache import ExtractionCache
 from .extractor import ContentExtractionError, ContentExtractor
 from .ocr import extract_pdf_for_llm
 from .summarizer import DocumentSummarizer, SummarizationError
+from .summary_cache import LRUSemanticCache
 
 __all__ = [
+    "ChunkBatch",
+    "ChunkStats",
     "ContentExtractor",
     "ContentExtractionError",
     "DocumentChunker",
     "DocumentChunk",
     "DocumentSummarizer",
+    "ExtractionCache",
+    "LRUSemanticCache",
     "SummarizationError",
     "extract_pdf_for_llm",
 ]
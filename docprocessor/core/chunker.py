@@ -10,12 +10,30 @@ import logging
 import re
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# Marks a tokenizer that has not been loaded yet (None means tiktoken is missing)
+_UNLOADED: Any = object()
 
-@dataclass
+
+@lru_cache(maxsize=None)
+def _load_tokenizer() -> Optional[Any]:
+    """Load the tiktoken encoding used for token counting, once per process."""
+    try:
+        import tiktoken
+
+        return tiktoken.encoding_for_model("gpt-3.5-turbo")
+    except ImportError:
+        logger.warning("tiktoken not installed, using character-based estimation")
+        return None
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     """Represents a single chunk of a document."""
 
@@ -30,6 +48,124 @@ class DocumentChunk:
     token_count: int
     pages: List[int]
     metadata: Dict[str, Any]
+    embedding: Optional[List[float]] = None
+
+
+@dataclass
+class ChunkStats:
+    """Running token statistics over emitted chunks."""
+
+    total_chunks: int = 0
+    total_tokens: int = 0
+    min_tokens: int = 0
+    max_tokens: int = 0
+
+    @property
+    def mean_tokens(self) -> float:
+        """Average tokens per chunk."""
+        return self.total_tokens / self.total_chunks if self.total_chunks else 0.0
+
+    def add(self, token_count: int) -> None:
+        """Record one emitted chunk."""
+        if self.total_chunks == 0:
+            self.min_tokens = self.max_tokens = token_count
+        else:
+            self.min_tokens = min(self.min_tokens, token_count)
+            self.max_tokens = max(self.max_tokens, token_count)
+        self.total_chunks += 1
+        self.total_tokens += token_count
+
+
+@dataclass
+class ChunkBatch:
+    """
+    Column-oriented view of a list of chunks.
+
+    Each field holds one attribute for every chunk, so per-field work
+    (token statistics, embedding requests, indexing) runs over one array
+    instead of pulling the attribute from each DocumentChunk.
+    """
+
+    chunk_ids: List[str]
+    file_ids: List[str]
+    output_ids: List[str]
+    project_ids: np.ndarray
+    filenames: List[str]
+    chunk_numbers: np.ndarray
+    total_chunks: np.ndarray
+    texts: List[str]
+    token_counts: np.ndarray
+    pages: List[List[int]]
+    metadata: List[Dict[str, Any]]
+    embeddings: Optional[np.ndarray] = None  # (n_chunks, dim) float32, if every chunk has one
+
+    @classmethod
+    def from_chunks(cls, chunks: Sequence[DocumentChunk]) -> "ChunkBatch":
+        """Build a batch from DocumentChunk objects."""
+        embeddings = None
+        if chunks and all(chunk.embedding is not None for chunk in chunks):
+            embeddings = np.asarray([chunk.embedding for chunk in chunks], dtype=np.float32)
+
+        return cls(
+            chunk_ids=[chunk.chunk_id for chunk in chunks],
+            file_ids=[chunk.file_id for chunk in chunks],
+            output_ids=[chunk.output_id for chunk in chunks],
+            project_ids=np.fromiter((c.project_id for c in chunks), np.int64, len(chunks)),
+            filenames=[chunk.filename for chunk in chunks],
+            chunk_numbers=np.fromiter((c.chunk_number for c in chunks), np.int32, len(chunks)),
+            total_chunks=np.fromiter((c.total_chunks for c in chunks), np.int32, len(chunks)),
+            texts=[chunk.chunk_text for chunk in chunks],
+            token_counts=np.fromiter((c.token_count for c in chunks), np.int32, len(chunks)),
+            pages=[chunk.pages for chunk in chunks],
+            metadata=[chunk.metadata for chunk in chunks],
+            embeddings=embeddings,
+        )
+
+    def __len__(self) -> int:
+        return len(self.chunk_ids)
+
+    def to_search_documents(self, embedder: str = "default") -> List[Dict[str, Any]]:
+        """
+        Convert the batch to Meilisearch documents.
+
+        Produces the same documents as DocumentChunker.to_search_document().
+
+        Args:
+            embedder: Meilisearch embedder name for the embeddings (default: 'default')
+
+        Returns:
+            List of dictionaries ready for Meilisearch indexing
+        """
+        vectors = self.embeddings.tolist() if self.embeddings is not None else None
+        documents = []
+
+        for i, (project_id, chunk_number, total_chunks, token_count) in enumerate(
+            zip(
+                self.project_ids.tolist(),
+                self.chunk_numbers.tolist(),
+                self.total_chunks.tolist(),
+                self.token_counts.tolist(),
+            )
+        ):
+            document = {
+                "id": self.chunk_ids[i],
+                "file_id": self.file_ids[i],
+                "output_id": self.output_ids[i],
+                "project_id": project_id,
+                "filename": self.filenames[i],
+                "chunk_number": chunk_number,
+                "total_chunks": total_chunks,
+                "chunk_text": self.texts[i],
+                "chunk_preview": self.texts[i][:200],
+                "token_count": token_count,
+                "pages": self.pages[i],
+                "metadata": self.metadata[i],
+            }
+            if vectors is not None:
+                document["_vectors"] = {embedder: vectors[i]}
+            documents.append(document)
+
+        return documents
 
 
 class DocumentChunker:
@@ -53,14 +189,26 @@ class DocumentChunker:
         self.chunk_overlap = chunk_overlap
         self.min_chunk_size = min_chunk_size
 
-        # Initialize tokenizer for counting
-        try:
-            import tiktoken
+        # Text splitter, built on first use and reused across documents
+        self._splitter: Optional[Any] = None
+        self._splitter_sizes: Optional[Tuple[int, int]] = None
+        self._windower: Optional[Callable[[str], List[str]]] = None
+        self._windower_sizes: Optional[Tuple[int, int]] = None
 
-            self.tokenizer = tiktoken.encoding_for_model("gpt-3.5-turbo")
-        except ImportError:
-            logger.warning("tiktoken not installed, using character-based estimation")
-            self.tokenizer = None
+        # Tokenizer for counting, loaded on first use so importing the package
+        # (and the module-level chunker below) does not pay the tiktoken load
+        self._tokenizer: Any = _UNLOADED
+
+    @property
+    def tokenizer(self) -> Optional[Any]:
+        """tiktoken encoding used for token counting, or None without tiktoken."""
+        if self._tokenizer is _UNLOADED:
+            self._tokenizer = _load_tokenizer()
+        return self._tokenizer
+
+    @tokenizer.setter
+    def tokenizer(self, tokenizer: Optional[Any]) -> None:
+        self._tokenizer = tokenizer
 
     def chunk_document(
         self,
@@ -70,6 +218,7 @@ class DocumentChunker:
         project_id: int,
         filename: str,
         extraction_metadata: Optional[Dict[str, Any]] = None,
+        stats: Optional[ChunkStats] = None,
     ) -> List[DocumentChunk]:
         """
         Chunk a document into semantic segments.
@@ -81,80 +230,127 @@ class DocumentChunker:
             project_id: ID of the project
             filename: Name of the file
             extraction_metadata: Optional metadata from content extraction
+            stats: Optional ChunkStats updated as each chunk is emitted
 
         Returns:
             List of DocumentChunk objects
         """
-        if not text or len(text.strip()) < self.min_chunk_size:
-            logger.warning(f"Document too short to chunk: {len(text)} characters")
-            return []
-
         try:
-            # Use langchain for semantic chunking
-            chunks_text = self._split_text_semantic(text)
-
-            # Create chunk objects
-            chunks = []
-            for i, chunk_text in enumerate(chunks_text):
-                # Skip very small chunks
-                token_count = self._count_tokens(chunk_text)
-                if token_count < self.min_chunk_size:
-                    logger.debug(f"Skipping small chunk {i}: {token_count} tokens")
-                    continue
-
-                # Extract page numbers from chunk (if PDF format markers present)
-                pages = self._extract_page_numbers(chunk_text)
-
-                chunk = DocumentChunk(
-                    chunk_id=str(uuid.uuid4()),
-                    file_id=file_id,
-                    output_id=output_id,
-                    project_id=project_id,
-                    filename=filename,
-                    chunk_number=len(chunks),
-                    total_chunks=0,  # Will be set after all chunks processed
-                    chunk_text=self._clean_chunk_text(chunk_text),
-                    token_count=token_count,
-                    pages=pages,
-                    metadata=extraction_metadata or {},
+            chunks = list(
+                self.iter_chunks(
+                    text, file_id, output_id, project_id, filename, extraction_metadata, stats
                 )
-                chunks.append(chunk)
-
-            # Update total_chunks for all chunks
-            total = len(chunks)
-            for chunk in chunks:
-                chunk.total_chunks = total
-
-            logger.info(f"Created {len(chunks)} chunks for {filename}")
-            return chunks
-
+            )
         except Exception as e:
             logger.error(f"Error chunking document: {e}")
             raise
 
+        logger.info(f"Created {len(chunks)} chunks for {filename}")
+        return chunks
+
+    def iter_chunks(
+        self,
+        text: str,
+        file_id: str,
+        output_id: str,
+        project_id: int,
+        filename: str,
+        extraction_metadata: Optional[Dict[str, Any]] = None,
+        stats: Optional[ChunkStats] = None,
+    ) -> Iterator[DocumentChunk]:
+        """
+        Lazily yield the chunks of a document.
+
+        Only the split texts and their token counts are held up front; each
+        DocumentChunk is built when it is requested, so consumers that handle
+        chunks in batches never hold the whole document's chunk objects.
+
+        Args:
+            text: The full document text
+            file_id: UUID of the output file
+            output_id: UUID of the output
+            project_id: ID of the project
+            filename: Name of the file
+            extraction_metadata: Optional metadata from content extraction
+            stats: Optional ChunkStats updated as each chunk is emitted
+
+        Yields:
+            DocumentChunk objects in document order
+        """
+        if not text or len(text.strip()) < self.min_chunk_size:
+            logger.warning(f"Document too short to chunk: {len(text)} characters")
+            return
+
+        # Use langchain for semantic chunking
+        chunks_text = self._split_text_semantic(text)
+        token_counts = self._count_tokens_batch(chunks_text)
+
+        # Token counts are known up front, so total_chunks can be set on each chunk
+        total = sum(1 for token_count in token_counts if token_count >= self.min_chunk_size)
+
+        chunk_number = 0
+        for i, (chunk_text, token_count) in enumerate(zip(chunks_text, token_counts)):
+            # Skip very small chunks
+            if token_count < self.min_chunk_size:
+                logger.debug(f"Skipping small chunk {i}: {token_count} tokens")
+                continue
+
+            # Extract page numbers from chunk (if PDF format markers present)
+            pages = self._extract_page_numbers(chunk_text)
+
+            if stats is not None:
+                stats.add(token_count)
+
+            yield DocumentChunk(
+                chunk_id=str(uuid.uuid4()),
+                file_id=file_id,
+                output_id=output_id,
+                project_id=project_id,
+                filename=filename,
+                chunk_number=chunk_number,
+                total_chunks=total,
+                chunk_text=self._clean_chunk_text(chunk_text),
+                token_count=token_count,
+                pages=pages,
+                metadata=extraction_metadata or {},
+            )
+            chunk_number += 1
+
     def _split_text_semantic(self, text: str) -> List[str]:
         """Split text using semantic boundaries."""
         try:
+            splitter = self._get_text_splitter()
+        except ImportError:
+            logger.warning("langchain-text-splitters not installed, using fallback")
+            return self._split_text_fallback(text)
+
+        return splitter.split_text(text)
+
+    def _get_text_splitter(self) -> Any:
+        """
+        Return the langchain splitter for the current chunk sizes.
+
+        The splitter is stateless between calls, so one instance is reused for
+        every document instead of being rebuilt per call.
+        """
+        sizes = (self.chunk_size, self.chunk_overlap)
+        if self._splitter is None or self._splitter_sizes != sizes:
             from langchain_text_splitters import RecursiveCharacterTextSplitter
 
             # Convert token-based sizes to character-based (rough approximation)
             char_chunk_size = self.chunk_size * 4  # ~4 chars per token
             char_overlap = self.chunk_overlap * 4
 
-            splitter = RecursiveCharacterTextSplitter(
+            self._splitter = RecursiveCharacterTextSplitter(
                 chunk_size=char_chunk_size,
                 chunk_overlap=char_overlap,
                 length_function=len,
                 separators=["\n\n", "\n", ". ", " ", ""],
                 is_separator_regex=False,
             )
+            self._splitter_sizes = sizes
 
-            chunks = splitter.split_text(text)
-            return chunks
-
-        except ImportError:
-            logger.warning("langchain-text-splitters not installed, using fallback")
-            return self._split_text_fallback(text)
+        return self._splitter
 
     def _split_text_fallback(self, text: str) -> List[str]:
         """
@@ -162,33 +358,12 @@ class DocumentChunker:
 
         Used when langchain is not available.
         """
-        char_chunk_size = self.chunk_size * 4
-        char_overlap = self.chunk_overlap * 4
-
-        chunks = []
-        start = 0
+        sizes = (self.chunk_size, self.chunk_overlap)
+        if self._windower is None or self._windower_sizes != sizes:
+            self._windower = _make_windower(self.chunk_size * 4, self.chunk_overlap * 4)
+            self._windower_sizes = sizes
 
-        while start < len(text):
-            # Get chunk end position
-            end = start + char_chunk_size
-
-            # If not at end, try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence break within last 20% of chunk
-                search_start = end - int(char_chunk_size * 0.2)
-                sentence_end = text.rfind(". ", search_start, end)
-
-                if sentence_end > start:
-                    end = sentence_end + 1
-
-            chunk = text[start:end]
-            if chunk.strip():
-                chunks.append(chunk)
-
-            # Move start position with overlap
-            start = end - char_overlap
-
-        return chunks
+        return self._windower(text)
 
     def _count_tokens(self, text: str) -> int:
         """Count tokens in text."""
@@ -198,7 +373,31 @@ class DocumentChunker:
             except Exception as e:
                 logger.warning(f"Token counting failed: {e}, using estimation")
 
-        # Fallback: estimate 4 characters per token
+        return self._estimate_tokens(text)
+
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Count tokens for several texts with a single tokenizer call.
+
+        tiktoken encodes the batch in its native thread pool, which avoids a
+        Python-level encode() round trip per chunk.
+        """
+        if self.tokenizer and texts:
+            try:
+                return [len(ids) for ids in self.tokenizer.encode_ordinary_batch(texts)]
+            except Exception as e:
+                logger.warning(f"Batch token counting failed: {e}, using estimation")
+
+        return [self._estimate_tokens(text) for text in texts]
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """
+        Estimate token count when tiktoken is unavailable.
+
+        Uses ~4 characters per token, so the estimate is O(1) on the string
+        length and never scans the text.
+        """
         return len(text) // 4
 
     def _extract_page_numbers(self, text: str) -> List[int]:
@@ -233,17 +432,21 @@ class DocumentChunker:
 
         return text
 
-    def to_search_document(self, chunk: DocumentChunk) -> Dict[str, Any]:
+    def to_search_document(self, chunk: DocumentChunk, embedder: str = "default") -> Dict[str, Any]:
         """
         Convert a DocumentChunk to a Meilisearch document format.
 
+        Pre-computed embeddings are passed as user-provided vectors, so
+        Meilisearch does not embed the chunk again.
+
         Args:
             chunk: The chunk to convert
+            embedder: Meilisearch embedder name for chunk.embedding (default: 'default')
 
         Returns:
             Dictionary ready for Meilisearch indexing
         """
-        return {
+        document = {
             "id": chunk.chunk_id,  # Use chunk_id as primary key
             "file_id": chunk.file_id,
             "output_id": chunk.output_id,
@@ -258,6 +461,54 @@ class DocumentChunker:
             "metadata": chunk.metadata,
         }
 
+        if chunk.embedding is not None:
+            document["_vectors"] = {embedder: chunk.embedding}
+
+        return document
+
+
+def _make_windower(char_chunk_size: int, char_overlap: int) -> Callable[[str], List[str]]:
+    """
+    Build the fallback window loop specialized for fixed character sizes.
+
+    The sizes are bound as closure constants, so the loop does no attribute
+    lookups or size arithmetic per window.
+    """
+    # Look for sentence break within last 20% of chunk
+    sentence_search = char_chunk_size - int(char_chunk_size * 0.2)
+
+    def split(text: str) -> List[str]:
+        chunks = []
+        append = chunks.append
+        rfind = text.rfind
+        text_length = len(text)
+        start = 0
+
+        while start < text_length:
+            # Get chunk end position
+            end = start + char_chunk_size
+
+            # If not at end, try to break at sentence boundary
+            if end < text_length:
+                sentence_end = rfind(". ", start + sentence_search, end)
+                if sentence_end > start:
+                    end = sentence_end + 1
+
+            chunk = text[start:end]
+            if chunk.strip():
+                append(chunk)
+
+            # The window reached the end: anything after it would be overlap only
+            if end >= text_length:
+                break
+
+            # Move start position with overlap, always making progress
+            start = max(end - char_overlap, start + 1)
+
+        return chunks
+
+    return split
+
 
 # Global instance
 document_chunker = DocumentChunker()
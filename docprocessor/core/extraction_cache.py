@@ -0,0 +1,133 @@
+# docprocessor/core/extraction_cache.py
+
+"""
+Extraction cache for document content.
+
+Stores extracted text on disk keyed by file path, modification time and size,
+so re-processing an unchanged file skips extraction (and OCR) entirely. A
+small in-memory LRU tier serves repeated lookups within a process.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "docprocessor" / "extractions"
+
+
+class ExtractionCache:
+    """
+    Two-tier cache for extraction results.
+
+    Entries are JSON files named after a hash of (path, mtime, size), so a
+    modified file gets a new key and stale entries are never served.
+    """
+
+    def __init__(self, cache_dir: Optional[str | Path] = None, maxsize: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached extractions
+                       (default: ~/.cache/docprocessor/extractions)
+            maxsize: Number of extractions kept in memory (default: 128)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.maxsize = maxsize
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(file_path: Path) -> str:
+        """Build the cache key from the file's path, mtime and size."""
+        stat = file_path.stat()
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(os.fsencode(file_path.resolve()))
+        digest.update(stat.st_mtime_ns.to_bytes(8, "little", signed=True))
+        digest.update(stat.st_size.to_bytes(8, "little"))
+        return digest.hexdigest()
+
+    def get(self, file_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached extraction.
+
+        Args:
+            file_path: Path of the extracted file
+
+        Returns:
+            Extraction dictionary, or None on a miss
+        """
+        key = self.make_key(file_path)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None:
+            try:
+                with open(self.cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable extraction cache entry {key}: {e}")
+                return None
+
+            with self._lock:
+                self._remember(key, entry)
+
+        # Callers may mutate the metadata dict
+        return {**entry, "metadata": dict(entry.get("metadata", {}))}
+
+    def set(self, file_path: Path, extraction: Dict[str, Any]) -> None:
+        """
+        Store an extraction.
+
+        Args:
+            file_path: Path of the extracted file
+            extraction: Extraction dictionary (text, page_count, metadata)
+        """
+        key = self.make_key(file_path)
+        entry = {**extraction, "metadata": dict(extraction.get("metadata", {}))}
+
+        with self._lock:
+            self._remember(key, entry)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(entry, f, default=str)
+                os.replace(tmp_path, self.cache_dir / f"{key}.json")
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache entry {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached extractions."""
+        with self._lock:
+            self._memory.clear()
+
+        for entry_path in self.cache_dir.glob("*.json"):
+            entry_path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, entry: Dict[str, Any]) -> None:
+        """Insert into the in-memory LRU tier."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
@@ -7,10 +7,13 @@ Extracts text content from various file formats for indexing.
 """
 
 import logging
+import mmap
+import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
-from .ocr import extract_pdf_for_llm
+from .extraction_cache import ExtractionCache
+from .ocr import _extract_pdf_document
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +36,14 @@ class ContentExtractor:
     - Images: OCR fallback
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ExtractionCache] = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            cache: Optional cache of previous extractions, keyed by path, mtime and size
+        """
+        self.cache = cache
         self.supported_extensions = {
             ".pdf",
             ".txt",
@@ -66,6 +76,21 @@ class ContentExtractor:
         if not file_path.exists():
             raise ContentExtractionError(f"File not found: {file_path}")
 
+        if self.cache is not None:
+            cached = self.cache.get(file_path)
+            if cached is not None:
+                logger.info(f"Using cached extraction for {file_path}")
+                return cached
+
+        extraction = self._extract_by_type(file_path)
+
+        if self.cache is not None:
+            self.cache.set(file_path, extraction)
+
+        return extraction
+
+    def _extract_by_type(self, file_path: Path) -> Dict[str, Any]:
+        """Dispatch extraction on the file extension."""
         extension = file_path.suffix.lower()
 
         if extension not in self.supported_extensions:
@@ -96,10 +121,8 @@ class ContentExtractor:
         with open(file_path, "rb") as f:
             pdf_bytes = f.read()
 
-        text = extract_pdf_for_llm(pdf_bytes)
-
-        # Count pages from text markers
-        page_count = text.count("<page_")
+        # Page count comes from the same parse as the text
+        text, page_count = _extract_pdf_document(pdf_bytes)
 
         return {
             "text": text,
@@ -111,13 +134,22 @@ class ContentExtractor:
         """Extract text from plain text files."""
         logger.info(f"Reading text file: {file_path}")
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                text = f.read()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, "r", encoding="latin-1") as f:
-                text = f.read()
+        with open(file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                text = ""  # mmap cannot map an empty file
+            else:
+                # Decode straight from the mapping: one read, no intermediate bytes copy,
+                # and the latin-1 retry reuses it instead of reading the file again
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    try:
+                        text = str(mm, "utf-8")
+                    except UnicodeDecodeError:
+                        # Try with different encoding
+                        text = str(mm, "latin-1")
+
+        # Match text-mode reads, which translate line endings
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
 
         return {
             "text": text,
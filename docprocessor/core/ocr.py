@@ -1,14 +1,17 @@
 # backend/app/utils/ocr.py
 
 import logging
+import math
+import os
+import tempfile
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from io import BytesIO
-from typing import List
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pytesseract
-from pdf2image import convert_from_bytes
+from pdf2image import convert_from_path, pdfinfo_from_bytes
 from pdfminer.high_level import extract_pages
 from pdfminer.layout import LAParams, LTTextBox, LTTextLine
 from PIL import Image
@@ -25,14 +28,30 @@ class TextElement:
     page_number: int
 
 
-def extract_pdf_for_llm(pdf_bytes: bytes) -> str:
+def extract_pdf_for_llm(pdf_bytes: bytes, max_concurrent_pages: Optional[int] = None) -> str:
     """
     Extract text with layout on a per-page basis, falling back to OCR only on pages
     with no extractable text. Returns a structured string for LLM analysis.
+
+    max_concurrent_pages caps how many pages are rendered and OCR'd at once
+    (default: CPU count).
+    """
+    return _extract_pdf_document(pdf_bytes, max_concurrent_pages)[0]
+
+
+def _extract_pdf_document(
+    pdf_bytes: bytes, max_concurrent_pages: Optional[int] = None
+) -> Tuple[str, int]:
+    """
+    Run layout extraction and OCR fallback in one pass over the document.
+
+    Returns the structured text together with the page count found while
+    parsing, so callers don't need to re-derive it from the text.
     """
     try:
         all_elements: List[TextElement] = []
         pages_to_ocr: List[int] = []
+        page_count: Optional[int] = None
 
         # Safer text extraction with explicit PDFObjRef handling
         try:
@@ -63,26 +82,43 @@ def extract_pdf_for_llm(pdf_bytes: bytes) -> str:
                     all_elements.extend(page_elements)
                 else:
                     pages_to_ocr.append(page_num)
+
+                page_count = page_num
         except Exception as e:
             logger.error(f"Error in text extraction: {e}")
             # Fall back to OCR for all pages
-            pages_to_ocr = list(range(1, 100))  # Assume max 100 pages as fallback
+            page_count = _count_pages(pdf_bytes)
+            pages_to_ocr = list(range(1, page_count + 1))
 
         # OCR only on pages without native text
         if pages_to_ocr:
             try:
-                ocr_elements = perform_structured_ocr(pdf_bytes, pages_to_ocr)
+                ocr_elements = perform_structured_ocr(
+                    pdf_bytes,
+                    pages_to_ocr,
+                    page_count=page_count,
+                    max_concurrent_pages=max_concurrent_pages,
+                )
                 all_elements.extend(ocr_elements)
             except Exception as ocr_e:
                 logger.error(f"OCR processing failed: {ocr_e}")
 
-        return format_for_llm(all_elements)
+        return format_for_llm(all_elements), page_count or 0
 
     except Exception as e:
         logger.error(f"Text extraction failed: {e}")
         raise
 
 
+def _count_pages(pdf_bytes: bytes) -> int:
+    """Read the page count from the PDF info dictionary (0 if unreadable)."""
+    try:
+        return pdfinfo_from_bytes(pdf_bytes)["Pages"]
+    except Exception as e:
+        logger.error(f"Could not read PDF page count: {e}")
+        return 0
+
+
 # NEW HELPER FUNCTION: Safe iteration that handles PDFObjRef objects
 def safe_iter_elements(obj):
     """Safely iterate over page elements, handling PDFObjRef objects."""
@@ -100,22 +136,51 @@ def safe_iter_elements(obj):
             raise
 
 
-def perform_structured_ocr(pdf_bytes: bytes, pages_to_ocr: List[int]) -> List[TextElement]:
+def perform_structured_ocr(
+    pdf_bytes: bytes,
+    pages_to_ocr: List[int],
+    page_count: Optional[int] = None,
+    max_concurrent_pages: Optional[int] = None,
+) -> List[TextElement]:
     """
     OCR with structure preservation only on specified pages.
+
+    The PDF is written to disk once, and the requested pages are split into
+    contiguous ranges sized to spread them over the workers. Each range is
+    rendered with a single poppler call into page image files that are OCR'd
+    one at a time, so at most max_concurrent_pages renders run at once, and
+    pages that already have native text are never rendered.
     """
-    # Convert PDF pages to images at lower DPI for speed
-    images = convert_from_bytes(pdf_bytes, dpi=150)
+    if page_count is None:
+        page_count = pdfinfo_from_bytes(pdf_bytes)["Pages"]
 
     # Filter pages to OCR to only include pages that exist
-    pages_to_ocr = [p for p in pages_to_ocr if 1 <= p <= len(images)]
+    pages_to_ocr = sorted({p for p in pages_to_ocr if 1 <= p <= page_count})
 
     if not pages_to_ocr:
         return []
 
-    # Process pages in parallel
-    with ThreadPoolExecutor() as pool:
-        results = pool.map(lambda pg: _ocr_one_page(images[pg - 1], pg), pages_to_ocr)
+    max_workers = min(max_concurrent_pages or os.cpu_count() or 1, len(pages_to_ocr))
+    page_ranges = _split_page_ranges(pages_to_ocr, math.ceil(len(pages_to_ocr) / max_workers))
+
+    with tempfile.TemporaryDirectory(prefix="docprocessor-ocr-") as work_dir:
+        pdf_path = os.path.join(work_dir, "document.pdf")
+        with open(pdf_path, "wb") as f:
+            f.write(pdf_bytes)
+
+        def ocr_range(page_range: Tuple[int, int]) -> List[TextElement]:
+            first, last = page_range
+            range_elements: List[TextElement] = []
+            image_paths = _render_pages(pdf_path, first, last, work_dir)
+            for page_num, image_path in zip(range(first, last + 1), image_paths):
+                with Image.open(image_path) as image:
+                    range_elements.extend(_ocr_one_page(image, page_num))
+                os.remove(image_path)
+            return range_elements
+
+        # Process ranges in parallel; map() keeps results in page order
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(ocr_range, page_ranges))
 
     # Flatten list of lists
     elements: List[TextElement] = []
@@ -125,6 +190,37 @@ def perform_structured_ocr(pdf_bytes: bytes, pages_to_ocr: List[int]) -> List[Te
     return elements
 
 
+def _split_page_ranges(pages: List[int], max_pages: int) -> List[Tuple[int, int]]:
+    """
+    Split sorted page numbers into contiguous (first, last) ranges of at most max_pages.
+    """
+    ranges: List[Tuple[int, int]] = []
+    first = last = pages[0]
+    for page in pages[1:]:
+        if page == last + 1 and page - first < max_pages:
+            last = page
+        else:
+            ranges.append((first, last))
+            first = last = page
+    ranges.append((first, last))
+    return ranges
+
+
+def _render_pages(pdf_path: str, first_page: int, last_page: int, output_folder: str) -> List[str]:
+    """
+    Render a page range to image files at lower DPI for speed; returns their paths in order.
+    """
+    return convert_from_path(
+        pdf_path,
+        dpi=150,
+        first_page=first_page,
+        last_page=last_page,
+        output_folder=output_folder,
+        output_file=f"page-{first_page}-",
+        paths_only=True,
+    )
+
+
 def _ocr_one_page(image: Image.Image, page_num: int) -> List[TextElement]:
     """
     Perform OCR on a single page image and group words into lines.
@@ -6,11 +6,17 @@ Document summarization service.
 Generates concise summaries of documents for semantic search and document discovery.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from .summary_cache import LRUSemanticCache
 
 logger = logging.getLogger(__name__)
 
+# Texts shorter than this (stripped) are returned as-is instead of summarized
+MIN_SUMMARY_INPUT_CHARS = 100
+
 
 class SummarizationError(Exception):
     """Raised when summarization fails."""
@@ -26,20 +32,34 @@ class DocumentSummarizer:
     """
 
     def __init__(
-        self, llm_client: Optional[Any] = None, target_words: int = 500, temperature: float = 0.3
+        self,
+        llm_client: Optional[Any] = None,
+        target_words: int = 500,
+        temperature: float = 0.3,
+        cache: Optional[LRUSemanticCache] = None,
     ):
         """
         Initialize the summarizer.
 
         Args:
             llm_client: LLM client with a complete_chat(messages, temperature) method.
+                       Clients may also provide an async acomplete_chat() with the same
+                       signature, which is used by the async summarization methods.
                        If None, summarization will use fallback truncation only.
             target_words: Target summary length in words (default: 500)
             temperature: LLM temperature for generation (default: 0.3)
+            cache: Optional summary cache consulted before calling the LLM
         """
         self.target_words = target_words
         self.temperature = temperature
         self.llm_client = llm_client
+        self.cache = cache
+
+    @property
+    def cache_namespace(self) -> str:
+        """Cache namespace, so a model or length change never reuses stale summaries."""
+        model = getattr(self.llm_client, "model", None) or type(self.llm_client).__name__
+        return f"{model}:{self.target_words}:{self.temperature}"
 
     def summarize(self, text: str, filename: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -56,7 +76,7 @@ class DocumentSummarizer:
         Raises:
             SummarizationError: If summarization fails
         """
-        if not text or len(text.strip()) < 100:
+        if not text or len(text.strip()) < MIN_SUMMARY_INPUT_CHARS:
             logger.warning(f"Text too short to summarize: {len(text)} characters")
             return text.strip()
 
@@ -64,25 +84,175 @@ class DocumentSummarizer:
             logger.warning("No LLM client provided, using fallback truncation")
             return self._create_fallback_summary(text)
 
-        try:
-            # Truncate very long documents to save on API costs
-            max_input_length = 30000  # ~7500 tokens
-            if len(text) > max_input_length:
-                logger.info(
-                    f"Truncating long document from {len(text)} to {max_input_length} chars"
-                )
-                text = text[:max_input_length] + "\n\n[Document truncated for summarization]"
+        text = self._truncate_input(text)
+        cached = self._get_cached(text, filename)
+        if cached is not None:
+            return cached
 
+        try:
             prompt = self._build_prompt(text, filename)
             summary = self._call_llm(prompt)
 
             logger.info(f"Generated summary for {filename}: {len(summary)} characters")
+            self._set_cached(text, summary)
             return summary
 
         except Exception as e:
             logger.error(f"Error summarizing document: {e}")
             raise SummarizationError(f"Failed to generate summary: {str(e)}")
 
+    async def asummarize(
+        self, text: str, filename: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Async variant of summarize().
+
+        Awaits the client's acomplete_chat() when available; otherwise the
+        blocking complete_chat() call runs in a worker thread.
+
+        Args:
+            text: Full document text
+            filename: Name of the file being summarized
+            metadata: Optional extraction metadata
+
+        Returns:
+            Summary text (approximately target_words length)
+
+        Raises:
+            SummarizationError: If summarization fails
+        """
+        if not text or len(text.strip()) < MIN_SUMMARY_INPUT_CHARS:
+            logger.warning(f"Text too short to summarize: {len(text)} characters")
+            return text.strip()
+
+        if not self.llm_client:
+            logger.warning("No LLM client provided, using fallback truncation")
+            return self._create_fallback_summary(text)
+
+        text = self._truncate_input(text)
+        # Cache lookups hit SQLite and may embed the text, so keep them off the loop
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self._get_cached, text, filename)
+            if cached is not None:
+                return cached
+
+        try:
+            prompt = self._build_prompt(text, filename)
+            summary = await self._acall_llm(prompt)
+
+            logger.info(f"Generated summary for {filename}: {len(summary)} characters")
+            if self.cache is not None:
+                await asyncio.to_thread(self._set_cached, text, summary)
+            return summary
+
+        except Exception as e:
+            logger.error(f"Error summarizing document: {e}")
+            raise SummarizationError(f"Failed to generate summary: {str(e)}")
+
+    def summarize_batch(
+        self,
+        texts: List[str],
+        filenames: List[str],
+        use_fallback: bool = True,
+        on_summary: Optional[Callable[[str, str], None]] = None,
+    ) -> List[str]:
+        """
+        Summarize several documents with a single complete_chat_batch() call.
+
+        The LLM client must provide complete_chat_batch(batch_messages, temperature),
+        returning one {"content": ...} response per message list. Short texts and
+        cached summaries are resolved locally and never sent.
+
+        Args:
+            texts: Full document texts
+            filenames: File names, one per text
+            use_fallback: Use fallback truncation for documents whose summary fails
+            on_summary: Optional callback receiving (text, summary) for each
+                        summary newly generated by the LLM
+
+        Returns:
+            Summaries in the same order as texts
+
+        Raises:
+            SummarizationError: If summarization fails and use_fallback is False
+        """
+        summaries: Dict[int, str] = {}
+        pending = []  # (index, original text, truncated text, filename)
+
+        for i, (text, filename) in enumerate(zip(texts, filenames)):
+            if not text or len(text.strip()) < MIN_SUMMARY_INPUT_CHARS or not self.llm_client:
+                summaries[i] = self.summarize(text, filename)
+                continue
+
+            truncated = self._truncate_input(text)
+            cached = self._get_cached(truncated, filename)
+            if cached is not None:
+                summaries[i] = cached
+            else:
+                pending.append((i, text, truncated, filename))
+
+        if not pending:
+            return [summaries[i] for i in range(len(texts))]
+
+        batch_messages = [
+            self._build_messages(self._build_prompt(truncated, filename))
+            for _, _, truncated, filename in pending
+        ]
+        try:
+            responses = self.llm_client.complete_chat_batch(
+                batch_messages, temperature=self.temperature
+            )
+            if len(responses) != len(batch_messages):
+                raise SummarizationError(
+                    f"Expected {len(batch_messages)} responses, got {len(responses)}"
+                )
+        except Exception as e:
+            logger.error(f"Batch LLM call failed: {e}")
+            if not use_fallback:
+                raise SummarizationError(f"Batch LLM call failed: {str(e)}")
+            responses = [{}] * len(pending)
+
+        for (i, text, truncated, filename), response in zip(pending, responses):
+            try:
+                summary = self._parse_response(response)
+            except SummarizationError as e:
+                if not use_fallback:
+                    raise
+                logger.warning(f"Summarization failed for {filename}, using fallback: {e}")
+                summaries[i] = self._create_fallback_summary(text)
+                continue
+
+            logger.info(f"Generated summary for {filename}: {len(summary)} characters")
+            self._set_cached(truncated, summary)
+            if on_summary is not None:
+                on_summary(text, summary)
+            summaries[i] = summary
+
+        return [summaries[i] for i in range(len(texts))]
+
+    def _truncate_input(self, text: str) -> str:
+        """Truncate very long documents to save on API costs."""
+        max_input_length = 30000  # ~7500 tokens
+        if len(text) > max_input_length:
+            logger.info(f"Truncating long document from {len(text)} to {max_input_length} chars")
+            text = text[:max_input_length] + "\n\n[Document truncated for summarization]"
+        return text
+
+    def _get_cached(self, text: str, filename: str) -> Optional[str]:
+        """Return a cached summary for the text, if any."""
+        if self.cache is None:
+            return None
+
+        summary = self.cache.get(text, self.cache_namespace)
+        if summary is not None:
+            logger.info(f"Using cached summary for {filename}")
+        return summary
+
+    def _set_cached(self, text: str, summary: str) -> None:
+        """Store a generated summary in the cache."""
+        if self.cache is not None:
+            self.cache.set(text, self.cache_namespace, summary)
+
     def _build_prompt(self, text: str, filename: str) -> str:
         """Build the prompt for the LLM."""
         return (
@@ -105,9 +275,9 @@ Content:
 Generate a {self.target_words}-word summary:"""
         )
 
-    def _call_llm(self, prompt: str) -> str:
-        """Call the LLM to generate summary."""
-        messages = [
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Build the chat messages for the LLM."""
+        return [
             {
                 "role": "system",
                 "content": (
@@ -118,6 +288,19 @@ Generate a {self.target_words}-word summary:"""
             {"role": "user", "content": prompt},
         ]
 
+    def _parse_response(self, response: Dict[str, Any]) -> str:
+        """Extract the summary text from an LLM response."""
+        summary = response.get("content", "").strip()
+
+        if not summary:
+            raise SummarizationError("LLM returned empty summary")
+
+        return summary
+
+    def _call_llm(self, prompt: str) -> str:
+        """Call the LLM to generate summary."""
+        messages = self._build_messages(prompt)
+
         try:
             # Call the LLM client
             # Expects a method like: complete_chat(messages=..., temperature=...)
@@ -126,12 +309,24 @@ Generate a {self.target_words}-word summary:"""
                 messages=messages, temperature=self.temperature
             )
 
-            summary = response.get("content", "").strip()
+            return self._parse_response(response)
+
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}")
+            raise SummarizationError(f"LLM call failed: {str(e)}")
+
+    async def _acall_llm(self, prompt: str) -> str:
+        """Call the LLM asynchronously to generate summary."""
+        acomplete_chat = getattr(self.llm_client, "acomplete_chat", None)
+        if acomplete_chat is None:
+            # Sync-only client: keep the event loop free while it blocks
+            return await asyncio.to_thread(self._call_llm, prompt)
 
-            if not summary:
-                raise SummarizationError("LLM returned empty summary")
+        messages = self._build_messages(prompt)
 
-            return summary
+        try:
+            response = await acomplete_chat(messages=messages, temperature=self.temperature)
+            return self._parse_response(response)
 
         except Exception as e:
             logger.error(f"LLM call failed: {e}")
@@ -159,6 +354,26 @@ Generate a {self.target_words}-word summary:"""
             logger.warning(f"Summarization failed, using fallback: {e}")
             return self._create_fallback_summary(text)
 
+    async def asummarize_with_fallback(
+        self, text: str, filename: str, metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Async variant of summarize_with_fallback().
+
+        Args:
+            text: Full document text
+            filename: Name of the file
+            metadata: Optional extraction metadata
+
+        Returns:
+            Summary text or truncated preview
+        """
+        try:
+            return await self.asummarize(text, filename, metadata)
+        except SummarizationError as e:
+            logger.warning(f"Summarization failed, using fallback: {e}")
+            return self._create_fallback_summary(text)
+
     def _create_fallback_summary(self, text: str) -> str:
         """Create a simple truncated preview as fallback."""
         # Take first ~2000 characters (approximately 500 words)
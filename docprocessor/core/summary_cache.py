@@ -0,0 +1,397 @@
+# docprocessor/core/summary_cache.py
+
+"""
+Summary cache for document summarization.
+
+Stores generated summaries in SQLite with an in-memory LRU front tier, so
+repeated documents skip the LLM call entirely. Lookups first try an exact hash
+of the normalized text; when an embedder is configured, near-duplicate texts
+are matched by cosine similarity against the stored embeddings.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], Sequence[float]]
+
+# Rows of the int8 matrix dequantized per BLAS call, bounding the float32 scratch space
+_QUANTIZED_TILE_ROWS = 4096
+
+
+@lru_cache(maxsize=None)
+def load_embedding_model(model_name: str) -> Any:
+    """
+    Load a sentence-transformers model, once per process.
+
+    Args:
+        model_name: Model name, e.g. 'sentence-transformers/all-MiniLM-L6-v2'
+
+    Returns:
+        SentenceTransformer instance
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        raise ImportError(
+            "sentence-transformers not installed. "
+            "Install with: pip install sentence-transformers"
+        )
+
+    return SentenceTransformer(model_name)
+
+
+class _EmbeddingMatrix:
+    """
+    Row-normalized embeddings of one namespace in a preallocated, growable buffer.
+
+    Rows are addressed through a key -> row dict, and the buffer doubles in
+    capacity when full, so inserts are amortized O(1) instead of copying the
+    whole matrix each time.
+    """
+
+    def __init__(self, dim: int, dtype: Any, quantized: bool, capacity: int = 16):
+        self.dim = dim
+        self.keys: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self._data = np.empty((capacity, dim), dtype=dtype)
+        self._scales = np.empty(capacity, dtype=np.float32) if quantized else None
+
+    @classmethod
+    def from_rows(
+        cls, keys: List[str], matrix: np.ndarray, scales: Optional[np.ndarray] = None
+    ) -> "_EmbeddingMatrix":
+        """Build from already normalized (and possibly quantized) rows."""
+        count, dim = matrix.shape
+        embeddings = cls(dim, matrix.dtype, scales is not None, capacity=max(count, 16))
+        embeddings._data[:count] = matrix
+        if scales is not None:
+            embeddings._scales[:count] = scales
+        embeddings.keys = list(keys)
+        embeddings.rows = {key: index for index, key in enumerate(keys)}
+        return embeddings
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the filled rows."""
+        return self._data[: len(self.keys)]
+
+    @property
+    def scales(self) -> Optional[np.ndarray]:
+        """View of the int8 row scales, or None for a float32 matrix."""
+        return None if self._scales is None else self._scales[: len(self.keys)]
+
+    def put(self, key: str, row: np.ndarray, scale: Optional[float] = None) -> None:
+        """Insert or replace the row of a key."""
+        index = self.rows.get(key)
+        if index is None:
+            index = len(self.keys)
+            if index == self._data.shape[0]:
+                self._grow()
+            self.keys.append(key)
+            self.rows[key] = index
+
+        self._data[index] = row
+        if self._scales is not None:
+            self._scales[index] = scale
+
+    def _grow(self) -> None:
+        """Double the buffer capacity, copying the filled rows once."""
+        count = len(self.keys)
+        data = np.empty((max(2 * count, 16), self.dim), dtype=self._data.dtype)
+        data[:count] = self._data[:count]
+        self._data = data
+        if self._scales is not None:
+            scales = np.empty(data.shape[0], dtype=np.float32)
+            scales[:count] = self._scales[:count]
+            self._scales = scales
+
+
+class LRUSemanticCache:
+    """
+    Two-tier cache for LLM summaries.
+
+    Exact matches are served from an in-memory LRU dict backed by SQLite.
+    On an exact miss, the text embedding is compared against all stored
+    embeddings of the same namespace and the closest summary is returned if
+    its cosine similarity reaches the threshold.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        maxsize: int = 256,
+        similarity_threshold: float = 0.95,
+        embedder: Optional[Embedder] = None,
+        embedding_model: Optional[str] = None,
+        quantize: bool = False,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database path (default: in-memory)
+            maxsize: Number of summaries kept in the in-memory tier (default: 256)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+                (default: 0.95)
+            embedder: Optional callable mapping text to an embedding vector.
+                      If None and no embedding_model is given, only exact
+                      matches are served.
+            embedding_model: Optional sentence-transformers model name used to
+                             build the embedder
+            quantize: Keep in-memory embeddings as int8 with a per-vector scale,
+                      a quarter of the float32 footprint (default: False)
+        """
+        self.path = path
+        self.maxsize = maxsize
+        self.similarity_threshold = similarity_threshold
+        self.quantize = quantize
+
+        if embedder is None and embedding_model:
+            embedder = load_embedding_model(embedding_model).encode
+        self.embedder = embedder
+
+        self.hits = 0
+        self.misses = 0
+
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        # namespace -> row-normalized embeddings (int8 with row scales when quantized)
+        self._matrices: Dict[str, _EmbeddingMatrix] = {}
+        # Embeddings computed on a miss, reused when the summary is stored; bounded
+        # like the memory tier, since a miss is not always followed by set()
+        self._pending: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS summaries ("
+            "key TEXT PRIMARY KEY, namespace TEXT NOT NULL, embedding BLOB, summary TEXT NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_summaries_namespace ON summaries(namespace)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def make_key(text: str, namespace: str) -> str:
+        """Build the exact-match key for a text within a namespace."""
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{namespace}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, text: str, namespace: str) -> Optional[str]:
+        """
+        Look up a cached summary.
+
+        Args:
+            text: Text that would be summarized
+            namespace: Cache namespace (e.g. model and summary length)
+
+        Returns:
+            Cached summary, or None on a miss
+        """
+        key = self.make_key(text, namespace)
+
+        with self._lock:
+            summary = self._get_exact(key)
+
+        if summary is None and self.embedder is not None:
+            vector = self._embed(text)
+            with self._lock:
+                summary = self._get_similar(vector, namespace)
+                if summary is None:
+                    self._pending[key] = vector
+                    self._pending.move_to_end(key)
+                    if len(self._pending) > self.maxsize:
+                        self._pending.popitem(last=False)
+
+        with self._lock:
+            if summary is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return summary
+
+    def set(self, text: str, namespace: str, summary: str) -> None:
+        """
+        Store a summary.
+
+        Args:
+            text: Text that was summarized
+            namespace: Cache namespace (e.g. model and summary length)
+            summary: Generated summary
+        """
+        key = self.make_key(text, namespace)
+
+        vector = None
+        if self.embedder is not None:
+            with self._lock:
+                vector = self._pending.pop(key, None)
+            if vector is None:
+                vector = self._embed(text)
+
+        with self._lock:
+            if vector is not None:
+                dim = self._namespace_dim(namespace)
+                if dim is not None and dim != vector.shape[0]:
+                    logger.warning(
+                        f"Embedding has {vector.shape[0]} dimensions, expected {dim}; "
+                        "storing the summary for exact matches only"
+                    )
+                    vector = None
+
+            self._db.execute(
+                "INSERT OR REPLACE INTO summaries (key, namespace, embedding, summary) "
+                "VALUES (?, ?, ?, ?)",
+                (key, namespace, None if vector is None else vector.tobytes(), summary),
+            )
+            self._db.commit()
+            self._remember(key, summary)
+
+            if vector is not None and namespace in self._matrices:
+                self._put_row(self._matrices[namespace], key, vector)
+
+    def clear(self) -> None:
+        """Remove all cached summaries."""
+        with self._lock:
+            self._db.execute("DELETE FROM summaries")
+            self._db.commit()
+            self._memory.clear()
+            self._matrices.clear()
+            self._pending.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._db.close()
+
+    def _embed(self, text: str) -> np.ndarray:
+        """Compute a unit-length float32 embedding."""
+        vector = np.asarray(self.embedder(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _quantize(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Quantize rows to int8 with a per-row scale (row ~= int8_row * scale)."""
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.rint(matrix / scales[:, np.newaxis]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+    @staticmethod
+    def _quantized_similarities(
+        matrix: np.ndarray, scales: np.ndarray, vector: np.ndarray
+    ) -> np.ndarray:
+        """Cosine similarities against an int8 matrix, dequantizing one tile at a time."""
+        similarities = np.empty(matrix.shape[0], dtype=np.float32)
+        for start in range(0, matrix.shape[0], _QUANTIZED_TILE_ROWS):
+            tile = matrix[start : start + _QUANTIZED_TILE_ROWS]
+            similarities[start : start + len(tile)] = tile.astype(np.float32) @ vector
+        return similarities * scales
+
+    def _remember(self, key: str, summary: str) -> None:
+        """Insert into the in-memory LRU tier."""
+        self._memory[key] = summary
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _get_exact(self, key: str) -> Optional[str]:
+        """Exact lookup: memory first, then SQLite."""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        row = self._db.execute("SELECT summary FROM summaries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        self._remember(key, row[0])
+        return row[0]
+
+    def _get_similar(self, vector: np.ndarray, namespace: str) -> Optional[str]:
+        """Semantic lookup against the stored embeddings of a namespace."""
+        embeddings = self._load_matrix(namespace, vector.shape[0])
+        if not len(embeddings):
+            return None
+        if embeddings.dim != vector.shape[0]:
+            logger.warning(
+                f"Embedding has {vector.shape[0]} dimensions, expected {embeddings.dim}; "
+                "skipping semantic lookup"
+            )
+            return None
+
+        if embeddings.scales is None:
+            similarities = embeddings.matrix @ vector
+        else:
+            similarities = self._quantized_similarities(
+                embeddings.matrix, embeddings.scales, vector
+            )
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+
+        logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+        return self._get_exact(embeddings.keys[best])
+
+    def _namespace_dim(self, namespace: str) -> Optional[int]:
+        """Embedding dimension already used in a namespace, if any."""
+        if namespace in self._matrices and len(self._matrices[namespace]):
+            return self._matrices[namespace].dim
+
+        row = self._db.execute(
+            "SELECT length(embedding) FROM summaries "
+            "WHERE namespace = ? AND embedding IS NOT NULL LIMIT 1",
+            (namespace,),
+        ).fetchone()
+        return None if row is None else row[0] // np.dtype(np.float32).itemsize
+
+    def _put_row(self, embeddings: _EmbeddingMatrix, key: str, vector: np.ndarray) -> None:
+        """Insert a unit-length float32 embedding, quantizing it if configured."""
+        if embeddings.scales is None:
+            embeddings.put(key, vector)
+        else:
+            row, scale = self._quantize(vector[np.newaxis, :])
+            embeddings.put(key, row[0], float(scale[0]))
+
+    def _load_matrix(self, namespace: str, dim: int) -> _EmbeddingMatrix:
+        """Load (once) the embeddings of a namespace from SQLite."""
+        if namespace not in self._matrices:
+            rows = self._db.execute(
+                "SELECT key, embedding FROM summaries "
+                "WHERE namespace = ? AND embedding IS NOT NULL",
+                (namespace,),
+            ).fetchall()
+            if rows:
+                dim = len(rows[0][1]) // np.dtype(np.float32).itemsize
+            # Rows of another dimension (e.g. from a replaced embedder) can't be compared
+            rows = [row for row in rows if len(row[1]) == dim * np.dtype(np.float32).itemsize]
+
+            matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32)
+            matrix = matrix.reshape(len(rows), dim)
+            scales = None
+            if self.quantize:
+                matrix, scales = self._quantize(matrix)
+            embeddings = _EmbeddingMatrix.from_rows([row[0] for row in rows], matrix, scales)
+            self._matrices[namespace] = embeddings
+
+        return self._matrices[namespace]
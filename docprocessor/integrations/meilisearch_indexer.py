@@ -4,12 +4,35 @@
 Meilisearch integration for document indexing.
 """
 
+import json
 import logging
 from typing import Any, Dict, List, Optional
 
+from ..core.chunker import ChunkBatch
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(documents: List[Dict[str, Any]]) -> bytes:
+    """Serialize documents to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(documents, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    return json.dumps(documents, ensure_ascii=False, default=_json_default).encode("utf-8")
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize numpy values for the stdlib json fallback."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class MeiliSearchIndexer:
     """
     Simplified Meilisearch indexer for document chunks.
@@ -31,7 +54,8 @@ class MeiliSearchIndexer:
             url: Meilisearch server URL
             api_key: Meilisearch API key
             index_prefix: Optional prefix for index names (e.g., 'dev_', 'prod_')
-            client: Optional pre-configured Meilisearch client (for testing)
+            client: Optional pre-configured Meilisearch client, e.g. to share one
+                    client between indexers with different prefixes (or for testing)
         """
         self.url = url
         self.api_key = api_key
@@ -58,25 +82,47 @@ class MeiliSearchIndexer:
         """Alias for backward compatibility."""
         return self._get_prefixed_index_name(base_name)
 
+    def is_healthy(self) -> bool:
+        """
+        Check whether the Meilisearch server is reachable and available.
+
+        Returns:
+            True if the server reports itself healthy, False otherwise
+        """
+        try:
+            return bool(self.client.is_healthy())
+        except Exception as e:
+            logger.warning(f"Meilisearch health check failed: {e}")
+            return False
+
     def index_chunks(
-        self, chunks: List[Dict[str, Any]], index_name: str, primary_key: str = "id"
+        self,
+        chunks: List[Dict[str, Any]] | ChunkBatch,
+        index_name: str,
+        primary_key: str = "id",
     ) -> Dict[str, Any]:
         """
         Index document chunks to Meilisearch.
 
         Args:
-            chunks: List of chunk dictionaries to index
+            chunks: List of chunk dictionaries, or a ChunkBatch, to index
             index_name: Name of the index (without prefix)
             primary_key: Primary key field name (default: 'id')
 
         Returns:
             Meilisearch task info
         """
+        if isinstance(chunks, ChunkBatch):
+            chunks = chunks.to_search_documents()
+
         full_index_name = self._get_index_name(index_name)
         index = self.client.index(full_index_name)
 
         try:
-            result = index.add_documents(chunks, primary_key=primary_key)
+            # Send pre-serialized bytes so the client does not re-encode with stdlib json
+            result = index.add_documents_raw(
+                _dumps(chunks), primary_key=primary_key, content_type="application/json"
+            )
             logger.info(f"Indexed {len(chunks)} chunks to {full_index_name}")
             return result
         except Exception as e:
@@ -97,7 +143,26 @@ class MeiliSearchIndexer:
         Returns:
             Meilisearch task info
         """
-        return self.index_chunks([document], index_name, primary_key)
+        return self.index_documents([document], index_name, primary_key)
+
+    def index_documents(
+        self, documents: List[Dict[str, Any]], index_name: str, primary_key: str = "id"
+    ) -> Dict[str, Any]:
+        """
+        Index several documents to Meilisearch in one request.
+
+        Prefer this over repeated index_document() calls: Meilisearch handles
+        one large batch much faster than many single-document tasks.
+
+        Args:
+            documents: List of document dictionaries to index
+            index_name: Name of the index (without prefix)
+            primary_key: Primary key field name (default: 'id')
+
+        Returns:
+            Meilisearch task info
+        """
+        return self.index_chunks(documents, index_name, primary_key)
 
     def search(
         self, query: str, index_name: str, filters: Optional[str] = None, limit: int = 20
@@ -123,6 +188,50 @@ class MeiliSearchIndexer:
 
         return index.search(query, search_params)
 
+    def hybrid_search(
+        self,
+        query: str,
+        index_name: str,
+        k: int = 5,
+        semantic_ratio: float = 0.5,
+        embedder: str = "default",
+        filters: Optional[str] = None,
+        vector: Optional[List[float]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Search an index combining keyword ranking and embedding similarity.
+
+        Uses Meilisearch's native hybrid search; each hit carries its
+        combined `_rankingScore` (0.0 to 1.0).
+
+        Args:
+            query: Search query
+            index_name: Name of the index (without prefix)
+            k: Maximum number of results (default: 5)
+            semantic_ratio: Weight of the semantic score, 0.0 = keyword only,
+                            1.0 = embedding only (default: 0.5)
+            embedder: Name of the Meilisearch embedder (default: 'default')
+            filters: Optional Meilisearch filter string
+            vector: Optional pre-computed query embedding
+
+        Returns:
+            Search results
+        """
+        full_index_name = self._get_index_name(index_name)
+        index = self.client.index(full_index_name)
+
+        search_params: Dict[str, Any] = {
+            "limit": k,
+            "hybrid": {"semanticRatio": semantic_ratio, "embedder": embedder},
+            "showRankingScore": True,
+        }
+        if filters:
+            search_params["filter"] = filters
+        if vector is not None:
+            search_params["vector"] = vector
+
+        return index.search(query, search_params)
+
     def delete_document(self, document_id: str, index_name: str) -> Dict[str, Any]:
         """
         Delete a document from an index.
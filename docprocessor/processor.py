@@ -6,28 +6,48 @@ Main DocumentProcessor API.
 Provides a simple interface for document processing operations.
 """
 
+import asyncio
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 
-from .core.chunker import DocumentChunk, DocumentChunker
+from .core.chunker import ChunkStats, DocumentChunk, DocumentChunker
+from .core.extraction_cache import ExtractionCache
 from .core.extractor import ContentExtractionError, ContentExtractor
-from .core.summarizer import DocumentSummarizer
+from .core.summarizer import MIN_SUMMARY_INPUT_CHARS, DocumentSummarizer, SummarizationError
+from .core.summary_cache import LRUSemanticCache
+from .integrations.meilisearch_indexer import MeiliSearchIndexer
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight LLM requests for batch summarization
+DEFAULT_LLM_CONCURRENCY = 50
+
+# Characters of a text (half from the start, half from the end) used as the
+# hybrid search query and indexed source for summary reuse
+SUMMARY_QUERY_CHARS = 1000
+
+# Maximum relative length difference between a text and a reused summary's source
+SUMMARY_REUSE_LENGTH_TOLERANCE = 0.1
+
 
 @dataclass
 class ProcessResult:
     """Result of document processing."""
 
     text: str = ""  # Add default empty string
-    chunks: List[DocumentChunk] = field(default_factory=list)
+    chunks: List[DocumentChunk] | Iterator[DocumentChunk] = field(default_factory=list)
     summary: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     page_count: int = 1
     chunk_count: int = 0
+    stats: ChunkStats = field(default_factory=ChunkStats)
+    status: str = "success"  # "error" when batch processing of this file failed
+    error: Optional[str] = None
 
 
 class DocumentProcessor:
@@ -46,6 +66,13 @@ class DocumentProcessor:
         summary_target_words: int = 500,
         llm_client: Optional[Any] = None,
         llm_temperature: float = 0.3,
+        summary_cache: Optional[LRUSemanticCache] = None,
+        embedding_client: Optional[Any] = None,
+        extraction_cache: bool = False,
+        cache_dir: Optional[str | Path] = None,
+        summary_indexer: Optional[MeiliSearchIndexer] = None,
+        summary_index_name: str = "document_summaries",
+        summary_reuse_threshold: float = 0.9,
     ):
         """
         Initialize the document processor.
@@ -58,14 +85,39 @@ class DocumentProcessor:
             summary_target_words: Target summary length (default: 500)
             llm_client: Optional LLM client for summarization
             llm_temperature: Temperature for LLM summarization (default: 0.3)
+            summary_cache: Optional cache of previously generated summaries
+            embedding_client: Optional embedding client with an
+                              embed(texts) -> List[List[float]] method
+            extraction_cache: Cache extracted text on disk so unchanged files
+                              are not extracted again (default: False)
+            cache_dir: Directory for the extraction cache
+                       (default: ~/.cache/docprocessor/extractions)
+            summary_indexer: Optional Meilisearch indexer used by the summarize
+                             methods to reuse stored summaries of near-duplicate texts
+            summary_index_name: Index holding reusable summaries; needs a hybrid
+                                embedder and `summary_namespace` as a filterable
+                                attribute (default: 'document_summaries')
+            summary_reuse_threshold: Minimum hybrid ranking score of the best match
+                                     for reusing its summary; the match's source must
+                                     also be within 10% of the text's length
+                                     (default: 0.9)
         """
-        self.extractor = ContentExtractor()
+        self.extractor = ContentExtractor(
+            cache=ExtractionCache(cache_dir) if extraction_cache else None
+        )
         self.chunker = DocumentChunker(
             chunk_size=chunk_size, chunk_overlap=chunk_overlap, min_chunk_size=min_chunk_size
         )
         self.summarizer = DocumentSummarizer(
-            llm_client=llm_client, target_words=summary_target_words, temperature=llm_temperature
+            llm_client=llm_client,
+            target_words=summary_target_words,
+            temperature=llm_temperature,
+            cache=summary_cache,
         )
+        self.embedding_client = embedding_client
+        self.summary_indexer = summary_indexer
+        self.summary_index_name = summary_index_name
+        self.summary_reuse_threshold = summary_reuse_threshold
         self.ocr_enabled = ocr_enabled
 
     def process(
@@ -78,6 +130,7 @@ class DocumentProcessor:
         output_id: Optional[str] = None,
         project_id: Optional[int] = None,
         extraction_metadata: Optional[Dict[str, Any]] = None,
+        streaming: bool = False,
     ) -> ProcessResult:
         """
         Process a document with extraction, chunking, and optional summarization.
@@ -91,6 +144,10 @@ class DocumentProcessor:
             output_id: Optional output identifier for chunks
             project_id: Optional project identifier for chunks
             extraction_metadata: Optional metadata to attach to chunks
+            streaming: Return result.chunks as a lazy iterator instead of a list,
+                       e.g. for embed_and_index(); chunk_count stays 0 and
+                       result.stats fills in as the iterator is consumed
+                       (default: False)
 
         Returns:
             ProcessResult with text, chunks, summary, and metadata
@@ -110,25 +167,109 @@ class DocumentProcessor:
                 logger.error(f"Text extraction failed: {e}")
                 raise
 
+        self._chunk_and_summarize(
+            result,
+            filename=file_path.name,
+            chunk=chunk,
+            summarize=summarize,
+            file_id=file_id or str(file_path),
+            output_id=output_id,
+            project_id=project_id,
+            extraction_metadata=extraction_metadata,
+            streaming=streaming,
+        )
+        return result
+
+    def process_text(
+        self,
+        text: str,
+        filename: str = "document.txt",
+        chunk: bool = True,
+        summarize: bool = False,
+        file_id: Optional[str] = None,
+        output_id: Optional[str] = None,
+        project_id: Optional[int] = None,
+        extraction_metadata: Optional[Dict[str, Any]] = None,
+        streaming: bool = False,
+    ) -> ProcessResult:
+        """
+        Process text that is already in memory, skipping file extraction.
+
+        Same as process(), but avoids writing the text to a file only to read
+        it back.
+
+        Args:
+            text: Document text
+            filename: Name recorded on chunks and used in summary prompts
+            chunk: Chunk the text (default: True)
+            summarize: Generate a summary (default: False, requires llm_client)
+            file_id: Optional file identifier for chunks (default: filename)
+            output_id: Optional output identifier for chunks
+            project_id: Optional project identifier for chunks
+            extraction_metadata: Optional metadata to attach to chunks
+            streaming: Return result.chunks as a lazy iterator instead of a list
+
+        Returns:
+            ProcessResult with text, chunks, summary, and metadata
+        """
+        result = ProcessResult(text=text)
+        self._chunk_and_summarize(
+            result,
+            filename=filename,
+            chunk=chunk,
+            summarize=summarize,
+            file_id=file_id,
+            output_id=output_id,
+            project_id=project_id,
+            extraction_metadata=extraction_metadata,
+            streaming=streaming,
+        )
+        return result
+
+    def _chunk_and_summarize(
+        self,
+        result: ProcessResult,
+        filename: str,
+        chunk: bool,
+        summarize: bool,
+        file_id: Optional[str],
+        output_id: Optional[str],
+        project_id: Optional[int],
+        extraction_metadata: Optional[Dict[str, Any]],
+        streaming: bool,
+    ) -> None:
+        """Chunk and optionally summarize result.text, filling in result."""
         # Chunk text
         if chunk and result.text:
             try:
                 # Generate IDs if not provided
-                file_id = file_id or str(file_path)
+                file_id = file_id or filename
                 output_id = output_id or "unknown"
                 project_id = project_id or 0
 
-                chunks = self.chunker.chunk_document(
-                    text=result.text,
-                    file_id=file_id,
-                    output_id=output_id,
-                    project_id=project_id,
-                    filename=file_path.name,
-                    extraction_metadata=extraction_metadata or result.metadata,
-                )
-                result.chunks = chunks
-                result.chunk_count = len(chunks)
-                logger.info(f"Created {len(chunks)} chunks from {file_path.name}")
+                if streaming:
+                    result.chunks = self.chunker.iter_chunks(
+                        text=result.text,
+                        file_id=file_id,
+                        output_id=output_id,
+                        project_id=project_id,
+                        filename=filename,
+                        extraction_metadata=extraction_metadata or result.metadata,
+                        stats=result.stats,
+                    )
+                else:
+                    chunks = self.chunker.chunk_document(
+                        text=result.text,
+                        file_id=file_id,
+                        output_id=output_id,
+                        project_id=project_id,
+                        filename=filename,
+                        extraction_metadata=extraction_metadata or result.metadata,
+                        stats=result.stats,
+                    )
+                    result.chunks = chunks
+                    result.chunk_count = len(chunks)
+                    logger.info(f"Created {len(chunks)} chunks from {filename}")
             except Exception as e:
                 logger.error(f"Chunking failed: {e}")
                 raise
@@ -137,15 +278,20 @@ class DocumentProcessor:
         if summarize and result.text:
             try:
                 summary = self.summarizer.summarize_with_fallback(
-                    text=result.text, filename=file_path.name, metadata=result.metadata
+                    text=result.text, filename=filename, metadata=result.metadata
                 )
                 result.summary = summary
-                logger.info(f"Generated summary for {file_path.name}")
+                logger.info(f"Generated summary for {filename}")
             except Exception as e:
                 logger.warning(f"Summarization failed, using fallback: {e}")
                 result.summary = self.summarizer._create_fallback_summary(result.text)
 
-        return result
+    @property
+    def summary_cache_hit_rate(self) -> Optional[float]:
+        """Fraction of summary lookups served by summary_cache, or None without one."""
+        if self.summarizer.cache is None:
+            return None
+        return self.summarizer.cache.hit_rate
 
     def extract_text(self, file_path: str | Path) -> Dict[str, Any]:
         """
@@ -197,6 +343,10 @@ class DocumentProcessor:
         """
         Generate a summary of text.
 
+        With a summary_indexer configured, the stored summary of a near-duplicate
+        text is returned instead of calling the LLM, and new LLM summaries are
+        indexed for later reuse.
+
         Args:
             text: Text to summarize
             filename: Name of the file
@@ -205,10 +355,483 @@ class DocumentProcessor:
         Returns:
             Summary text
         """
-        if use_fallback:
-            return self.summarizer.summarize_with_fallback(text, filename)
-        else:
-            return self.summarizer.summarize(text, filename)
+        reuse = self._reuses_summary(text)
+        if reuse:
+            reused = self._find_indexed_summary(text)
+            if reused is not None:
+                return reused
+
+        try:
+            summary = self.summarizer.summarize(text, filename)
+        except SummarizationError as e:
+            if not use_fallback:
+                raise
+            logger.warning(f"Summarization failed, using fallback: {e}")
+            return self.summarizer._create_fallback_summary(text)
+
+        if reuse:
+            self._index_summary(text, summary)
+
+        return summary
+
+    def _summary_namespace_filter(self) -> str:
+        """Filter restricting reuse to summaries from the same model and length."""
+        namespace = self.summarizer.cache_namespace.replace('"', '\\"')
+        return f'summary_namespace = "{namespace}"'
+
+    def _reuses_summary(self, text: str) -> bool:
+        """Whether text gets an LLM summary that may be looked up and indexed."""
+        return (
+            self.summary_indexer is not None
+            and self.summarizer.llm_client is not None
+            and len(text.strip()) >= MIN_SUMMARY_INPUT_CHARS
+        )
+
+    def _find_indexed_summary(self, text: str) -> Optional[str]:
+        """Return the stored summary of the best hybrid match, if it passes the guards."""
+        if self.summary_indexer is None:
+            return None
+
+        try:
+            results = self.summary_indexer.hybrid_search(
+                _summary_source(text),
+                self.summary_index_name,
+                k=1,
+                filters=self._summary_namespace_filter(),
+            )
+        except Exception as e:
+            logger.warning(f"Summary lookup failed: {e}")
+            return None
+
+        hits = results.get("hits", [])
+        if not hits:
+            return None
+
+        hit = hits[0]
+        score = hit.get("_rankingScore", 0.0)
+        if score < self.summary_reuse_threshold:
+            return None
+
+        # A shared header or footer can score high; the body length must match too
+        length = len(" ".join(text.split()))
+        source_length = hit.get("summary_source_length")
+        if source_length is None or abs(source_length - length) > (
+            SUMMARY_REUSE_LENGTH_TOLERANCE * max(length, source_length)
+        ):
+            return None
+
+        summary = hit.get("summary")
+        if not isinstance(summary, str):
+            return None
+
+        logger.info(f"Reusing indexed summary (score {score:.3f})")
+        return summary
+
+    def _index_summary(self, text: str, summary: str) -> None:
+        """Store a generated summary so near-duplicate texts can reuse it."""
+        if self.summary_indexer is None:
+            return
+
+        namespace = self.summarizer.cache_namespace
+        document = {
+            "id": LRUSemanticCache.make_key(text, namespace),
+            "summary_namespace": namespace,
+            "summary_source": _summary_source(text),
+            "summary_source_length": len(" ".join(text.split())),
+            "summary": summary,
+        }
+
+        try:
+            self.summary_indexer.index_document(document, self.summary_index_name)
+        except Exception as e:
+            logger.warning(f"Could not index summary for reuse: {e}")
+
+    def summarize_texts(
+        self,
+        texts: Sequence[str],
+        filenames: Optional[Sequence[str]] = None,
+        use_fallback: bool = True,
+        max_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+    ) -> List[str]:
+        """
+        Generate summaries for several texts with concurrent LLM requests.
+
+        Blocking wrapper around summarize_texts_async(); call that coroutine
+        directly when an event loop is already running.
+
+        Args:
+            texts: Texts to summarize
+            filenames: Optional file names, one per text
+            use_fallback: Use fallback truncation if LLM fails
+            max_concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            Summaries in the same order as texts
+        """
+        return asyncio.run(
+            self.summarize_texts_async(
+                texts, filenames, use_fallback=use_fallback, max_concurrency=max_concurrency
+            )
+        )
+
+    async def summarize_texts_async(
+        self,
+        texts: Sequence[str],
+        filenames: Optional[Sequence[str]] = None,
+        use_fallback: bool = True,
+        max_concurrency: int = DEFAULT_LLM_CONCURRENCY,
+    ) -> List[str]:
+        """
+        Generate summaries for several texts with concurrent LLM requests.
+
+        Reuses and indexes summaries through summary_indexer like summarize_text().
+
+        Args:
+            texts: Texts to summarize
+            filenames: Optional file names, one per text
+            use_fallback: Use fallback truncation if LLM fails
+            max_concurrency: Maximum number of in-flight LLM requests
+
+        Returns:
+            Summaries in the same order as texts
+        """
+        if filenames is None:
+            filenames = ["document.txt"] * len(texts)
+        elif len(filenames) != len(texts):
+            raise ValueError("filenames must have the same length as texts")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _summarize(text: str, filename: str) -> str:
+            async with semaphore:
+                reuse = self._reuses_summary(text)
+                if reuse:
+                    reused = await asyncio.to_thread(self._find_indexed_summary, text)
+                    if reused is not None:
+                        return reused
+
+                try:
+                    summary = await self.summarizer.asummarize(text, filename)
+                except SummarizationError as e:
+                    if not use_fallback:
+                        raise
+                    logger.warning(f"Summarization failed, using fallback: {e}")
+                    return self.summarizer._create_fallback_summary(text)
+
+                if reuse:
+                    await asyncio.to_thread(self._index_summary, text, summary)
+                return summary
+
+        summaries = await asyncio.gather(
+            *(_summarize(text, filename) for text, filename in zip(texts, filenames))
+        )
+        return list(summaries)
+
+    def summarize_batch(
+        self,
+        texts: Sequence[str],
+        filenames: Optional[Sequence[str]] = None,
+        use_fallback: bool = True,
+    ) -> List[str]:
+        """
+        Generate summaries for several texts in one LLM round-trip.
+
+        Uses the client's complete_chat_batch(batch_messages, temperature) when it
+        has one; otherwise falls back to concurrent requests via summarize_texts().
+        Reuses and indexes summaries through summary_indexer like summarize_text().
+
+        Args:
+            texts: Texts to summarize
+            filenames: Optional file names, one per text
+            use_fallback: Use fallback truncation if LLM fails
+
+        Returns:
+            Summaries in the same order as texts
+        """
+        if filenames is None:
+            filenames = ["document.txt"] * len(texts)
+        elif len(filenames) != len(texts):
+            raise ValueError("filenames must have the same length as texts")
+
+        if not hasattr(self.summarizer.llm_client, "complete_chat_batch"):
+            return self.summarize_texts(texts, filenames, use_fallback=use_fallback)
+
+        summaries: Dict[int, str] = {}
+        for i, text in enumerate(texts):
+            reused = self._find_indexed_summary(text) if self._reuses_summary(text) else None
+            if reused is not None:
+                summaries[i] = reused
+
+        pending = [i for i in range(len(texts)) if i not in summaries]
+        if pending:
+            generated = self.summarizer.summarize_batch(
+                [texts[i] for i in pending],
+                [filenames[i] for i in pending],
+                use_fallback=use_fallback,
+                on_summary=self._index_summary if self.summary_indexer is not None else None,
+            )
+            summaries.update(zip(pending, generated))
+
+        return [summaries[i] for i in range(len(texts))]
+
+    def process_many(
+        self,
+        file_paths: Sequence[str | Path],
+        extract_text: bool = True,
+        chunk: bool = True,
+        summarize: bool = False,
+        project_id: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[ProcessResult]:
+        """
+        Process several documents concurrently.
+
+        Blocking wrapper around process_many_async(); call that coroutine
+        directly when an event loop is already running.
+
+        Args:
+            file_paths: Paths to the document files
+            extract_text: Extract text from documents (default: True)
+            chunk: Chunk the extracted text (default: True)
+            summarize: Generate summaries (default: False, requires llm_client)
+            project_id: Optional project identifier for chunks
+            max_concurrency: Maximum number of documents processed at once
+                (default: 1.5x the CPU count)
+
+        Returns:
+            ProcessResult objects in the same order as file_paths
+        """
+        return asyncio.run(
+            self.process_many_async(
+                file_paths,
+                extract_text=extract_text,
+                chunk=chunk,
+                summarize=summarize,
+                project_id=project_id,
+                max_concurrency=max_concurrency,
+            )
+        )
+
+    async def process_many_async(
+        self,
+        file_paths: Sequence[str | Path],
+        extract_text: bool = True,
+        chunk: bool = True,
+        summarize: bool = False,
+        project_id: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[ProcessResult]:
+        """
+        Process several documents concurrently.
+
+        Each document runs through process() in a worker thread, so extraction
+        and OCR of one file overlap with the others.
+
+        Args:
+            file_paths: Paths to the document files
+            extract_text: Extract text from documents (default: True)
+            chunk: Chunk the extracted text (default: True)
+            summarize: Generate summaries (default: False, requires llm_client)
+            project_id: Optional project identifier for chunks
+            max_concurrency: Maximum number of documents processed at once
+                (default: 1.5x the CPU count)
+
+        Returns:
+            ProcessResult objects in the same order as file_paths
+        """
+        return await self._process_concurrently(
+            file_paths,
+            dict(
+                extract_text=extract_text, chunk=chunk, summarize=summarize, project_id=project_id
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    def process_batch(
+        self,
+        file_paths: Sequence[str | Path],
+        extract_text: bool = True,
+        chunk: bool = True,
+        summarize: bool = False,
+        project_id: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[ProcessResult]:
+        """
+        Process several documents concurrently, tolerating per-file failures.
+
+        Unlike process_many(), a failing file does not abort the batch: its
+        ProcessResult has status "error" and the error message set.
+
+        Args:
+            file_paths: Paths to the document files
+            extract_text: Extract text from documents (default: True)
+            chunk: Chunk the extracted text (default: True)
+            summarize: Generate summaries (default: False, requires llm_client)
+            project_id: Optional project identifier for chunks
+            max_concurrency: Maximum number of documents processed at once
+                (default: 1.5x the CPU count)
+            progress: Optional callback called as progress(done, total)
+                after each file
+
+        Returns:
+            ProcessResult objects in the same order as file_paths
+        """
+        return asyncio.run(
+            self.process_batch_async(
+                file_paths,
+                extract_text=extract_text,
+                chunk=chunk,
+                summarize=summarize,
+                project_id=project_id,
+                max_concurrency=max_concurrency,
+                progress=progress,
+            )
+        )
+
+    async def process_batch_async(
+        self,
+        file_paths: Sequence[str | Path],
+        extract_text: bool = True,
+        chunk: bool = True,
+        summarize: bool = False,
+        project_id: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[ProcessResult]:
+        """
+        Async variant of process_batch().
+
+        Args:
+            file_paths: Paths to the document files
+            extract_text: Extract text from documents (default: True)
+            chunk: Chunk the extracted text (default: True)
+            summarize: Generate summaries (default: False, requires llm_client)
+            project_id: Optional project identifier for chunks
+            max_concurrency: Maximum number of documents processed at once
+                (default: 1.5x the CPU count)
+            progress: Optional callback called as progress(done, total)
+                after each file
+
+        Returns:
+            ProcessResult objects in the same order as file_paths
+        """
+        return await self._process_concurrently(
+            file_paths,
+            dict(
+                extract_text=extract_text, chunk=chunk, summarize=summarize, project_id=project_id
+            ),
+            max_concurrency=max_concurrency,
+            capture_errors=True,
+            progress=progress,
+        )
+
+    async def _process_concurrently(
+        self,
+        file_paths: Sequence[str | Path],
+        process_kwargs: Dict[str, Any],
+        max_concurrency: Optional[int] = None,
+        capture_errors: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[ProcessResult]:
+        """Run process() for each file in worker threads, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(max_concurrency or _default_worker_count())
+        total = len(file_paths)
+        done = 0
+
+        async def _process(file_path: str | Path) -> ProcessResult:
+            nonlocal done
+            async with semaphore:
+                try:
+                    result = await asyncio.to_thread(self.process, file_path, **process_kwargs)
+                except Exception as e:
+                    if not capture_errors:
+                        raise
+                    logger.error(f"Processing {file_path} failed: {e}")
+                    result = ProcessResult(status="error", error=str(e))
+
+            done += 1
+            if progress:
+                progress(done, total)
+            return result
+
+        results = await asyncio.gather(*(_process(path) for path in file_paths))
+        return list(results)
+
+    def embed_chunks(
+        self, chunks: List[DocumentChunk], batch_size: int = 256, max_workers: int = 8
+    ) -> List[DocumentChunk]:
+        """
+        Compute embeddings for chunks in batched requests.
+
+        Chunk texts are sent in slices of batch_size per embed() call, with
+        several batches in flight at once. The vectors are stored on
+        chunk.embedding and passed to Meilisearch by chunks_to_search_documents().
+
+        Args:
+            chunks: List of DocumentChunk objects
+            batch_size: Maximum number of texts per embedding request (default: 256)
+            max_workers: Maximum number of concurrent requests (default: 8)
+
+        Returns:
+            The same chunks, with embedding set
+
+        Raises:
+            ValueError: If no embedding client is configured
+        """
+        if self.embedding_client is None:
+            raise ValueError("No embedding client configured")
+
+        batches = [chunks[i : i + batch_size] for i in range(0, len(chunks), batch_size)]
+
+        def _embed_batch(batch: List[DocumentChunk]) -> List[List[float]]:
+            vectors = self.embedding_client.embed([chunk.chunk_text for chunk in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+            return vectors
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for batch, vectors in zip(batches, pool.map(_embed_batch, batches)):
+                for chunk, vector in zip(batch, vectors):
+                    chunk.embedding = list(vector)
+
+        logger.info(f"Embedded {len(chunks)} chunks in {len(batches)} requests")
+        return chunks
+
+    def embed_and_index(
+        self,
+        chunks: Iterable[DocumentChunk],
+        indexer: MeiliSearchIndexer,
+        index_name: str,
+        batch_size: int = 256,
+    ) -> int:
+        """
+        Embed and index chunks batch by batch.
+
+        Drains chunks (e.g. the iterator from process(streaming=True)) in
+        slices of batch_size, so at most one batch of chunks is held at a time.
+        Chunks are embedded first when an embedding_client is configured.
+
+        Args:
+            chunks: DocumentChunk objects, typically a lazy iterator
+            indexer: MeiliSearchIndexer to index into
+            index_name: Name of the index (without prefix)
+            batch_size: Number of chunks per embedding and indexing request (default: 256)
+
+        Returns:
+            Number of chunks indexed
+        """
+        iterator = iter(chunks)
+        indexed = 0
+
+        while batch := list(islice(iterator, batch_size)):
+            if self.embedding_client is not None:
+                self.embed_chunks(batch, batch_size=batch_size)
+            indexer.index_chunks(self.chunks_to_search_documents(batch), index_name)
+            indexed += len(batch)
+
+        logger.info(f"Indexed {indexed} chunks to {index_name}")
+        return indexed
 
     def chunks_to_search_documents(self, chunks: List[DocumentChunk]) -> List[Dict[str, Any]]:
         """
@@ -221,3 +844,17 @@ class DocumentProcessor:
             List of dictionaries ready for indexing
         """
         return [self.chunker.to_search_document(chunk) for chunk in chunks]
+
+
+def _summary_source(text: str) -> str:
+    """Normalized start and end of a text, so a shared header alone does not match."""
+    normalized = " ".join(text.split())
+    if len(normalized) <= SUMMARY_QUERY_CHARS:
+        return normalized
+    half = SUMMARY_QUERY_CHARS // 2
+    return f"{normalized[:half]} ... {normalized[-half:]}"
+
+
+def _default_worker_count() -> int:
+    """Default number of documents processed concurrently."""
+    return max(1, (os.cpu_count() or 1) * 3 // 2)
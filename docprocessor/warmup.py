@@ -0,0 +1,70 @@
+# docprocessor/warmup.py
+
+"""
+Model warm-up.
+
+Loads the tokenizer and embedding model ahead of time so the first
+process() call does not pay their load latency.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from .core.summary_cache import load_embedding_model
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up(
+    encoding: str = "cl100k_base",
+    embed_model: Optional[str] = None,
+    background: bool = True,
+) -> Optional[threading.Thread]:
+    """
+    Preload the tiktoken encoding and, optionally, an embedding model.
+
+    Both are cached per process (tiktoken keeps loaded encodings, and
+    load_embedding_model() is memoized), so later DocumentChunker and
+    LRUSemanticCache instances reuse them. Failures are logged, not raised.
+
+    Args:
+        encoding: tiktoken encoding to load (default: 'cl100k_base', used by the chunker)
+        embed_model: Optional sentence-transformers model name to load
+        background: Load in a daemon thread instead of blocking (default: True)
+
+    Returns:
+        The started thread when background is True, otherwise None
+    """
+    if background:
+        thread = threading.Thread(
+            target=_load_models,
+            args=(encoding, embed_model),
+            name="docprocessor-warmup",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    _load_models(encoding, embed_model)
+    return None
+
+
+def _load_models(encoding: str, embed_model: Optional[str]) -> None:
+    """Load the tokenizer and embedding model, logging any failure."""
+    try:
+        import tiktoken
+
+        tiktoken.get_encoding(encoding)
+        logger.debug(f"Warmed up tiktoken encoding {encoding}")
+    except ImportError:
+        logger.debug("tiktoken not installed, skipping tokenizer warm-up")
+    except Exception as e:
+        logger.warning(f"Tokenizer warm-up failed: {e}")
+
+    if embed_model:
+        try:
+            load_embedding_model(embed_model)
+            logger.debug(f"Warmed up embedding model {embed_model}")
+        except Exception as e:
+            logger.warning(f"Embedding model warm-up failed: {e}")
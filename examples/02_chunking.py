@@ -11,6 +11,7 @@ This example demonstrates:
 from pathlib import Path
 
 from docprocessor import DocumentProcessor
+from docprocessor.core import ChunkBatch
 
 
 def example_custom_chunk_sizes():
@@ -24,6 +25,7 @@ def example_custom_chunk_sizes():
         chunk_size=256,  # Small chunks
         chunk_overlap=25,  # Minimal overlap
         min_chunk_size=50,  # Allow smaller chunks
+        extraction_cache=True,  # Share extracted text with the processor below
     )
 
     # Large chunks for context preservation
@@ -31,6 +33,7 @@ def example_custom_chunk_sizes():
         chunk_size=2048,  # Large chunks
         chunk_overlap=200,  # More overlap
         min_chunk_size=500,  # Enforce minimum size
+        extraction_cache=True,  # Reuses the extraction instead of reading the file again
     )
 
     # Example text
@@ -54,20 +57,16 @@ def example_custom_chunk_sizes():
         small_result = small_processor.process(file_path=temp_file, extract_text=True, chunk=True)
 
         print(f"\nSmall chunks (256 tokens):")
-        print(f"  Total chunks: {len(small_result.chunks)}")
-        print(
-            f"  Average tokens: {sum(c.token_count for c in small_result.chunks) / len(small_result.chunks):.0f}"
-        )
+        print(f"  Total chunks: {small_result.stats.total_chunks}")
+        print(f"  Average tokens: {small_result.stats.mean_tokens:.0f}")
         print(f"  First chunk preview: {small_result.chunks[0].chunk_text[:100]}...")
 
         # Process with large chunks
         large_result = large_processor.process(file_path=temp_file, extract_text=True, chunk=True)
 
         print(f"\nLarge chunks (2048 tokens):")
-        print(f"  Total chunks: {len(large_result.chunks)}")
-        print(
-            f"  Average tokens: {sum(c.token_count for c in large_result.chunks) / len(large_result.chunks):.0f}"
-        )
+        print(f"  Total chunks: {large_result.stats.total_chunks}")
+        print(f"  Average tokens: {large_result.stats.mean_tokens:.0f}")
         print(f"  First chunk preview: {large_result.chunks[0].chunk_text[:100]}...")
 
     finally:
@@ -92,11 +91,19 @@ def example_chunk_overlap():
     no_overlap_chunks = no_overlap.chunk_text(text=sample_text, filename="test.txt")
     high_overlap_chunks = high_overlap.chunk_text(text=sample_text, filename="test.txt")
 
+    # Column-oriented views: token statistics are numpy reductions
+    no_overlap_batch = ChunkBatch.from_chunks(no_overlap_chunks)
+    high_overlap_batch = ChunkBatch.from_chunks(high_overlap_chunks)
+
     print(f"\nNo overlap (0 tokens):")
-    print(f"  Total chunks: {len(no_overlap_chunks)}")
+    print(f"  Total chunks: {len(no_overlap_batch)}")
+    if len(no_overlap_batch):
+        print(f"  Total tokens: {no_overlap_batch.token_counts.sum()}")
 
     print(f"\nHigh overlap (100 tokens):")
-    print(f"  Total chunks: {len(high_overlap_chunks)}")
+    print(f"  Total chunks: {len(high_overlap_batch)}")
+    if len(high_overlap_batch):
+        print(f"  Total tokens: {high_overlap_batch.token_counts.sum()}")
 
     # Check for overlapping content
     if len(high_overlap_chunks) >= 2:
@@ -136,14 +143,15 @@ Paragraph text here.
     )
 
     try:
-        # Process TXT
-        txt_result = processor.process(txt_file, extract_text=True, chunk=True)
+        # Process both files concurrently
+        txt_result, md_result = processor.process_batch(
+            [txt_file, md_file], extract_text=True, chunk=True
+        )
+
         print(f"\nPlain Text (.txt):")
         print(f"  Chunks: {len(txt_result.chunks)}")
         print(f"  Format: {txt_result.metadata.get('format')}")
 
-        # Process Markdown
-        md_result = processor.process(md_file, extract_text=True, chunk=True)
         print(f"\nMarkdown (.md):")
         print(f"  Chunks: {len(md_result.chunks)}")
         print(f"  Format: {md_result.metadata.get('format')}")
@@ -6,13 +6,63 @@ This example demonstrates:
 - Custom LLM client implementation
 - Fallback summarization strategies
 - Error handling and retries
+- Concurrent batch summarization
 """
 
+import asyncio
 import os
+import weakref
+from functools import lru_cache
 from pathlib import Path
 
 from docprocessor import DocumentProcessor
 
+# Connection pool sizes for provider HTTP clients; keep-alive avoids a TLS handshake per request
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_TIMEOUT = 30.0
+
+
+@lru_cache(maxsize=None)
+def shared_http_client():
+    """Return a process-wide pooled httpx client shared by the sync provider clients."""
+    import httpx  # Installed with the openai and anthropic SDKs
+
+    return httpx.Client(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=HTTP_TIMEOUT,
+    )
+
+
+def pooled_async_http_client():
+    """Create a pooled httpx async client (bound to one event loop, so one per loop)."""
+    import httpx
+
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=HTTP_TIMEOUT,
+    )
+
+
+def client_for_running_loop(clients: weakref.WeakKeyDictionary, factory):
+    """
+    Return the async SDK client for the running event loop, creating it on first use.
+
+    Pooled connections belong to the loop that opened them, and summarize_texts()
+    starts a new loop with asyncio.run() on every call, so clients are kept per loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = clients.get(loop)
+    if client is None:
+        client = clients[loop] = factory(http_client=pooled_async_http_client())
+    return client
+
 
 class OpenAIClient:
     """Example LLM client for OpenAI."""
@@ -24,12 +74,16 @@ class OpenAIClient:
 
         # Import here to make it optional
         try:
-            from openai import OpenAI
+            from openai import AsyncOpenAI, OpenAI
 
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, http_client=shared_http_client())
+            self._async_client_cls = AsyncOpenAI
         except ImportError:
             print("Warning: openai package not installed. Install with: pip install openai")
             self.client = None
+            self._async_client_cls = None
+
+        self._async_clients = weakref.WeakKeyDictionary()
 
     def complete_chat(self, messages: list, temperature: float = 0.3) -> dict:
         """Complete chat using OpenAI API."""
@@ -46,6 +100,25 @@ class OpenAIClient:
         except Exception as e:
             raise RuntimeError(f"OpenAI API error: {e}")
 
+    async def acomplete_chat(self, messages: list, temperature: float = 0.3) -> dict:
+        """Complete chat using the async OpenAI API (used by batch summarization)."""
+        if not self._async_client_cls:
+            raise RuntimeError("OpenAI client not initialized")
+
+        async_client = client_for_running_loop(
+            self._async_clients, lambda **kw: self._async_client_cls(api_key=self.api_key, **kw)
+        )
+
+        try:
+            response = await async_client.chat.completions.create(
+                model=self.model, messages=messages, temperature=temperature, max_tokens=1000
+            )
+
+            return {"content": response.choices[0].message.content}
+
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {e}")
+
 
 class AnthropicClient:
     """Example LLM client for Anthropic Claude."""
@@ -56,12 +129,16 @@ class AnthropicClient:
         self.model = model
 
         try:
-            from anthropic import Anthropic
+            from anthropic import Anthropic, AsyncAnthropic
 
-            self.client = Anthropic(api_key=api_key)
+            self.client = Anthropic(api_key=api_key, http_client=shared_http_client())
+            self._async_client_cls = AsyncAnthropic
         except ImportError:
             print("Warning: anthropic package not installed. Install with: pip install anthropic")
             self.client = None
+            self._async_client_cls = None
+
+        self._async_clients = weakref.WeakKeyDictionary()
 
     def complete_chat(self, messages: list, temperature: float = 0.3) -> dict:
         """Complete chat using Anthropic API."""
@@ -86,6 +163,32 @@ class AnthropicClient:
         except Exception as e:
             raise RuntimeError(f"Anthropic API error: {e}")
 
+    async def acomplete_chat(self, messages: list, temperature: float = 0.3) -> dict:
+        """Complete chat using the async Anthropic API (used by batch summarization)."""
+        if not self._async_client_cls:
+            raise RuntimeError("Anthropic client not initialized")
+
+        async_client = client_for_running_loop(
+            self._async_clients, lambda **kw: self._async_client_cls(api_key=self.api_key, **kw)
+        )
+
+        try:
+            system_msg = next((m["content"] for m in messages if m["role"] == "system"), "")
+            user_messages = [m for m in messages if m["role"] != "system"]
+
+            response = await async_client.messages.create(
+                model=self.model,
+                max_tokens=1000,
+                temperature=temperature,
+                system=system_msg,
+                messages=user_messages,
+            )
+
+            return {"content": response.content[0].text}
+
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API error: {e}")
+
 
 class MockLLMClient:
     """Mock LLM client for testing without API keys."""
@@ -326,6 +429,29 @@ def example_error_handling():
     print(f"Fallback summary generated: {len(summary)} characters")
 
 
+def example_batch_summarization():
+    """Demonstrate summarizing several documents concurrently."""
+    print("\n" + "=" * 60)
+    print("Example 7: Batch Summarization")
+    print("=" * 60)
+
+    processor = DocumentProcessor(llm_client=MockLLMClient(), summary_target_words=100)
+
+    documents = {
+        "solar.txt": "Solar panels convert sunlight into electricity. " * 20,
+        "wind.txt": "Wind turbines harness kinetic energy from moving air. " * 20,
+        "hydro.txt": "Hydroelectric dams generate power from flowing water. " * 20,
+    }
+
+    # All LLM requests are in flight at once instead of one after another
+    summaries = processor.summarize_texts(
+        list(documents.values()), filenames=list(documents.keys()), max_concurrency=10
+    )
+
+    for filename, summary in zip(documents, summaries):
+        print(f"\n{filename}: {summary[:80]}...")
+
+
 def main():
     """Run all summarization examples."""
     print("\n" + "=" * 60)
@@ -337,6 +463,7 @@ def main():
         example_fallback_summarization()
         example_custom_summary_length()
         example_error_handling()
+        example_batch_summarization()
 
         # These require API keys
         example_openai_summarization()
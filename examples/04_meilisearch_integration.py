@@ -3,45 +3,54 @@ Example 04: Meilisearch Integration with docprocessor
 
 This example demonstrates:
 - Complete indexing pipeline
-- Two-index architecture (chunks + documents)
+- Two-index architecture (chunks + documents), processing and indexing in a pipeline
 - Searching and filtering results
 - Index management
 """
 
+import asyncio
+import json
 import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from docprocessor import DocumentProcessor, MeiliSearchIndexer
 
+try:
+    import orjson  # Optional: faster payload size measurement
+except ImportError:
+    orjson = None
+
+# Pipeline settings for the two-index example
+MAX_QUEUE_SIZE = 8  # Processed documents waiting to be indexed
+INDEX_BATCH_SIZE = 1000  # Chunks per Meilisearch request
+MAX_PAYLOAD_BYTES = 80_000_000  # Stay below Meilisearch's default 100 MB payload limit
 
-def check_meilisearch_connection(url: str, api_key: str) -> bool:
-    """Check if Meilisearch is available."""
-    try:
-        indexer = MeiliSearchIndexer(url=url, api_key=api_key)
-        return True
-    except Exception as e:
-        print(f"Cannot connect to Meilisearch: {e}")
-        return False
 
+def _iter_sized_batches(docs, max_bytes=MAX_PAYLOAD_BYTES):
+    """Split documents into batches whose JSON payload stays under max_bytes."""
+    batch, size = [], 0
+    for doc in docs:
+        doc_size = len(orjson.dumps(doc)) if orjson else len(json.dumps(doc).encode())
+        if batch and size + doc_size > max_bytes:
+            yield batch
+            batch, size = [], 0
+        batch.append(doc)
+        size += doc_size
+    if batch:
+        yield batch
 
-def example_basic_indexing():
+
+def example_basic_indexing(indexer: MeiliSearchIndexer):
     """Demonstrate basic document indexing."""
     print("=" * 60)
     print("Example 1: Basic Document Indexing")
     print("=" * 60)
 
-    # Configuration
-    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
-    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
-
-    if not check_meilisearch_connection(url, api_key):
-        print("\nSkipping: Meilisearch not available")
-        print("Start Meilisearch with: docker run -p 7700:7700 getmeili/meilisearch")
-        return
-
     # Initialize
     processor = DocumentProcessor()
-    indexer = MeiliSearchIndexer(url=url, api_key=api_key)
 
     # Create sample document
     sample_text = """
@@ -79,98 +88,186 @@ def example_basic_indexing():
         # Convert chunks to search documents
         search_docs = processor.chunks_to_search_documents(result.chunks)
 
-        # Index chunks
-        index_result = indexer.index_chunks(
-            chunks=search_docs, index_name="document_chunks", primary_key="id"
-        )
+        # Index chunks, split so no request exceeds the payload limit
+        index_results = [
+            indexer.index_chunks(chunks=batch, index_name="document_chunks", primary_key="id")
+            for batch in _iter_sized_batches(search_docs)
+        ]
 
-        print(f"\nIndexed to Meilisearch:")
-        print(f"  Index: document_chunks")
+        print("\nIndexed to Meilisearch:")
+        print("  Index: document_chunks")
         print(f"  Documents: {len(search_docs)}")
-        print(f"  Status: {index_result}")
+        print(f"  Batches: {len(index_results)}")
+        for index_result in index_results:
+            print(f"  Status: {index_result}")
 
     finally:
         temp_file.unlink()
 
 
-def example_two_index_architecture():
+@lru_cache(maxsize=None)
+def _get_processor():
+    """One DocumentProcessor per worker process."""
+    return DocumentProcessor()
+
+
+def _process_one(text, filename, i):
+    """Process one document in a worker process; returns (search_docs, doc_metadata)."""
+    processor = _get_processor()
+
+    # The text is already in memory, so skip the write-to-disk/extract round trip
+    result = processor.process_text(
+        text,
+        filename=filename,
+        file_id=f"file-{i+1}",
+        output_id=f"output-{i+1}",
+        project_id=1,
+    )
+
+    search_docs = processor.chunks_to_search_documents(result.chunks)
+    doc_metadata = {
+        "id": f"file-{i+1}",
+        "filename": filename,
+        "text_length": len(result.text),
+        "chunk_count": len(result.chunks),
+        "page_count": result.page_count,
+        "project_id": 1,
+        "indexed_at": "2025-10-22T10:00:00Z",
+    }
+    return search_docs, doc_metadata
+
+
+async def example_two_index_architecture(indexer: MeiliSearchIndexer):
     """Demonstrate two-index architecture (chunks + documents)."""
     print("\n" + "=" * 60)
     print("Example 2: Two-Index Architecture")
     print("=" * 60)
 
-    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
-    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
-
-    if not check_meilisearch_connection(url, api_key):
-        print("\nSkipping: Meilisearch not available")
-        return
-
-    processor = DocumentProcessor()
-    indexer = MeiliSearchIndexer(url=url, api_key=api_key)
-
     # Create sample documents
     documents = [
-        ("Climate change is affecting global weather patterns. " * 10, "climate.txt"),
-        ("Renewable energy sources are becoming more efficient. " * 10, "energy.txt"),
-        ("Electric vehicles are reducing carbon emissions. " * 10, "transport.txt"),
+        ("Climate change is affecting global weather patterns. ", "climate.txt"),
+        ("Renewable energy sources are becoming more efficient. ", "energy.txt"),
+        ("Electric vehicles are reducing carbon emissions. ", "transport.txt"),
     ]
 
-    for i, (text, filename) in enumerate(documents):
-        temp_file = Path(filename)
-        temp_file.write_text(text)
-
-        try:
-            # Process document
-            result = processor.process(
-                file_path=temp_file,
-                extract_text=True,
-                chunk=True,
-                file_id=f"file-{i+1}",
-                output_id=f"output-{i+1}",
-                project_id=1,
-            )
-
-            # INDEX 1: Document chunks (for semantic search)
-            search_docs = processor.chunks_to_search_documents(result.chunks)
-            indexer.index_chunks(chunks=search_docs, index_name="document_chunks")
-
-            # INDEX 2: Document metadata (for filtering and overview)
-            doc_metadata = {
-                "id": f"file-{i+1}",
-                "filename": filename,
-                "text_length": len(result.text),
-                "chunk_count": len(result.chunks),
-                "page_count": result.page_count,
-                "project_id": 1,
-                "indexed_at": "2025-10-22T10:00:00Z",
-            }
-
-            indexer.index_document(document=doc_metadata, index_name="documents")
-
-            print(f"\nIndexed: {filename}")
-            print(f"  Chunks indexed: {len(search_docs)}")
-            print(f"  Metadata indexed: Yes")
-
-        finally:
-            temp_file.unlink()
-
-
-def example_searching():
+    # Processing and indexing overlap: worker processes chunk the documents
+    # in parallel while another task sends chunk batches to Meilisearch.
+    # The bounded queue applies backpressure if indexing falls behind.
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=MAX_QUEUE_SIZE)
+    all_meta = []
+
+    async def process_worker(pool):
+        futures = [
+            loop.run_in_executor(pool, _process_one, text * 10, filename, i)
+            for i, (text, filename) in enumerate(documents)
+        ]
+
+        for future in asyncio.as_completed(futures):
+            # Chunks go to INDEX 1 (semantic search), metadata to INDEX 2 (filtering and overview)
+            search_docs, doc_metadata = await future
+            await queue.put(search_docs)
+            all_meta.append(doc_metadata)
+
+            print(f"\nProcessed: {doc_metadata['filename']}")
+            print(f"  Chunks: {len(search_docs)}")
+
+        await queue.put(None)  # Sentinel: no more documents
+
+    async def index_worker():
+        pending = []
+        indexed = 0
+
+        async def flush():
+            # Large chunks can exceed the payload limit before INDEX_BATCH_SIZE is reached
+            for batch in _iter_sized_batches(pending):
+                await loop.run_in_executor(None, indexer.index_chunks, batch, "document_chunks")
+            return len(pending)
+
+        while (search_docs := await queue.get()) is not None:
+            pending.extend(search_docs)
+            if len(pending) >= INDEX_BATCH_SIZE:
+                indexed += await flush()
+                pending = []
+
+        if pending:
+            indexed += await flush()
+
+        return indexed
+
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(documents))) as pool:
+        _, indexed = await asyncio.gather(process_worker(pool), index_worker())
+    indexer.index_documents(documents=all_meta, index_name="documents")
+
+    print(f"\nIndexed {indexed} chunks and {len(all_meta)} metadata documents")
+
+
+class SearchCache:
+    """
+    Client-side cache of search hits for as-you-type queries.
+
+    Repeated queries are served from an LRU. A query that extends a cached
+    one is answered by filtering the cached hits locally, provided that
+    result set was complete (fewer hits than the limit), so most keystrokes
+    never reach Meilisearch. Local filtering is a plain substring match on
+    the chunk preview, an approximation of Meilisearch's own matching.
+    """
+
+    def __init__(self, indexer, index_name: str, limit: int = 20, maxsize: int = 256):
+        """
+        Initialize search cache.
+
+        Args:
+            indexer: MeiliSearchIndexer to query on a miss
+            index_name: Index to search (without prefix)
+            limit: Maximum number of hits per query
+            maxsize: Maximum number of cached queries
+        """
+        self.indexer = indexer
+        self.index_name = index_name
+        self.limit = limit
+        self.maxsize = maxsize
+        self._cache: OrderedDict[str, list] = OrderedDict()
+        self.remote_searches = 0
+        self.local_searches = 0
+
+    def search(self, query: str) -> list:
+        """Return hits for the query, from the cache when possible."""
+        key = query.strip().lower()
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.local_searches += 1
+            return self._cache[key]
+
+        # Longest cached prefix whose result set was not cut off by the limit
+        for end in range(len(key) - 1, 0, -1):
+            cached = self._cache.get(key[:end])
+            if cached is not None and len(cached) < self.limit:
+                hits = [h for h in cached if key in h.get("chunk_preview", "").lower()]
+                self.local_searches += 1
+                self._remember(key, hits)
+                return hits
+
+        results = self.indexer.search(query=query, index_name=self.index_name, limit=self.limit)
+        self.remote_searches += 1
+        self._remember(key, results["hits"])
+        return results["hits"]
+
+    def _remember(self, key: str, hits: list) -> None:
+        """Store hits for a query, evicting the least recently used query."""
+        self._cache[key] = hits
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
+def example_searching(indexer: MeiliSearchIndexer):
     """Demonstrate searching indexed documents."""
     print("\n" + "=" * 60)
     print("Example 3: Searching Indexed Documents")
     print("=" * 60)
 
-    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
-    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
-
-    if not check_meilisearch_connection(url, api_key):
-        print("\nSkipping: Meilisearch not available")
-        return
-
-    indexer = MeiliSearchIndexer(url=url, api_key=api_key)
-
     # Search queries
     queries = ["machine learning", "climate change", "renewable energy"]
 
@@ -188,26 +285,27 @@ def example_searching():
         else:
             print("  No results found")
 
+    # As-you-type search: each keystroke is a query, most answered locally
+    cache = SearchCache(indexer, index_name="document_chunks")
+    typed = "renewable energy"
+    for end in range(1, len(typed) + 1):
+        hits = cache.search(typed[:end])
+
+    print(f"\nTyped '{typed}' one keystroke at a time: {len(hits)} hits")
+    print(f"  Meilisearch requests: {cache.remote_searches}")
+    print(f"  Answered from cache: {cache.local_searches}")
 
-def example_filtering():
+
+def example_filtering(indexer: MeiliSearchIndexer):
     """Demonstrate filtering search results."""
     print("\n" + "=" * 60)
     print("Example 4: Filtering Search Results")
     print("=" * 60)
 
-    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
-    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
-
-    if not check_meilisearch_connection(url, api_key):
-        print("\nSkipping: Meilisearch not available")
-        return
-
-    indexer = MeiliSearchIndexer(url=url, api_key=api_key)
-
     # Search with filters
     print("\nSearch with project filter:")
     results = indexer.search(
-        query="energy", index_name="document_chunks", limit=5, filter="project_id = 1"
+        query="energy", index_name="document_chunks", limit=5, filters="project_id = 1"
     )
 
     print(f"Found {len(results['hits'])} results for project 1")
@@ -215,27 +313,18 @@ def example_filtering():
     # Search specific file
     print("\nSearch within specific file:")
     results = indexer.search(
-        query="climate", index_name="document_chunks", limit=5, filter="file_id = 'file-1'"
+        query="climate", index_name="document_chunks", limit=5, filters="file_id = 'file-1'"
     )
 
     print(f"Found {len(results['hits'])} results in file-1")
 
 
-def example_index_management():
+def example_index_management(indexer: MeiliSearchIndexer):
     """Demonstrate index management operations."""
     print("\n" + "=" * 60)
     print("Example 5: Index Management")
     print("=" * 60)
 
-    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
-    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
-
-    if not check_meilisearch_connection(url, api_key):
-        print("\nSkipping: Meilisearch not available")
-        return
-
-    indexer = MeiliSearchIndexer(url=url, api_key=api_key)
-
     # Create index
     print("\nCreating index...")
     result = indexer.create_index(index_name="test_index", primary_key="id")
@@ -254,36 +343,34 @@ def example_index_management():
     print(f"  Deleted: {result}")
 
 
-def example_multi_environment():
+def example_multi_environment(indexer: MeiliSearchIndexer):
     """Demonstrate multi-environment indexing with prefixes."""
     print("\n" + "=" * 60)
     print("Example 6: Multi-Environment Indexing")
     print("=" * 60)
 
-    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
-    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
-
-    if not check_meilisearch_connection(url, api_key):
-        print("\nSkipping: Meilisearch not available")
-        return
-
-    # Different environments
+    # Different environments, all sharing the base indexer's client
     environments = {
-        "dev": MeiliSearchIndexer(url, api_key, index_prefix="dev_"),
-        "staging": MeiliSearchIndexer(url, api_key, index_prefix="staging_"),
-        "prod": MeiliSearchIndexer(url, api_key, index_prefix="prod_"),
+        env: MeiliSearchIndexer(
+            indexer.url, indexer.api_key, index_prefix=f"{env}_", client=indexer.client
+        )
+        for env in ("dev", "staging", "prod")
     }
 
     sample_doc = {"id": "test-doc-1", "filename": "test.txt", "content": "Test document content"}
 
-    for env_name, indexer in environments.items():
-        print(f"\nIndexing to {env_name} environment...")
+    def index_to(env_indexer):
+        env_indexer.index_document(document=sample_doc, index_name="documents")
+        # The actual index name will be prefixed
+        return env_indexer._get_prefixed_index_name("documents")
 
-        indexer.index_document(document=sample_doc, index_name="documents")
+    # Environments are independent indexes, so the HTTP requests run in parallel
+    print(f"\nIndexing to {', '.join(environments)} environments...")
+    with ThreadPoolExecutor(max_workers=len(environments)) as executor:
+        actual_indexes = executor.map(index_to, environments.values())
 
-        # The actual index name will be prefixed
-        actual_index = indexer._get_prefixed_index_name("documents")
-        print(f"  Indexed to: {actual_index}")
+    for env_name, actual_index in zip(environments, actual_indexes):
+        print(f"  {env_name}: indexed to {actual_index}")
 
 
 def main():
@@ -297,13 +384,23 @@ def main():
     print("2. Set MEILISEARCH_URL (default: http://localhost:7700)")
     print("3. Set MEILISEARCH_API_KEY (default: masterKey)")
 
+    url = os.getenv("MEILISEARCH_URL", "http://localhost:7700")
+    api_key = os.getenv("MEILISEARCH_API_KEY", "masterKey")
+
+    # One indexer (and one client) for every example, checked once up front
+    indexer = MeiliSearchIndexer(url=url, api_key=api_key)
+    if not indexer.is_healthy():
+        print(f"\nSkipping: Meilisearch not available at {url}")
+        print("Start Meilisearch with: docker run -p 7700:7700 getmeili/meilisearch")
+        return
+
     try:
-        example_basic_indexing()
-        example_two_index_architecture()
-        example_searching()
-        example_filtering()
-        example_index_management()
-        example_multi_environment()
+        example_basic_indexing(indexer)
+        asyncio.run(example_two_index_architecture(indexer))
+        example_searching(indexer)
+        example_filtering(indexer)
+        example_index_management(indexer)
+        example_multi_environment(indexer)
 
         print("\n" + "=" * 60)
         print("All examples completed!")
@@ -8,19 +8,59 @@ This example demonstrates:
 - Best practices for LLM integration
 """
 
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import random
+import re
+import sqlite3
+import tempfile
+import threading
 import time
-from typing import Any, Dict, List
+import zlib
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NoReturn, Optional
+
+import numpy as np
 
 from docprocessor import DocumentProcessor
 
+try:
+    import orjson  # Optional: faster response serialization
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: faster cache-key hashing
+except ImportError:
+    xxhash = None
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
 
 class RetryableLLMClient:
     """
     LLM client with automatic retry logic.
 
-    Implements exponential backoff for handling rate limits and transient errors.
+    Implements exponential backoff with full jitter for handling rate limits
+    and transient errors. The async acomplete_chat() waits with asyncio.sleep,
+    so other requests keep running on the event loop during backoff.
     """
 
+    __slots__ = ("base_client", "max_retries", "base_delay", "_complete")
+
+    # Compiled once; one case-insensitive scan instead of lower() plus a scan per keyword
+    RETRYABLE_ERROR = re.compile(r"rate limit|timeout|overloaded", re.IGNORECASE)
+
     def __init__(self, base_client, max_retries: int = 3, base_delay: float = 1.0):
         """
         Initialize retryable client.
@@ -33,55 +73,93 @@ class RetryableLLMClient:
         self.base_client = base_client
         self.max_retries = max_retries
         self.base_delay = base_delay
+        # Bound once, so each call skips a lookup per wrapper level
+        self._complete = base_client.complete_chat
+
+    def _retry_delay(self, attempt: int, error: Exception) -> Optional[float]:
+        """Return the backoff delay before the next attempt, or None to give up."""
+        if attempt >= self.max_retries - 1 or not self.RETRYABLE_ERROR.search(str(error)):
+            return None
+
+        # Full jitter: uniform over [0, exponential cap], so that clients
+        # throttled together don't retry in lockstep
+        delay = random.uniform(0, self.base_delay * (2**attempt))
+        print(f"Retry attempt {attempt + 1}/{self.max_retries} after {delay:.2f}s...")
+        return delay
 
     def complete_chat(self, messages: List[Dict], temperature: float = 0.3) -> Dict[str, Any]:
         """Complete chat with retry logic."""
-        last_error = None
-
         for attempt in range(self.max_retries):
             try:
-                return self.base_client.complete_chat(messages, temperature)
+                return self._complete(messages, temperature)
 
             except Exception as e:
-                last_error = e
-                error_msg = str(e).lower()
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    # Non-retryable error or max retries exceeded
+                    raise
+                time.sleep(delay)
 
-                # Check if error is retryable
-                if any(keyword in error_msg for keyword in ["rate limit", "timeout", "overloaded"]):
-                    if attempt < self.max_retries - 1:
-                        # Exponential backoff
-                        delay = self.base_delay * (2**attempt)
-                        print(f"Retry attempt {attempt + 1}/{self.max_retries} after {delay}s...")
-                        time.sleep(delay)
-                        continue
+        raise RuntimeError(f"Failed after {self.max_retries} attempts")
 
-                # Non-retryable error or max retries exceeded
-                raise
+    async def acomplete_chat(
+        self, messages: List[Dict], temperature: float = 0.3
+    ) -> Dict[str, Any]:
+        """Async complete chat with retry logic; backoff does not block the event loop."""
+        acomplete_chat = getattr(self.base_client, "acomplete_chat", None)
 
-        # All retries exhausted
-        raise RuntimeError(f"Failed after {self.max_retries} attempts: {last_error}")
+        for attempt in range(self.max_retries):
+            try:
+                if acomplete_chat is not None:
+                    return await acomplete_chat(messages, temperature)
+                return await asyncio.to_thread(self._complete, messages, temperature)
+
+            except Exception as e:
+                delay = self._retry_delay(attempt, e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+
+        raise RuntimeError(f"Failed after {self.max_retries} attempts")
 
 
 class MultiProviderLLMClient:
     """
     LLM client that supports multiple providers with fallback.
 
-    Tries providers in order until one succeeds.
+    In "fallback" mode, tries providers in order until one succeeds. In "race"
+    mode, queries the first race_width providers in parallel and returns the
+    first successful response, so one hanging provider does not add its full
+    timeout to the latency.
     """
 
-    def __init__(self, providers: List[Any]):
+    __slots__ = ("providers", "mode", "race_width")
+
+    def __init__(self, providers: List[Any], mode: str = "fallback", race_width: int = 2):
         """
         Initialize multi-provider client.
 
         Args:
             providers: List of LLM client instances in priority order
+            mode: "fallback" (sequential) or "race" (parallel)
+            race_width: Number of providers queried at once in race mode
         """
         if not providers:
             raise ValueError("At least one provider required")
+        if mode not in ("fallback", "race"):
+            raise ValueError(f"Unknown mode: {mode}")
 
         self.providers = providers
+        self.mode = mode
+        self.race_width = max(1, race_width)
 
     def complete_chat(self, messages: List[Dict], temperature: float = 0.3) -> Dict[str, Any]:
+        """Complete chat using the configured provider strategy."""
+        if self.mode == "race":
+            return self._race(messages, temperature)
+        return self._fallback(messages, temperature)
+
+    def _fallback(self, messages: List[Dict], temperature: float) -> Dict[str, Any]:
         """Try each provider in order until one succeeds."""
         errors = []
 
@@ -96,7 +174,44 @@ class MultiProviderLLMClient:
                     print(f"  Failed: {e}. Trying next provider...")
                     continue
 
-        # All providers failed
+        self._raise_all_failed(errors)
+
+    def _race(self, messages: List[Dict], temperature: float) -> Dict[str, Any]:
+        """Query the top providers in parallel and return the first success."""
+        contenders = self.providers[: self.race_width]
+        errors = []
+
+        print(f"Racing {len(contenders)} providers...")
+        executor = ThreadPoolExecutor(max_workers=len(contenders))
+        try:
+            pending = {
+                executor.submit(provider.complete_chat, messages, temperature): provider
+                for provider in contenders
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    provider = pending.pop(future)
+                    try:
+                        return future.result()
+                    except Exception as e:
+                        errors.append((provider.__class__.__name__, str(e)))
+        finally:
+            # Don't wait for the losers; their results are discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # All contenders failed: try the remaining providers in order
+        for provider in self.providers[self.race_width :]:
+            try:
+                return provider.complete_chat(messages, temperature)
+            except Exception as e:
+                errors.append((provider.__class__.__name__, str(e)))
+
+        self._raise_all_failed(errors)
+
+    @staticmethod
+    def _raise_all_failed(errors: List[tuple]) -> NoReturn:
+        """Raise an error listing every provider failure."""
         error_summary = "\n".join([f"  - {name}: {err}" for name, err in errors])
         raise RuntimeError(f"All providers failed:\n{error_summary}")
 
@@ -106,20 +221,149 @@ class CachingLLMClient:
     LLM client with response caching.
 
     Caches responses based on message content to avoid redundant API calls.
+    Exact matches are the fast path; with an embedder, near-identical prompts
+    are matched by cosine similarity as a second tier. With a path, responses
+    are also stored in SQLite and survive restarts; the in-memory LRU then
+    holds the hot entries.
+
+    The semantic tier only covers responses generated in this run: entries
+    loaded from SQLite have no stored embedding and are served on exact
+    matches only.
     """
 
-    def __init__(self, base_client):
-        """Initialize caching client."""
-        self.base_client = base_client
-        self.cache: Dict[str, Dict[str, Any]] = {}
+    __slots__ = (
+        "base_client",
+        "maxsize",
+        "cache",
+        "hits",
+        "misses",
+        "embedder",
+        "similarity_threshold",
+        "semantic_hits",
+        "emb_keys",
+        "emb_rows",
+        "emb_temperatures",
+        "embeddings",
+        "free_rows",
+        "_db",
+        "_complete",
+    )
+
+    def __init__(
+        self,
+        base_client,
+        maxsize: int = 1024,
+        embedder: Optional[Callable[[str], Any]] = None,
+        similarity_threshold: float = 0.95,
+        path: Optional[str] = None,
+    ):
+        """
+        Initialize caching client.
 
-    def _get_cache_key(self, messages: List[Dict], temperature: float) -> str:
+        Args:
+            base_client: Underlying LLM client
+            maxsize: Maximum number of cached responses; least recently used
+                     entries are evicted first
+            embedder: Optional callable mapping prompt text to an embedding vector,
+                      enabling the semantic cache tier
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            path: Optional SQLite database path for a persistent cache
+        """
+        self.base_client = base_client
+        self._complete = base_client.complete_chat
+        self.maxsize = maxsize
+        self.cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.semantic_hits = 0
+        # Preallocated on the first embedding, one row per cache slot: row i
+        # (unit-normalized) belongs to emb_keys[i]; rows of evicted entries are
+        # reused, and free rows have a NaN temperature so they never match
+        self.emb_keys: List[Optional[tuple]] = []
+        self.emb_rows: Dict[tuple, int] = {}
+        self.emb_temperatures: Optional[np.ndarray] = None
+        self.embeddings: Optional[np.ndarray] = None
+        self.free_rows: List[int] = []
+
+        self._db = None
+        if path is not None:
+            # Autocommit; WAL lets readers proceed while a response is written
+            self._db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB)"
+            )
+
+    def _get_cache_key(self, messages: List[Dict], temperature: float) -> tuple:
         """Generate cache key from messages and temperature."""
-        import hashlib
-        import json
-
-        content = json.dumps({"messages": messages, "temperature": temperature}, sort_keys=True)
-        return hashlib.md5(content.encode()).hexdigest()
+        # Tuples are hashable as-is, so the in-memory tier needs no serialization
+        return (tuple((m["role"], m["content"]) for m in messages), round(temperature, 3))
+
+    @staticmethod
+    def _persistent_key(cache_key: tuple) -> str:
+        """Digest of a cache key, for the SQLite tier's TEXT primary key."""
+        key_bytes = repr(cache_key).encode()
+        if xxhash is not None:
+            return xxhash.xxh3_64_hexdigest(key_bytes)
+        return hashlib.blake2b(key_bytes, digest_size=8).hexdigest()
+
+    def _embed(self, messages: List[Dict]) -> np.ndarray:
+        """Embed the flattened prompt as a unit vector."""
+        flat_prompt = "\n".join(m["content"] for m in messages)
+        vector = np.asarray(self.embedder(flat_prompt), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _find_similar(self, query: np.ndarray, temperature: float) -> Optional[tuple]:
+        """Return the key of the most similar cached prompt above the threshold."""
+        if not self.emb_rows:
+            return None
+
+        sims = self.embeddings @ query
+        sims[self.emb_temperatures != temperature] = -1.0
+        best = int(np.argmax(sims))
+        return self.emb_keys[best] if sims[best] >= self.similarity_threshold else None
+
+    def _store_embedding(self, cache_key: tuple, query: np.ndarray, temperature: float) -> None:
+        """Write an embedding into a free row of the preallocated matrix."""
+        if self.embeddings is None:
+            self.embeddings = np.zeros((self.maxsize, query.shape[0]), dtype=np.float32)
+            self.emb_temperatures = np.full(self.maxsize, np.nan)
+            self.emb_keys = [None] * self.maxsize
+            self.free_rows = list(range(self.maxsize - 1, -1, -1))
+
+        row = self.free_rows.pop()
+        self.embeddings[row] = query
+        self.emb_temperatures[row] = temperature
+        self.emb_keys[row] = cache_key
+        self.emb_rows[cache_key] = row
+
+    def _remember(self, cache_key: tuple, response: Dict[str, Any]) -> None:
+        """Insert into the in-memory LRU, evicting the least recently used entry when full."""
+        self.cache[cache_key] = response
+        self.cache.move_to_end(cache_key)
+        if len(self.cache) > self.maxsize:
+            evicted_key, _ = self.cache.popitem(last=False)
+            self._forget_embedding(evicted_key)
+
+    def _load(self, db_key: str) -> Optional[Dict[str, Any]]:
+        """Look up a response in the persistent cache."""
+        row = self._db.execute("SELECT value FROM responses WHERE key = ?", (db_key,)).fetchone()
+        if not row:
+            return None
+        return orjson.loads(row[0]) if orjson is not None else json.loads(row[0])
+
+    def _forget_embedding(self, cache_key: tuple) -> None:
+        """Free the embedding row of an evicted entry for reuse."""
+        row = self.emb_rows.pop(cache_key, None)
+        if row is not None:
+            self.emb_keys[row] = None
+            self.emb_temperatures[row] = np.nan
+            self.free_rows.append(row)
 
     def complete_chat(self, messages: List[Dict], temperature: float = 0.3) -> Dict[str, Any]:
         """Complete chat with caching."""
@@ -128,74 +372,237 @@ class CachingLLMClient:
         # Check cache
         if cache_key in self.cache:
             print("  (using cached response)")
+            self.hits += 1
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
 
+        # Check persistent cache
+        db_key = None
+        if self._db is not None:
+            db_key = self._persistent_key(cache_key)
+            response = self._load(db_key)
+            if response is not None:
+                print("  (using persisted response)")
+                self.hits += 1
+                self._remember(cache_key, response)
+                return response
+
+        # Check semantic tier
+        query = None
+        if self.embedder is not None:
+            query = self._embed(messages)
+            similar_key = self._find_similar(query, temperature)
+            if similar_key is not None:
+                print("  (using semantically similar cached response)")
+                self.hits += 1
+                self.semantic_hits += 1
+                self.cache.move_to_end(similar_key)
+                return self.cache[similar_key]
+
         # Call API
-        response = self.base_client.complete_chat(messages, temperature)
+        self.misses += 1
+        response = self._complete(messages, temperature)
 
         # Cache response
-        self.cache[cache_key] = response
+        if db_key is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (db_key, _json_bytes(response)),
+            )
+        # Evict first, so a full matrix has a free row for the new embedding
+        self._remember(cache_key, response)
+        if query is not None:
+            self._store_embedding(cache_key, query, temperature)
 
         return response
 
     def clear_cache(self):
         """Clear the response cache."""
         self.cache.clear()
+        self.emb_keys = []
+        self.emb_rows.clear()
+        self.emb_temperatures = None
+        self.embeddings = None
+        self.free_rows = []
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the persistent cache."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
     def cache_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
-        return {"cached_responses": len(self.cache)}
+        return {
+            "cached_responses": len(self.cache),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+
+def bag_of_words_embedder(text: str, dim: int = 256) -> np.ndarray:
+    """Toy embedder (hashed word counts); use a real embedding model in practice."""
+    vector = np.zeros(dim, dtype=np.float32)
+    for word in text.lower().split():
+        vector[zlib.crc32(word.encode()) % dim] += 1.0
+    return vector
 
 
 class TokenCountingLLMClient:
     """
     LLM client that tracks token usage.
 
-    Useful for monitoring API costs and usage patterns.
+    Useful for monitoring API costs and usage patterns. Tokens are counted
+    with tiktoken when it is installed (4 chars ≈ 1 token otherwise), and
+    per-message counts are memoized so a conversation history resent on
+    every turn is only tokenized once.
+
+    Pass shared=TokenCountingLLMClient.shared_counters() to clients in
+    several worker processes (e.g. via a pool initializer) to report usage
+    across all of them.
     """
 
-    def __init__(self, base_client):
-        """Initialize token counting client."""
+    __slots__ = ("base_client", "encoding", "_count_tokens", "_complete", "_counters", "_lock")
+
+    def __init__(
+        self,
+        base_client,
+        model: str = "gpt-3.5-turbo",
+        count_cache_size: int = 4096,
+        shared: Optional[Any] = None,
+    ):
+        """
+        Initialize token counting client.
+
+        Args:
+            base_client: Underlying LLM client
+            model: Model name used to pick the tiktoken encoding
+            count_cache_size: Number of per-message token counts to memoize
+            shared: Optional counters from shared_counters(), shared between
+                    processes; by default counts are local to this client
+        """
         self.base_client = base_client
-        self.total_input_tokens = 0
-        self.total_output_tokens = 0
-        self.request_count = 0
+        self._complete = base_client.complete_chat
+
+        # [input tokens, output tokens, requests]
+        if shared is not None:
+            self._counters = shared
+            self._lock = shared.get_lock()
+        else:
+            self._counters = [0, 0, 0]
+            self._lock = threading.Lock()
+
+        try:
+            import tiktoken
+
+            self.encoding = tiktoken.encoding_for_model(model)
+        except ImportError:
+            self.encoding = None
+        except KeyError:
+            self.encoding = tiktoken.get_encoding("cl100k_base")
+
+        # Keyed by message text: identical history messages hit the cache
+        self._count_tokens = lru_cache(maxsize=count_cache_size)(self._estimate_tokens)
 
     def _estimate_tokens(self, text: str) -> int:
-        """Rough estimate of token count (4 chars ≈ 1 token)."""
+        """Count tokens with tiktoken, or estimate them (4 chars ≈ 1 token)."""
+        if self.encoding is not None:
+            return len(self.encoding.encode_ordinary(text))
         return len(text) // 4
 
+    @staticmethod
+    def shared_counters():
+        """Create usage counters in shared memory, for clients in several processes."""
+        return multiprocessing.Array("q", 3)
+
+    @property
+    def total_input_tokens(self) -> int:
+        """Input tokens counted so far."""
+        return self._counters[0]
+
+    @property
+    def total_output_tokens(self) -> int:
+        """Output tokens counted so far."""
+        return self._counters[1]
+
+    @property
+    def request_count(self) -> int:
+        """Requests counted so far."""
+        return self._counters[2]
+
+    def _record(self, input_tokens: int, output_tokens: int) -> None:
+        """Add one request's token counts to the (possibly shared) counters."""
+        with self._lock:
+            self._counters[0] += input_tokens
+            self._counters[1] += output_tokens
+            self._counters[2] += 1
+
+    def _count_input_tokens(self, messages: List[Dict]) -> int:
+        """Sum per-message token counts without joining the messages."""
+        if self.encoding is None:
+            # Same estimate as len(" ".join(contents)) // 4, without building the
+            # string; len() is O(1), so this skips the memo and its hashing too
+            chars = sum(len(m.get("content", "")) for m in messages)
+            return (chars + max(len(messages) - 1, 0)) // 4
+        return sum(self._count_tokens(m.get("content", "")) for m in messages)
+
     def complete_chat(self, messages: List[Dict], temperature: float = 0.3) -> Dict[str, Any]:
         """Complete chat with token tracking."""
-        # Estimate input tokens
-        input_text = " ".join([m.get("content", "") for m in messages])
-        input_tokens = self._estimate_tokens(input_text)
+        input_tokens = self._count_input_tokens(messages)
 
         # Call API
-        response = self.base_client.complete_chat(messages, temperature)
+        response = self._complete(messages, temperature)
 
-        # Estimate output tokens
-        output_text = response.get("content", "")
-        output_tokens = self._estimate_tokens(output_text)
+        # Output is new text each time, so it bypasses the memo
+        output_tokens = self._estimate_tokens(response.get("content", ""))
 
         # Update statistics
-        self.total_input_tokens += input_tokens
-        self.total_output_tokens += output_tokens
-        self.request_count += 1
+        self._record(input_tokens, output_tokens)
 
         print(f"  Tokens: {input_tokens} in, {output_tokens} out")
 
         return response
 
+    def complete_chat_batch(
+        self, batch_messages: List[List[Dict]], temperature: float = 0.3
+    ) -> List[Dict[str, Any]]:
+        """
+        Complete several chats, tracking tokens per chat.
+
+        Uses one base-client complete_chat_batch() call when the base client
+        supports it, and one complete_chat() call per chat otherwise.
+        """
+        complete_batch = getattr(self.base_client, "complete_chat_batch", None)
+        if complete_batch is not None:
+            responses = complete_batch(batch_messages, temperature)
+        else:
+            responses = [self._complete(messages, temperature) for messages in batch_messages]
+
+        for messages, response in zip(batch_messages, responses):
+            input_tokens = self._count_input_tokens(messages)
+            output_tokens = self._estimate_tokens(response.get("content", ""))
+            self._record(input_tokens, output_tokens)
+
+            print(f"  Tokens: {input_tokens} in, {output_tokens} out")
+
+        return responses
+
     def usage_stats(self) -> Dict[str, Any]:
         """Get usage statistics."""
+        with self._lock:
+            input_tokens, output_tokens, requests = self._counters[:]
+
         return {
-            "total_requests": self.request_count,
-            "total_input_tokens": self.total_input_tokens,
-            "total_output_tokens": self.total_output_tokens,
-            "total_tokens": self.total_input_tokens + self.total_output_tokens,
-            "avg_input_tokens": self.total_input_tokens / max(self.request_count, 1),
-            "avg_output_tokens": self.total_output_tokens / max(self.request_count, 1),
+            "total_requests": requests,
+            "total_input_tokens": input_tokens,
+            "total_output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "avg_input_tokens": input_tokens / max(requests, 1),
+            "avg_output_tokens": output_tokens / max(requests, 1),
         }
 
 
@@ -206,6 +613,17 @@ class MockLLMClient:
         """Return mock response."""
         return {"content": "This is a mock LLM response summarizing the document content."}
 
+    def complete_chat_batch(
+        self, batch_messages: List[List[Dict]], temperature: float = 0.3
+    ) -> List[Dict[str, Any]]:
+        """
+        Return one mock response per chat.
+
+        A real client would send all chats in one request, e.g. through the
+        provider's batch endpoint or by gathering async requests.
+        """
+        return [self.complete_chat(messages, temperature) for messages in batch_messages]
+
 
 def example_retry_logic():
     """Demonstrate retry logic with LLM client."""
@@ -233,11 +651,17 @@ def example_retry_logic():
 
     try:
         summary = processor.summarize_text(sample_text, "test.txt")
-        print(f"\nSuccessfully generated summary after retries!")
+        print("\nSuccessfully generated summary after retries!")
         print(f"Summary: {summary}")
     except Exception as e:
         print(f"\nFailed: {e}")
 
+    # Concurrent summaries use acomplete_chat(): while one request backs off,
+    # the others keep running on the event loop
+    base_client.attempts = 0
+    summaries = processor.summarize_texts([sample_text] * 3, ["a.txt", "b.txt", "c.txt"])
+    print(f"\nConcurrent summaries: {len(summaries)} generated")
+
 
 def example_multi_provider():
     """Demonstrate multi-provider fallback."""
@@ -261,9 +685,21 @@ def example_multi_provider():
     sample_text = "Test document for fallback. " * 20
 
     summary = processor.summarize_text(sample_text, "test.txt")
-    print(f"\nGenerated summary using fallback provider:")
+    print("\nGenerated summary using fallback provider:")
     print(f"Summary: {summary}")
 
+    class SlowProvider:
+        def complete_chat(self, messages, temperature):
+            time.sleep(2.0)  # Hangs close to its timeout
+            return {"content": "Slow provider succeeded."}
+
+    # Race mode: the slow primary no longer adds its full latency
+    racing = MultiProviderLLMClient([SlowProvider(), WorkingProvider()], mode="race")
+
+    start = time.perf_counter()
+    summary = DocumentProcessor(llm_client=racing).summarize_text(sample_text, "test.txt")
+    print(f"\nRace mode answered in {time.perf_counter() - start:.2f}s: {summary}")
+
 
 def example_caching():
     """Demonstrate response caching."""
@@ -289,6 +725,32 @@ def example_caching():
     print(f"\nSummaries match: {summary1 == summary2}")
     print(f"Cache stats: {caching_client.cache_stats()}")
 
+    # Semantic tier: a near-identical document reuses the cached response
+    semantic_client = CachingLLMClient(base_client, embedder=bag_of_words_embedder)
+    semantic_processor = DocumentProcessor(llm_client=semantic_client)
+
+    print("\nSemantic cache, original text:")
+    semantic_processor.summarize_text(sample_text, "test.txt")
+
+    print("\nSemantic cache, slightly edited text:")
+    semantic_processor.summarize_text(sample_text + "One more sentence.", "test.txt")
+
+    print(f"Semantic cache stats: {semantic_client.cache_stats()}")
+
+    # Persistent cache: responses survive a restart
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache_path = os.path.join(cache_dir, "llm_cache.db")
+
+        print("\nPersistent cache, first run:")
+        first_run = CachingLLMClient(base_client, path=cache_path)
+        DocumentProcessor(llm_client=first_run).summarize_text(sample_text, "test.txt")
+        first_run.close()
+
+        print("\nPersistent cache, second run:")
+        second_run = CachingLLMClient(base_client, path=cache_path)
+        DocumentProcessor(llm_client=second_run).summarize_text(sample_text, "test.txt")
+        second_run.close()
+
 
 def example_token_tracking():
     """Demonstrate token usage tracking."""
@@ -308,9 +770,9 @@ def example_token_tracking():
         "Long document. " * 200,
     ]
 
-    for i, text in enumerate(documents, 1):
-        print(f"\nProcessing document {i}:")
-        processor.summarize_text(text, f"doc{i}.txt")
+    # One batched LLM round-trip instead of one request per document
+    print("\nProcessing documents in one batch:")
+    processor.summarize_batch(documents, [f"doc{i}.txt" for i in range(1, len(documents) + 1)])
 
     # Print usage statistics
     stats = tracking_client.usage_stats()
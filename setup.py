@@ -43,6 +43,9 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-mock>=3.10.0",
+            "pytest-xdist>=3.5.0",
         ],
+        "semantic": ["sentence-transformers>=2.2.0"],
+        "fast": ["orjson>=3.8.0"],
     },
 )
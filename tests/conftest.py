@@ -2,21 +2,29 @@
 Pytest configuration and shared fixtures for docprocessor tests.
 """
 
-import tempfile
-from pathlib import Path
+import json
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Dict
 
 import pytest
 
+from docprocessor.core.extractor import ContentExtractor
 
-@pytest.fixture
-def tmp_path():
-    """Provide a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+# Read-only mock responses, shared instead of rebuilt on every call
+_LLM_RESPONSE = MappingProxyType({"content": "This is a mock summary of the document content."})
+_ENQUEUED_TASKS = tuple(
+    MappingProxyType({"status": "enqueued", "taskUid": uid}) for uid in range(5)
+)
 
 
-@pytest.fixture
+@lru_cache(maxsize=16)
+def _empty_search_result(limit):
+    """Mock search response for a query without hits."""
+    return MappingProxyType({"hits": [], "limit": limit, "offset": 0})
+
+
+@pytest.fixture(scope="session")
 def sample_text():
     """Provide sample text for testing."""
     return """
@@ -45,75 +53,222 @@ def sample_txt_file(tmp_path, sample_text):
     return file_path
 
 
-@pytest.fixture
-def long_text():
+@pytest.fixture(scope="session")
+def long_text_file(tmp_path_factory):
+    """Provide a file of longer text, streamed to disk paragraph by paragraph."""
+    path = tmp_path_factory.mktemp("long") / "long.txt"
+    with open(path, "wb", buffering=1 << 16) as f:
+        for i in range(20):
+            if i:
+                f.write(b"\n\n")
+            f.write(f"This is paragraph number {i}. ".encode() * 50)
+    return path
+
+
+@pytest.fixture(scope="session")
+def long_text(long_text_file):
     """Provide longer text for chunking tests."""
-    paragraphs = [f"This is paragraph number {i}. " * 50 for i in range(20)]
-    return "\n\n".join(paragraphs)
+    return long_text_file.read_text()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_llm_client():
     """Mock LLM client for testing."""
 
     class MockLLMClient:
         def complete_chat(self, messages: list, temperature: float = 0.3) -> Dict[str, Any]:
             """Mock LLM completion."""
-            return {"content": "This is a mock summary of the document content."}
+            return _LLM_RESPONSE
 
     return MockLLMClient()
 
 
-@pytest.fixture
-def pdf_with_text_content(tmp_path):
-    """Create a minimal PDF with text content for testing."""
-    # Note: This requires reportlab, which should be added as a dev dependency
-    # For now, we'll skip this fixture if reportlab is not available
-    try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-
-        pdf_path = tmp_path / "sample.pdf"
-        c = canvas.Canvas(str(pdf_path), pagesize=letter)
-        c.drawString(100, 750, "Test PDF Document")
-        c.drawString(100, 700, "This is a test PDF with some text content.")
-        c.drawString(100, 650, "It contains multiple lines of text.")
-        c.showPage()
-        c.save()
-
-        return pdf_path
-    except ImportError:
-        pytest.skip("reportlab not installed, skipping PDF fixture")
+@pytest.fixture(scope="session")
+def pdf_with_text_content(tmp_path_factory):
+    """Create a minimal PDF with text content for testing (built once per session)."""
+    # Note: This requires reportlab (a dev dependency); skip if it is not available
+    canvas = pytest.importorskip("reportlab.pdfgen.canvas")
+    letter = pytest.importorskip("reportlab.lib.pagesizes").letter
 
+    pdf_path = tmp_path_factory.mktemp("pdf") / "sample.pdf"
+    c = canvas.Canvas(str(pdf_path), pagesize=letter)
+    c.drawString(100, 750, "Test PDF Document")
+    c.drawString(100, 700, "This is a test PDF with some text content.")
+    c.drawString(100, 650, "It contains multiple lines of text.")
+    c.showPage()
+    c.save()
+
+    return pdf_path
+
+
+@pytest.fixture(scope="session")
+def docx_rich_sample(tmp_path_factory):
+    """DOCX with two paragraphs, two blank paragraphs and a 2x2 table (built once per session)."""
+    Document = pytest.importorskip("docx").Document
+
+    docx_file = tmp_path_factory.mktemp("docx") / "test.docx"
+    doc = Document()
+    doc.add_paragraph("First paragraph")
+    doc.add_paragraph("")  # Empty
+    doc.add_paragraph("   ")  # Whitespace only
+    doc.add_paragraph("Second paragraph")
+
+    # Add table
+    table = doc.add_table(rows=2, cols=2)
+    table.cell(0, 0).text = "Header 1"
+    table.cell(0, 1).text = "Header 2"
+    table.cell(1, 0).text = "Data 1"
+    table.cell(1, 1).text = "Data 2"
+
+    doc.save(str(docx_file))
+    return docx_file
+
+
+@pytest.fixture(scope="session")
+def docx_rich_extracted(docx_rich_sample):
+    """Extraction result for docx_rich_sample, computed once per session."""
+    return ContentExtractor().extract(docx_rich_sample)
+
+
+@pytest.fixture(scope="session")
+def corrupt_docx(tmp_path_factory):
+    """File with a .docx extension that is not a real DOCX (built once per session)."""
+    pytest.importorskip("docx")
+
+    bad_docx = tmp_path_factory.mktemp("docx") / "corrupt.docx"
+    bad_docx.write_bytes(b"not a real docx file")
+    return bad_docx
+
+
+@pytest.fixture(scope="session")
+def pptx_with_content_file(tmp_path_factory):
+    """PPTX with two title-and-content slides (built once per session)."""
+    Presentation = pytest.importorskip("pptx").Presentation
+
+    pptx_file = tmp_path_factory.mktemp("pptx") / "test.pptx"
+    prs = Presentation()
+
+    # Add slide 1 with title and content
+    slide_layout = prs.slide_layouts[1]  # Title and content layout
+    slide1 = prs.slides.add_slide(slide_layout)
+    slide1.shapes.title.text = "First Slide Title"
+    slide1.placeholders[1].text = "This is the content of the first slide."
+
+    # Add slide 2 with different content
+    slide2 = prs.slides.add_slide(slide_layout)
+    slide2.shapes.title.text = "Second Slide Title"
+    slide2.placeholders[1].text = "This is the content of the second slide."
+
+    prs.save(str(pptx_file))
+    return pptx_file
 
-@pytest.fixture
-def mock_meilisearch_client():
-    """Mock Meilisearch client for testing."""
+
+@pytest.fixture(scope="session")
+def pptx_with_tables_file(tmp_path_factory):
+    """PPTX with one slide holding a 3x2 table (built once per session)."""
+    Presentation = pytest.importorskip("pptx").Presentation
+    Inches = pytest.importorskip("pptx.util").Inches
+
+    pptx_file = tmp_path_factory.mktemp("pptx") / "table_test.pptx"
+    prs = Presentation()
+
+    # Add slide with blank layout
+    blank_layout = prs.slide_layouts[6]  # Blank layout
+    slide = prs.slides.add_slide(blank_layout)
+
+    # Add a table
+    table_shape = slide.shapes.add_table(3, 2, Inches(2), Inches(2), Inches(4), Inches(2))
+    table = table_shape.table
+
+    # Fill table with data
+    table.cell(0, 0).text = "Header 1"
+    table.cell(0, 1).text = "Header 2"
+    table.cell(1, 0).text = "Row 1 Col 1"
+    table.cell(1, 1).text = "Row 1 Col 2"
+    table.cell(2, 0).text = "Row 2 Col 1"
+    table.cell(2, 1).text = "Row 2 Col 2"
+
+    prs.save(str(pptx_file))
+    return pptx_file
+
+
+@pytest.fixture(scope="session")
+def pptx_with_notes_file(tmp_path_factory):
+    """PPTX with one slide that has speaker notes (built once per session)."""
+    Presentation = pytest.importorskip("pptx").Presentation
+
+    pptx_file = tmp_path_factory.mktemp("pptx") / "notes_test.pptx"
+    prs = Presentation()
+
+    slide_layout = prs.slide_layouts[1]
+    slide = prs.slides.add_slide(slide_layout)
+    slide.shapes.title.text = "Slide with Notes"
+
+    # Add speaker notes
+    notes_slide = slide.notes_slide
+    notes_slide.notes_text_frame.text = "These are important speaker notes for the presentation."
+
+    prs.save(str(pptx_file))
+    return pptx_file
+
+
+@pytest.fixture(scope="session")
+def empty_pptx_file(tmp_path_factory):
+    """PPTX without slides (built once per session)."""
+    Presentation = pytest.importorskip("pptx").Presentation
+
+    pptx_file = tmp_path_factory.mktemp("pptx") / "empty.pptx"
+    Presentation().save(str(pptx_file))
+    return pptx_file
+
+
+@pytest.fixture(scope="session")
+def corrupt_pptx(tmp_path_factory):
+    """File with a .pptx extension that is not a real PPTX (built once per session)."""
+    pytest.importorskip("pptx")
+
+    bad_pptx = tmp_path_factory.mktemp("pptx") / "corrupt.pptx"
+    bad_pptx.write_bytes(b"not a real pptx file")
+    return bad_pptx
+
+
+@pytest.fixture(scope="session")
+def _meilisearch_client():
+    """Mock Meilisearch client shared by the whole session; use mock_meilisearch_client."""
 
     class MockIndex:
+        # Tests that inspect indexed contents opt in; others only get a count
+        record_documents = False
+
         def __init__(self, name):
             self.name = name
             self.documents = []
+            self.doc_count = 0
             self.settings = {}
 
         def add_documents(self, documents, primary_key=None):
-            self.documents.extend(documents)
-            return {"status": "enqueued", "taskUid": 1}
+            self.doc_count += len(documents)
+            if self.record_documents:
+                self.documents.extend(documents)
+            return _ENQUEUED_TASKS[1]
+
+        def add_documents_raw(self, body, primary_key=None, content_type=None):
+            return self.add_documents(json.loads(body), primary_key)
 
         def search(self, query, options=None):
             # Extract limit from options if provided
             limit = options.get("limit", 20) if options else 20
-            return {"hits": [], "limit": limit, "offset": 0}
+            return _empty_search_result(limit)
 
         def delete_document(self, doc_id):
-            return {"status": "enqueued", "taskUid": 2}
+            return _ENQUEUED_TASKS[2]
 
         def delete_documents(self, filter_dict):
-            return {"status": "enqueued", "taskUid": 3}
+            return _ENQUEUED_TASKS[3]
 
         def update_settings(self, settings):
             self.settings.update(settings)
-            return {"status": "enqueued", "taskUid": 4}
+            return _ENQUEUED_TASKS[4]
 
     class MockClient:
         def __init__(self):
@@ -133,6 +288,16 @@ def mock_meilisearch_client():
 
         def create_index(self, name, options=None):
             self.indexes[name] = MockIndex(name)
-            return {"status": "enqueued", "taskUid": 0}
+            return _ENQUEUED_TASKS[0]
+
+        def is_healthy(self):
+            return True
 
     return MockClient()
+
+
+@pytest.fixture
+def mock_meilisearch_client(_meilisearch_client):
+    """Mock Meilisearch client for testing, with no indexes left over from other tests."""
+    _meilisearch_client.indexes.clear()
+    return _meilisearch_client
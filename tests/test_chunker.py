@@ -2,7 +2,15 @@
 Tests for DocumentChunker.
 """
 
-from docprocessor.core.chunker import DocumentChunk, DocumentChunker
+import pytest
+
+from docprocessor.core.chunker import (
+    _UNLOADED,
+    ChunkBatch,
+    ChunkStats,
+    DocumentChunk,
+    DocumentChunker,
+)
 
 
 class TestDocumentChunker:
@@ -109,14 +117,11 @@ class TestDocumentChunker:
     def test_chunk_text_with_page_markers(self):
         """Test chunking text with PDF page markers."""
         chunker = DocumentChunker()
-        text_with_markers = (
-            """
+        text_with_markers = """
         <page_1>This is page one content.
         <page_2>This is page two content.
         <page_3>This is page three content.
-        """
-            * 10
-        )
+        """ * 10
 
         chunks = chunker.chunk_document(
             text=text_with_markers,
@@ -170,6 +175,13 @@ class TestDocumentChunker:
         assert token_count > 0
         assert isinstance(token_count, int)
 
+    def test_tokenizer_loaded_on_first_use(self):
+        """Test constructing a chunker does not load the tokenizer."""
+        chunker = DocumentChunker()
+
+        assert chunker._tokenizer is _UNLOADED
+        assert chunker.tokenizer is chunker._tokenizer
+
     def test_count_tokens_without_tokenizer(self, monkeypatch):
         """Test token counting fallback without tiktoken."""
         chunker = DocumentChunker()
@@ -252,6 +264,184 @@ class TestDocumentChunker:
             assert len(first_chunk_end) > 0
             assert len(second_chunk_start) > 0
 
+    def test_text_splitter_reused(self):
+        """Test the text splitter is built once and rebuilt only when sizes change."""
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10)
+
+        splitter = chunker._get_text_splitter()
+        assert chunker._get_text_splitter() is splitter
+
+        chunker.chunk_size = 200
+        assert chunker._get_text_splitter() is not splitter
+
+    def test_fallback_windower_reused(self, long_text):
+        """Test the fallback window loop is specialized once per chunk size."""
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10)
+
+        first = chunker._split_text_fallback(long_text)
+        windower = chunker._windower
+        assert chunker._split_text_fallback(long_text) == first
+        assert chunker._windower is windower
+
+        chunker.chunk_size = 50
+        smaller = chunker._split_text_fallback(long_text)
+        assert chunker._windower is not windower
+        assert len(smaller) > len(first)
+
+    def test_fallback_split_stops_at_end(self):
+        """Test fallback splitting emits no overlap-only tail windows."""
+        chunker = DocumentChunker(chunk_size=10, chunk_overlap=5)
+        text = " ".join(f"w{i:03d}" for i in range(100))
+
+        chunks = chunker._split_text_fallback(text)
+
+        assert chunks[-1].endswith(text[-10:])
+        assert all(chunk not in previous for previous, chunk in zip(chunks, chunks[1:]))
+        assert len(chunks) == 24
+
+    def test_fallback_split_high_overlap_terminates(self):
+        """Test fallback splitting makes progress when overlap exceeds sentence backoff."""
+        chunker = DocumentChunker(chunk_size=10, chunk_overlap=9)
+        text = "Ab. " * 200
+
+        chunks = chunker._split_text_fallback(text)
+
+        assert 0 < len(chunks) <= len(text)
+        assert chunks[-1].endswith("Ab. ")
+
+    def test_estimate_tokens_without_tokenizer(self):
+        """Test token estimation fallback when tiktoken is unavailable."""
+        chunker = DocumentChunker()
+        chunker.tokenizer = None
+
+        assert chunker._count_tokens("a" * 400) == 100
+        assert chunker._count_tokens_batch(["a" * 40, "b" * 8]) == [10, 2]
+
+    def test_token_counts_use_single_batch_call(self, long_text):
+        """Test token counts for all chunks come from one batched tokenizer call."""
+
+        class WordTokenizer:
+            def __init__(self):
+                self.batch_calls = 0
+
+            def encode_ordinary_batch(self, texts):
+                self.batch_calls += 1
+                return [text.split() for text in texts]
+
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+        chunker.tokenizer = WordTokenizer()
+
+        chunks = chunker.chunk_document(
+            text=long_text,
+            file_id="file-123",
+            output_id="output-456",
+            project_id=789,
+            filename="test.txt",
+        )
+
+        assert chunker.tokenizer.batch_calls == 1
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.token_count == len(chunk.chunk_text.split())
+
+    def test_iter_chunks_is_lazy(self, long_text):
+        """Test iter_chunks yields the same chunks as chunk_document, lazily."""
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+        stats = ChunkStats()
+
+        iterator = chunker.iter_chunks(
+            long_text, "file-123", "output-456", 789, "test.txt", stats=stats
+        )
+        first = next(iterator)
+
+        assert stats.total_chunks == 1
+        streamed = [first, *iterator]
+        chunks = chunker.chunk_document(long_text, "file-123", "output-456", 789, "test.txt")
+        assert [c.chunk_text for c in streamed] == [c.chunk_text for c in chunks]
+        assert [c.chunk_number for c in streamed] == list(range(len(chunks)))
+        assert all(c.total_chunks == len(chunks) for c in streamed)
+
+    def test_chunk_document_collects_stats(self, long_text):
+        """Test running stats are updated for each emitted chunk."""
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+        stats = ChunkStats()
+
+        chunks = chunker.chunk_document(
+            text=long_text,
+            file_id="file-123",
+            output_id="output-456",
+            project_id=789,
+            filename="test.txt",
+            stats=stats,
+        )
+
+        token_counts = [chunk.token_count for chunk in chunks]
+        assert stats.total_chunks == len(chunks)
+        assert stats.total_tokens == sum(token_counts)
+        assert stats.min_tokens == min(token_counts)
+        assert stats.max_tokens == max(token_counts)
+        assert stats.mean_tokens == sum(token_counts) / len(chunks)
+
+
+class TestChunkStats:
+    """Tests for ChunkStats dataclass."""
+
+    def test_empty_stats(self):
+        """Test stats before any chunk is recorded."""
+        stats = ChunkStats()
+
+        assert stats.total_chunks == 0
+        assert stats.mean_tokens == 0.0
+
+    def test_add(self):
+        """Test recording chunks updates all statistics."""
+        stats = ChunkStats()
+
+        for token_count in (120, 80, 100):
+            stats.add(token_count)
+
+        assert stats.total_chunks == 3
+        assert stats.total_tokens == 300
+        assert stats.min_tokens == 80
+        assert stats.max_tokens == 120
+        assert stats.mean_tokens == 100.0
+
+
+class TestChunkBatch:
+    """Tests for ChunkBatch class."""
+
+    def test_from_chunks(self, long_text):
+        """Test chunk attributes are gathered into columns."""
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+        chunks = chunker.chunk_document(long_text, "file-123", "output-456", 789, "test.txt")
+
+        batch = ChunkBatch.from_chunks(chunks)
+
+        assert len(batch) == len(chunks)
+        assert batch.texts == [chunk.chunk_text for chunk in chunks]
+        assert batch.token_counts.tolist() == [chunk.token_count for chunk in chunks]
+        assert batch.chunk_numbers.tolist() == list(range(len(chunks)))
+        assert batch.token_counts.mean() == sum(c.token_count for c in chunks) / len(chunks)
+        assert batch.embeddings is None
+
+    def test_to_search_documents_matches_chunker(self, long_text):
+        """Test batch documents match per-chunk conversion, including embeddings."""
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+        chunks = chunker.chunk_document(long_text, "file-123", "output-456", 789, "test.txt")
+        for chunk in chunks:
+            chunk.embedding = [0.5, 0.25]
+
+        documents = ChunkBatch.from_chunks(chunks).to_search_documents()
+
+        assert documents == [chunker.to_search_document(chunk) for chunk in chunks]
+
+    def test_empty_batch(self):
+        """Test a batch built from no chunks."""
+        batch = ChunkBatch.from_chunks([])
+
+        assert len(batch) == 0
+        assert batch.to_search_documents() == []
+
 
 class TestDocumentChunk:
     """Tests for DocumentChunk dataclass."""
@@ -283,3 +473,23 @@ class TestDocumentChunk:
         assert chunk.token_count == 20
         assert chunk.pages == [1, 2]
         assert chunk.metadata["key"] == "value"
+
+    def test_document_chunk_uses_slots(self):
+        """Test DocumentChunk has no per-instance __dict__."""
+        chunk = DocumentChunk(
+            chunk_id="chunk-123",
+            file_id="file-456",
+            output_id="output-789",
+            project_id=1,
+            filename="test.txt",
+            chunk_number=0,
+            total_chunks=1,
+            chunk_text="This is chunk text.",
+            token_count=5,
+            pages=[],
+            metadata={},
+        )
+
+        assert not hasattr(chunk, "__dict__")
+        with pytest.raises(AttributeError):
+            chunk.unknown_field = "value"
@@ -0,0 +1,97 @@
+"""
+Tests for ExtractionCache.
+"""
+
+import os
+
+from docprocessor import DocumentProcessor
+from docprocessor.core.extraction_cache import ExtractionCache
+from docprocessor.core.extractor import ContentExtractor
+
+
+class TestExtractionCache:
+    """Tests for ExtractionCache class."""
+
+    def test_miss(self, tmp_path, sample_txt_file):
+        """Test lookup of a file that was never stored."""
+        cache = ExtractionCache(tmp_path / "cache")
+
+        assert cache.get(sample_txt_file) is None
+
+    def test_set_and_get(self, tmp_path, sample_txt_file):
+        """Test stored extractions are returned and persisted as JSON."""
+        cache = ExtractionCache(tmp_path / "cache")
+        extraction = {"text": "Hello", "page_count": 1, "metadata": {"format": "txt"}}
+
+        cache.set(sample_txt_file, extraction)
+
+        assert cache.get(sample_txt_file) == extraction
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+    def test_persistence(self, tmp_path, sample_txt_file):
+        """Test a new cache instance reads entries from disk."""
+        extraction = {"text": "Hello", "page_count": 1, "metadata": {}}
+        ExtractionCache(tmp_path / "cache").set(sample_txt_file, extraction)
+
+        assert ExtractionCache(tmp_path / "cache").get(sample_txt_file) == extraction
+
+    def test_invalidated_on_modification(self, tmp_path, sample_txt_file):
+        """Test a modified file does not hit the old entry."""
+        cache = ExtractionCache(tmp_path / "cache")
+        cache.set(sample_txt_file, {"text": "Old", "page_count": 1, "metadata": {}})
+
+        sample_txt_file.write_text("New content for the file.")
+        stat = sample_txt_file.stat()
+        os.utime(sample_txt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.get(sample_txt_file) is None
+
+    def test_returned_metadata_is_a_copy(self, tmp_path, sample_txt_file):
+        """Test mutating a returned extraction does not change the cache."""
+        cache = ExtractionCache(tmp_path / "cache")
+        cache.set(sample_txt_file, {"text": "Hello", "page_count": 1, "metadata": {}})
+
+        cache.get(sample_txt_file)["metadata"]["added"] = True
+
+        assert cache.get(sample_txt_file)["metadata"] == {}
+
+    def test_clear(self, tmp_path, sample_txt_file):
+        """Test clearing the cache."""
+        cache = ExtractionCache(tmp_path / "cache")
+        cache.set(sample_txt_file, {"text": "Hello", "page_count": 1, "metadata": {}})
+
+        cache.clear()
+
+        assert cache.get(sample_txt_file) is None
+
+
+class TestExtractorCaching:
+    """Tests for extraction caching in ContentExtractor and DocumentProcessor."""
+
+    def test_extractor_skips_cached_files(self, tmp_path, sample_txt_file, monkeypatch):
+        """Test a cached file is not extracted again."""
+        extractor = ContentExtractor(cache=ExtractionCache(tmp_path / "cache"))
+        first = extractor.extract(sample_txt_file)
+
+        def fail(file_path):
+            raise AssertionError("file should not be extracted again")
+
+        monkeypatch.setattr(extractor, "_extract_text", fail)
+
+        assert extractor.extract(sample_txt_file) == first
+
+    def test_processor_extraction_cache(self, tmp_path, sample_txt_file):
+        """Test processors sharing a cache directory reuse extractions."""
+        cache_dir = tmp_path / "cache"
+
+        DocumentProcessor(extraction_cache=True, cache_dir=cache_dir).process(sample_txt_file)
+        result = DocumentProcessor(extraction_cache=True, cache_dir=cache_dir).process(
+            sample_txt_file
+        )
+
+        assert len(list(cache_dir.glob("*.json"))) == 1
+        assert result.text == sample_txt_file.read_text()
+
+    def test_processor_cache_disabled_by_default(self):
+        """Test the extraction cache is opt-in."""
+        assert DocumentProcessor().extractor.cache is None
@@ -2,12 +2,16 @@
 Tests for ContentExtractor.
 """
 
+import sys
 from pathlib import Path
 
 import pytest
 
 from docprocessor.core.extractor import ContentExtractionError, ContentExtractor
 
+# Pre-encoded once; the content is deterministic
+LARGE_CONTENT = b"Line of text.\n" * 10000
+
 
 class TestContentExtractor:
     """Tests for ContentExtractor class."""
@@ -74,6 +78,26 @@ class TestContentExtractor:
 
         assert len(result["text"]) > 0
 
+    def test_extract_empty_text_file(self, tmp_path):
+        """Test extracting an empty text file."""
+        empty_file = tmp_path / "empty.txt"
+        empty_file.write_bytes(b"")
+
+        extractor = ContentExtractor()
+        result = extractor.extract(empty_file)
+
+        assert result["text"] == ""
+
+    def test_extract_normalizes_line_endings(self, tmp_path):
+        """Test CRLF and CR line endings are read as newlines."""
+        crlf_file = tmp_path / "crlf.md"
+        crlf_file.write_bytes(b"# Title\r\n\r\nFirst line\rSecond line\n")
+
+        extractor = ContentExtractor()
+        result = extractor.extract(crlf_file)
+
+        assert result["text"] == "# Title\n\nFirst line\nSecond line\n"
+
     def test_is_supported(self):
         """Test is_supported method."""
         extractor = ContentExtractor()
@@ -110,8 +134,7 @@ class TestContentExtractor:
     def test_extract_large_file(self, tmp_path):
         """Test extracting large text file."""
         large_file = tmp_path / "large.txt"
-        large_content = "Line of text.\n" * 10000
-        large_file.write_text(large_content)
+        large_file.write_bytes(LARGE_CONTENT)
 
         extractor = ContentExtractor()
         result = extractor.extract(large_file)
@@ -119,27 +142,29 @@ class TestContentExtractor:
         assert len(result["text"]) > 100000
         assert result["page_count"] == 1
 
-    def test_extract_docx_not_installed(self, tmp_path, monkeypatch):
-        """Test DOCX extraction when python-docx is not installed."""
-        docx_file = tmp_path / "test.docx"
-        docx_file.touch()
+    @pytest.mark.parametrize(
+        "extension,blocked_modules,method,message",
+        [
+            (".docx", {"docx"}, "_extract_docx", "python-docx not installed"),
+            (".pptx", {"pptx"}, "_extract_pptx", "python-pptx not installed"),
+            (".jpg", {"PIL", "pytesseract"}, "extract", "PIL and pytesseract required"),
+        ],
+    )
+    def test_extract_dependency_not_installed(
+        self, tmp_path, monkeypatch, extension, blocked_modules, method, message
+    ):
+        """Test extraction fails gracefully when an optional dependency is missing."""
+        test_file = tmp_path / f"test{extension}"
+        test_file.write_bytes(b"\xff\xd8\xff\xe0" if extension == ".jpg" else b"")
 
         extractor = ContentExtractor()
 
-        # Mock docx import to raise ImportError
-        import builtins
+        # A None entry in sys.modules makes the import raise ImportError
+        for module in blocked_modules:
+            monkeypatch.setitem(sys.modules, module, None)
 
-        original_import = builtins.__import__
-
-        def mock_import(name, *args, **kwargs):
-            if name == "docx":
-                raise ImportError("No module named 'docx'")
-            return original_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", mock_import)
-
-        with pytest.raises(ContentExtractionError, match="python-docx not installed"):
-            extractor._extract_docx(docx_file)
+        with pytest.raises(ContentExtractionError, match=message):
+            getattr(extractor, method)(test_file)
 
     def test_extract_pdf_file(self, pdf_with_text_content):
         """Test extracting text from PDF file."""
@@ -152,31 +177,11 @@ class TestContentExtractor:
         assert result["metadata"]["format"] == "pdf"
         assert result["metadata"]["extraction_method"] == "ocr_pipeline"
         assert len(result["text"]) > 0
+        assert result["page_count"] == 1
 
-    def test_extract_docx_with_content(self, tmp_path):
+    def test_extract_docx_with_content(self, docx_rich_extracted):
         """Test extracting text from DOCX with paragraphs and tables."""
-        try:
-            from docx import Document
-        except ImportError:
-            pytest.skip("python-docx not installed")
-
-        # Create DOCX with content
-        docx_file = tmp_path / "test.docx"
-        doc = Document()
-        doc.add_paragraph("First paragraph")
-        doc.add_paragraph("Second paragraph")
-
-        # Add table
-        table = doc.add_table(rows=2, cols=2)
-        table.cell(0, 0).text = "Header 1"
-        table.cell(0, 1).text = "Header 2"
-        table.cell(1, 0).text = "Data 1"
-        table.cell(1, 1).text = "Data 2"
-
-        doc.save(str(docx_file))
-
-        extractor = ContentExtractor()
-        result = extractor.extract(docx_file)
+        result = docx_rich_extracted
 
         assert "text" in result
         assert "First paragraph" in result["text"]
@@ -186,37 +191,24 @@ class TestContentExtractor:
         assert result["metadata"]["paragraph_count"] == 2
         assert result["metadata"]["table_count"] == 1
 
-    def test_extract_docx_with_empty_paragraphs(self, tmp_path):
+    def test_extract_docx_with_empty_paragraphs(self, docx_rich_extracted):
         """Test extracting DOCX skips empty paragraphs."""
-        try:
-            from docx import Document
-        except ImportError:
-            pytest.skip("python-docx not installed")
-
-        docx_file = tmp_path / "empty_paras.docx"
-        doc = Document()
-        doc.add_paragraph("Content")
-        doc.add_paragraph("")  # Empty
-        doc.add_paragraph("   ")  # Whitespace only
-        doc.add_paragraph("More content")
-        doc.save(str(docx_file))
-
-        extractor = ContentExtractor()
-        result = extractor.extract(docx_file)
+        result = docx_rich_extracted
 
         # Should only count non-empty paragraphs
         assert result["metadata"]["paragraph_count"] == 2
+        assert {"First paragraph", "Second paragraph"} <= set(result["text"].splitlines())
 
     def test_extract_image_file(self, tmp_path):
         """Test extracting text from image using OCR."""
-        try:
-            import pytesseract
-            from PIL import Image
+        Image = pytest.importorskip("PIL.Image")
+        pytesseract = pytest.importorskip("pytesseract")
 
-            # Check if tesseract is actually available
+        # Check if tesseract is actually available
+        try:
             pytesseract.get_tesseract_version()
-        except (ImportError, pytesseract.TesseractNotFoundError):
-            pytest.skip("PIL, pytesseract or tesseract binary not installed")
+        except pytesseract.TesseractNotFoundError:
+            pytest.skip("tesseract binary not installed")
 
         # Create simple test image
         img_file = tmp_path / "test.png"
@@ -231,90 +223,16 @@ class TestContentExtractor:
         assert result["metadata"]["extraction_method"] == "tesseract_ocr"
         assert "image_size" in result["metadata"]
 
-    def test_extract_image_missing_dependencies(self, tmp_path, monkeypatch):
-        """Test image extraction fails gracefully without dependencies."""
-        # Create a dummy image file
-        img_file = tmp_path / "test.jpg"
-        img_file.write_bytes(b"\xff\xd8\xff\xe0")  # JPEG header
-
-        # Mock ImportError for PIL
-        import builtins
-
-        original_import = builtins.__import__
-
-        def mock_import(name, *args, **kwargs):
-            if name in ("PIL", "pytesseract"):
-                raise ImportError(f"No module named '{name}'")
-            return original_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", mock_import)
-
-        extractor = ContentExtractor()
-
-        with pytest.raises(ContentExtractionError, match="PIL and pytesseract required"):
-            extractor.extract(img_file)
-
-    def test_extract_docx_corruption(self, tmp_path):
+    def test_extract_docx_corruption(self, corrupt_docx):
         """Test DOCX extraction handles corrupted files."""
-        try:
-            import docx  # noqa: F401
-        except ImportError:
-            pytest.skip("python-docx not installed")
-
-        # Create a corrupted DOCX file
-        bad_docx = tmp_path / "corrupt.docx"
-        bad_docx.write_bytes(b"not a real docx file")
-
         extractor = ContentExtractor()
 
         with pytest.raises(ContentExtractionError, match="Failed to extract"):
-            extractor.extract(bad_docx)
-
-    def test_extract_pptx_not_installed(self, tmp_path, monkeypatch):
-        """Test PPTX extraction when python-pptx is not installed."""
-        pptx_file = tmp_path / "test.pptx"
-        pptx_file.touch()
+            extractor.extract(corrupt_docx)
 
-        extractor = ContentExtractor()
-
-        # Mock pptx import to raise ImportError
-        import builtins
-
-        original_import = builtins.__import__
-
-        def mock_import(name, *args, **kwargs):
-            if name == "pptx":
-                raise ImportError("No module named 'pptx'")
-            return original_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", mock_import)
-
-        with pytest.raises(ContentExtractionError, match="python-pptx not installed"):
-            extractor._extract_pptx(pptx_file)
-
-    def test_extract_pptx_with_content(self, tmp_path):
+    def test_extract_pptx_with_content(self, pptx_with_content_file):
         """Test extracting text from PPTX with slides and content."""
-        try:
-            from pptx import Presentation
-        except ImportError:
-            pytest.skip("python-pptx not installed")
-
-        # Create PPTX with content
-        pptx_file = tmp_path / "test.pptx"
-        prs = Presentation()
-
-        # Add slide 1 with title and content
-        slide_layout = prs.slide_layouts[1]  # Title and content layout
-        slide1 = prs.slides.add_slide(slide_layout)
-        slide1.shapes.title.text = "First Slide Title"
-        slide1.placeholders[1].text = "This is the content of the first slide."
-
-        # Add slide 2 with different content
-        slide2 = prs.slides.add_slide(slide_layout)
-        slide2.shapes.title.text = "Second Slide Title"
-        slide2.placeholders[1].text = "This is the content of the second slide."
-
-        prs.save(str(pptx_file))
+        pptx_file = pptx_with_content_file
 
         extractor = ContentExtractor()
         result = extractor.extract(pptx_file)
@@ -330,41 +248,9 @@ class TestContentExtractor:
         assert result["metadata"]["slide_count"] == 2
         assert result["metadata"]["shape_count"] > 0
 
-    def test_extract_pptx_with_tables(self, tmp_path):
+    def test_extract_pptx_with_tables(self, pptx_with_tables_file):
         """Test extracting text from PPTX with tables."""
-        try:
-            from pptx import Presentation
-            from pptx.util import Inches
-        except ImportError:
-            pytest.skip("python-pptx not installed")
-
-        # Create PPTX with table
-        pptx_file = tmp_path / "table_test.pptx"
-        prs = Presentation()
-
-        # Add slide with blank layout
-        blank_layout = prs.slide_layouts[6]  # Blank layout
-        slide = prs.slides.add_slide(blank_layout)
-
-        # Add a table
-        rows, cols = 3, 2
-        left = Inches(2)
-        top = Inches(2)
-        width = Inches(4)
-        height = Inches(2)
-
-        table_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
-        table = table_shape.table
-
-        # Fill table with data
-        table.cell(0, 0).text = "Header 1"
-        table.cell(0, 1).text = "Header 2"
-        table.cell(1, 0).text = "Row 1 Col 1"
-        table.cell(1, 1).text = "Row 1 Col 2"
-        table.cell(2, 0).text = "Row 2 Col 1"
-        table.cell(2, 1).text = "Row 2 Col 2"
-
-        prs.save(str(pptx_file))
+        pptx_file = pptx_with_tables_file
 
         extractor = ContentExtractor()
         result = extractor.extract(pptx_file)
@@ -375,27 +261,9 @@ class TestContentExtractor:
         assert "Row 1 Col 1" in result["text"]
         assert result["metadata"]["has_tables"] is True
 
-    def test_extract_pptx_with_notes(self, tmp_path):
+    def test_extract_pptx_with_notes(self, pptx_with_notes_file):
         """Test extracting text from PPTX with speaker notes."""
-        try:
-            from pptx import Presentation
-        except ImportError:
-            pytest.skip("python-pptx not installed")
-
-        # Create PPTX with notes
-        pptx_file = tmp_path / "notes_test.pptx"
-        prs = Presentation()
-
-        slide_layout = prs.slide_layouts[1]
-        slide = prs.slides.add_slide(slide_layout)
-        slide.shapes.title.text = "Slide with Notes"
-
-        # Add speaker notes
-        notes_slide = slide.notes_slide
-        notes_text_frame = notes_slide.notes_text_frame
-        notes_text_frame.text = "These are important speaker notes for the presentation."
-
-        prs.save(str(pptx_file))
+        pptx_file = pptx_with_notes_file
 
         extractor = ContentExtractor()
         result = extractor.extract(pptx_file)
@@ -405,17 +273,9 @@ class TestContentExtractor:
         assert "speaker notes" in result["text"]
         assert "[Notes for Slide 1]" in result["text"]
 
-    def test_extract_pptx_empty(self, tmp_path):
+    def test_extract_pptx_empty(self, empty_pptx_file):
         """Test extracting empty PPTX file."""
-        try:
-            from pptx import Presentation
-        except ImportError:
-            pytest.skip("python-pptx not installed")
-
-        # Create empty PPTX
-        pptx_file = tmp_path / "empty.pptx"
-        prs = Presentation()
-        prs.save(str(pptx_file))
+        pptx_file = empty_pptx_file
 
         extractor = ContentExtractor()
         result = extractor.extract(pptx_file)
@@ -424,21 +284,12 @@ class TestContentExtractor:
         assert result["page_count"] == 0
         assert result["metadata"]["slide_count"] == 0
 
-    def test_extract_pptx_corruption(self, tmp_path):
+    def test_extract_pptx_corruption(self, corrupt_pptx):
         """Test PPTX extraction handles corrupted files."""
-        try:
-            import pptx  # noqa: F401
-        except ImportError:
-            pytest.skip("python-pptx not installed")
-
-        # Create a corrupted PPTX file
-        bad_pptx = tmp_path / "corrupt.pptx"
-        bad_pptx.write_bytes(b"not a real pptx file")
-
         extractor = ContentExtractor()
 
         with pytest.raises(ContentExtractionError, match="Failed to extract"):
-            extractor.extract(bad_pptx)
+            extractor.extract(corrupt_pptx)
 
 
 class TestContentExtractionError:
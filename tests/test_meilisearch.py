@@ -2,8 +2,13 @@
 Tests for MeiliSearchIndexer.
 """
 
+import json
+
+import numpy as np
 import pytest
 
+from docprocessor.core.chunker import ChunkBatch, DocumentChunker
+from docprocessor.integrations import meilisearch_indexer
 from docprocessor.integrations.meilisearch_indexer import MeiliSearchIndexer
 
 
@@ -81,6 +86,35 @@ class TestMeiliSearchIndexer:
 
         assert result["status"] == "enqueued"
 
+    def test_index_chunk_batch(self, mock_meilisearch_client, long_text):
+        """Test indexing a ChunkBatch converts it to search documents."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        chunker = DocumentChunker(chunk_size=100, chunk_overlap=10, min_chunk_size=10)
+        chunks = chunker.chunk_document(long_text, "file-123", "output-456", 789, "test.txt")
+        mock_meilisearch_client.index("document_chunks").record_documents = True
+
+        indexer.index_chunks(ChunkBatch.from_chunks(chunks), "document_chunks")
+
+        documents = mock_meilisearch_client.index("document_chunks").documents
+        assert [doc["id"] for doc in documents] == [chunk.chunk_id for chunk in chunks]
+        assert documents[0]["project_id"] == 789
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps(self, monkeypatch, use_orjson):
+        """Test payload serialization with orjson and with the stdlib fallback."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(meilisearch_indexer, "orjson", None)
+        documents = [{"id": "a", "text": "Café", "count": np.int32(3), "vec": np.ones(2)}]
+
+        body = meilisearch_indexer._dumps(documents)
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == [{"id": "a", "text": "Café", "count": 3, "vec": [1.0, 1.0]}]
+
     def test_index_document(self, mock_meilisearch_client):
         """Test indexing single document."""
         indexer = MeiliSearchIndexer(
@@ -98,6 +132,19 @@ class TestMeiliSearchIndexer:
 
         assert result["status"] == "enqueued"
 
+    def test_index_documents(self, mock_meilisearch_client):
+        """Test indexing several documents in one request."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        documents = [{"id": f"doc-{i}", "filename": f"doc{i}.txt"} for i in range(3)]
+        mock_meilisearch_client.index("documents").record_documents = True
+
+        result = indexer.index_documents(documents, "documents")
+
+        assert result["status"] == "enqueued"
+        assert mock_meilisearch_client.index("documents").documents == documents
+
     def test_search(self, mock_meilisearch_client):
         """Test searching an index."""
         indexer = MeiliSearchIndexer(
@@ -109,6 +156,27 @@ class TestMeiliSearchIndexer:
         assert "hits" in results
         assert results["limit"] == 10
 
+    def test_is_healthy(self, mock_meilisearch_client):
+        """Test health check against a reachable server."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+
+        assert indexer.is_healthy() is True
+
+    def test_is_healthy_unreachable(self, mock_meilisearch_client, monkeypatch):
+        """Test health check reports False when the server cannot be reached."""
+
+        def unreachable():
+            raise ConnectionError("connection refused")
+
+        monkeypatch.setattr(mock_meilisearch_client, "is_healthy", unreachable)
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+
+        assert indexer.is_healthy() is False
+
     def test_delete_document(self, mock_meilisearch_client):
         """Test deleting a document by ID."""
         indexer = MeiliSearchIndexer(
@@ -169,6 +237,28 @@ class TestMeiliSearchIndexer:
 
         assert "hits" in results
 
+    def test_hybrid_search(self, mock_meilisearch_client):
+        """Test hybrid search sends Meilisearch hybrid parameters."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        index = mock_meilisearch_client.index("document_chunks")
+        calls = []
+        index.search = lambda query, options=None: calls.append((query, options)) or {"hits": []}
+
+        results = indexer.hybrid_search(
+            "solar energy", "document_chunks", k=3, semantic_ratio=0.7, filters="project_id = 1"
+        )
+
+        assert results == {"hits": []}
+        query, options = calls[0]
+        assert query == "solar energy"
+        assert options["limit"] == 3
+        assert options["hybrid"] == {"semanticRatio": 0.7, "embedder": "default"}
+        assert options["showRankingScore"] is True
+        assert options["filter"] == "project_id = 1"
+        assert "vector" not in options
+
     def test_batch_indexing(self, mock_meilisearch_client):
         """Test indexing large batch of chunks."""
         indexer = MeiliSearchIndexer(
@@ -181,6 +271,7 @@ class TestMeiliSearchIndexer:
         result = indexer.index_chunks(chunks=chunks_data, index_name="document_chunks")
 
         assert result["status"] == "enqueued"
+        assert mock_meilisearch_client.index("document_chunks").doc_count == 100
 
     def test_empty_chunks_list(self, mock_meilisearch_client):
         """Test indexing empty chunks list."""
@@ -212,12 +303,9 @@ class TestMeiliSearchIndexer:
 
     def test_indexer_without_client_parameter(self):
         """Test indexer initialization without providing client."""
-        try:
-            import meilisearch
-
-            # This would normally create a real client
-            # but we can't test it without a real server
-            # Just verify the import path works
-            assert meilisearch is not None
-        except ImportError:
-            pytest.skip("meilisearch not installed")
+        meilisearch = pytest.importorskip("meilisearch")
+
+        # This would normally create a real client
+        # but we can't test it without a real server
+        # Just verify the import path works
+        assert meilisearch is not None
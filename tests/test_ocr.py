@@ -0,0 +1,124 @@
+"""
+Tests for the OCR pipeline helpers.
+"""
+
+import os
+import threading
+import time
+
+from PIL import Image
+
+from docprocessor.core import ocr
+from docprocessor.core.ocr import TextElement, _extract_pdf_document, perform_structured_ocr
+
+
+def _fake_render_pages(rendered):
+    """Build a _render_pages stand-in that writes one small image file per page."""
+
+    def render(pdf_path, first_page, last_page, output_folder):
+        rendered.append((first_page, last_page))
+        paths = []
+        for page_num in range(first_page, last_page + 1):
+            path = os.path.join(output_folder, f"page-{page_num}.png")
+            Image.new("L", (10, 10)).save(path)
+            paths.append(path)
+        return paths
+
+    return render
+
+
+class TestPerformStructuredOCR:
+    """Tests for perform_structured_ocr."""
+
+    def test_ocr_only_requested_pages_in_order(self, monkeypatch):
+        """Test only existing, requested pages are rendered and results keep page order."""
+        rendered = []
+
+        def fake_ocr(image, page_num):
+            # Finish later pages first to check ordering is preserved
+            time.sleep(0.01 * (5 - page_num))
+            return [TextElement(text=f"page {page_num}", x=0, y=0, page_number=page_num)]
+
+        monkeypatch.setattr(ocr, "_render_pages", _fake_render_pages(rendered))
+        monkeypatch.setattr(ocr, "_ocr_one_page", fake_ocr)
+
+        elements = perform_structured_ocr(b"%PDF", [1, 3, 4, 7], page_count=4)
+
+        rendered_pages = [p for first, last in rendered for p in range(first, last + 1)]
+        assert sorted(rendered_pages) == [1, 3, 4]
+        assert [e.page_number for e in elements] == [1, 3, 4]
+
+    def test_pdf_written_once_and_rendered_in_ranges(self, monkeypatch):
+        """Test contiguous pages share one render call and the PDF file is reused."""
+        rendered = []
+        pdf_paths = set()
+        render = _fake_render_pages(rendered)
+
+        def fake_render(pdf_path, first_page, last_page, output_folder):
+            pdf_paths.add(pdf_path)
+            return render(pdf_path, first_page, last_page, output_folder)
+
+        monkeypatch.setattr(ocr, "_render_pages", fake_render)
+        monkeypatch.setattr(ocr, "_ocr_one_page", lambda image, page_num: [])
+
+        perform_structured_ocr(b"%PDF", [1, 2, 3, 4, 6, 7], page_count=10, max_concurrent_pages=2)
+
+        assert sorted(rendered) == [(1, 3), (4, 4), (6, 7)]
+        assert len(pdf_paths) == 1
+        assert not os.path.exists(pdf_paths.pop())
+
+    def test_concurrency_is_bounded(self, monkeypatch):
+        """Test no more than max_concurrent_pages renders run at once."""
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        render = _fake_render_pages([])
+
+        def fake_render(pdf_path, first_page, last_page, output_folder):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return render(pdf_path, first_page, last_page, output_folder)
+
+        monkeypatch.setattr(ocr, "_render_pages", fake_render)
+        monkeypatch.setattr(ocr, "_ocr_one_page", lambda image, page_num: [])
+
+        perform_structured_ocr(
+            b"%PDF", list(range(1, 11, 2)), page_count=10, max_concurrent_pages=2
+        )
+
+        assert peak <= 2
+
+    def test_no_pages_to_ocr(self):
+        """Test nothing is rendered when no requested page exists."""
+        assert perform_structured_ocr(b"%PDF", [5], page_count=2) == []
+
+
+class TestExtractPdfDocument:
+    """Tests for _extract_pdf_document."""
+
+    def test_fallback_ocrs_every_page(self, monkeypatch):
+        """Test a layout-extraction failure OCRs all pages reported by the PDF."""
+
+        def failing_extract_pages(*args, **kwargs):
+            raise ValueError("broken layout")
+
+        requested = []
+
+        def fake_ocr(pdf_bytes, pages_to_ocr, page_count=None, max_concurrent_pages=None):
+            requested.extend(pages_to_ocr)
+            return [TextElement(text="scanned", x=0, y=0, page_number=1)]
+
+        monkeypatch.setattr(ocr, "extract_pages", failing_extract_pages)
+        monkeypatch.setattr(ocr, "pdfinfo_from_bytes", lambda pdf_bytes: {"Pages": 3})
+        monkeypatch.setattr(ocr, "perform_structured_ocr", fake_ocr)
+
+        text, page_count = _extract_pdf_document(b"%PDF")
+
+        assert requested == [1, 2, 3]
+        assert page_count == 3
+        assert "scanned" in text
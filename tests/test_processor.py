@@ -4,7 +4,7 @@ Tests for DocumentProcessor main API.
 
 import pytest
 
-from docprocessor import DocumentProcessor, ProcessResult
+from docprocessor import DocumentProcessor, MeiliSearchIndexer, ProcessResult
 from docprocessor.core.extractor import ContentExtractionError
 
 
@@ -57,6 +57,8 @@ class TestDocumentProcessor:
         assert len(result.text) > 0
         assert len(result.chunks) > 0
         assert result.chunk_count == len(result.chunks)
+        assert result.stats.total_chunks == len(result.chunks)
+        assert result.stats.total_tokens == sum(c.token_count for c in result.chunks)
         assert result.summary is None
 
     def test_process_with_summarization(self, sample_txt_file, mock_llm_client):
@@ -111,6 +113,27 @@ class TestDocumentProcessor:
         assert "metadata" in extraction
         assert len(extraction["text"]) > 0
 
+    def test_process_text(self, sample_text, mock_llm_client):
+        """Test processing in-memory text without extraction."""
+        processor = DocumentProcessor(llm_client=mock_llm_client)
+
+        result = processor.process_text(
+            sample_text, filename="memo.txt", file_id="memo-1", summarize=True
+        )
+
+        assert result.text == sample_text
+        assert result.chunk_count == len(result.chunks) > 0
+        assert all(c.file_id == "memo-1" and c.filename == "memo.txt" for c in result.chunks)
+        assert "mock summary" in result.summary.lower()
+
+    def test_process_text_defaults_file_id_to_filename(self, sample_text):
+        """Test process_text uses the filename as file_id when none is given."""
+        processor = DocumentProcessor()
+
+        result = processor.process_text(sample_text, filename="memo.txt")
+
+        assert result.chunks[0].file_id == "memo.txt"
+
     def test_chunk_text_method(self, sample_text):
         """Test chunk_text convenience method."""
         processor = DocumentProcessor()
@@ -141,6 +164,312 @@ class TestDocumentProcessor:
         assert isinstance(summary, str)
         assert len(summary) > 0
 
+    def test_summarize_text_reuses_indexed_summary(self, sample_text, mock_meilisearch_client):
+        """Test a high-scoring near-duplicate match is returned without an LLM call."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        index = mock_meilisearch_client.index("document_summaries")
+        searches = []
+
+        def search(query, options=None):
+            searches.append(options)
+            hit = {
+                "summary": "Stored summary.",
+                "summary_source_length": len(" ".join(sample_text.split())),
+                "_rankingScore": 0.95,
+            }
+            return {"hits": [hit]}
+
+        index.search = search
+
+        class FailingLLMClient:
+            def complete_chat(self, messages, temperature):
+                raise AssertionError("LLM should not be called")
+
+        processor = DocumentProcessor(llm_client=FailingLLMClient(), summary_indexer=indexer)
+
+        assert processor.summarize_text(sample_text + " Minor edit.") == "Stored summary."
+        assert searches[0]["filter"] == (
+            f'summary_namespace = "{processor.summarizer.cache_namespace}"'
+        )
+
+    def test_summarize_text_indexes_new_summary(
+        self, sample_text, mock_llm_client, mock_meilisearch_client
+    ):
+        """Test a low-scoring match falls through to the LLM and is indexed."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        index = mock_meilisearch_client.index("document_summaries")
+        index.record_documents = True
+        index.search = lambda query, options=None: {
+            "hits": [{"summary": "Unrelated.", "_rankingScore": 0.4}]
+        }
+
+        processor = DocumentProcessor(llm_client=mock_llm_client, summary_indexer=indexer)
+
+        summary = processor.summarize_text(sample_text)
+
+        assert "mock summary" in summary.lower()
+        assert index.documents[0]["summary"] == summary
+        assert index.documents[0]["summary_namespace"] == processor.summarizer.cache_namespace
+
+    def test_summarize_text_ignores_match_of_different_length(
+        self, sample_text, mock_llm_client, mock_meilisearch_client
+    ):
+        """Test a high-scoring hit for a much longer text (e.g. same header) is not reused."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        index = mock_meilisearch_client.index("document_summaries")
+        index.search = lambda query, options=None: {
+            "hits": [
+                {
+                    "summary": "Other summary.",
+                    "summary_source_length": 3 * len(sample_text),
+                    "_rankingScore": 0.99,
+                }
+            ]
+        }
+
+        processor = DocumentProcessor(llm_client=mock_llm_client, summary_indexer=indexer)
+
+        assert "mock summary" in processor.summarize_text(sample_text).lower()
+
+    def test_summarize_text_does_not_index_short_text(
+        self, mock_llm_client, mock_meilisearch_client
+    ):
+        """Test texts returned unsummarized are neither looked up nor indexed."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        index = mock_meilisearch_client.index("document_summaries")
+
+        def search(query, options=None):
+            raise AssertionError("short texts should not be looked up")
+
+        index.search = search
+
+        processor = DocumentProcessor(llm_client=mock_llm_client, summary_indexer=indexer)
+
+        assert processor.summarize_text("Too short.") == "Too short."
+        assert index.doc_count == 0
+
+    def test_summarize_texts_and_batch_reuse_indexed_summaries(
+        self, sample_text, mock_meilisearch_client
+    ):
+        """Test concurrent and batched summarization reuse and index summaries too."""
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        index = mock_meilisearch_client.index("document_summaries")
+        index.record_documents = True
+        index.search = lambda query, options=None: {
+            "hits": [
+                {**doc, "_rankingScore": 1.0}
+                for doc in index.documents
+                if doc["summary_source"] == query
+            ]
+        }
+
+        class CountingLLMClient:
+            calls = 0
+
+            def complete_chat(self, messages, temperature):
+                self.calls += 1
+                return {"content": "Generated summary."}
+
+            def complete_chat_batch(self, batch_messages, temperature):
+                return [self.complete_chat(m, temperature) for m in batch_messages]
+
+        llm_client = CountingLLMClient()
+        processor = DocumentProcessor(llm_client=llm_client, summary_indexer=indexer)
+        other_text = sample_text * 2
+
+        assert processor.summarize_texts([sample_text]) == ["Generated summary."]
+        assert processor.summarize_batch([sample_text, other_text]) == ["Generated summary."] * 2
+        assert processor.summarize_texts([other_text]) == ["Generated summary."]
+
+        assert llm_client.calls == 2
+        assert len(index.documents) == 2
+
+    def test_summarize_texts_preserves_order(self, sample_text):
+        """Test batch summarization returns summaries in input order."""
+
+        class EchoLLMClient:
+            def complete_chat(self, messages, temperature):
+                return {"content": messages[-1]["content"].split("Document: ")[1].split()[0]}
+
+        processor = DocumentProcessor(llm_client=EchoLLMClient())
+        filenames = [f"doc{i}.txt" for i in range(5)]
+
+        summaries = processor.summarize_texts([sample_text] * 5, filenames, max_concurrency=2)
+
+        assert summaries == filenames
+
+    def test_summarize_texts_length_mismatch(self, sample_text):
+        """Test batch summarization rejects mismatched filenames."""
+        processor = DocumentProcessor()
+
+        with pytest.raises(ValueError, match="same length"):
+            processor.summarize_texts([sample_text, sample_text], ["only_one.txt"])
+
+    def test_summarize_batch_single_call(self, sample_text):
+        """Test batch summarization sends all documents in one complete_chat_batch call."""
+
+        class BatchLLMClient:
+            def __init__(self):
+                self.batch_calls = 0
+
+            def complete_chat(self, messages, temperature):
+                raise AssertionError("complete_chat should not be called")
+
+            def complete_chat_batch(self, batch_messages, temperature):
+                self.batch_calls += 1
+                return [
+                    {"content": m[-1]["content"].split("Document: ")[1].split()[0]}
+                    for m in batch_messages
+                ]
+
+        client = BatchLLMClient()
+        processor = DocumentProcessor(llm_client=client)
+        filenames = [f"doc{i}.txt" for i in range(3)]
+
+        summaries = processor.summarize_batch([sample_text, "short", sample_text], filenames)
+
+        assert client.batch_calls == 1
+        assert summaries == ["doc0.txt", "short", "doc2.txt"]
+
+    def test_summarize_batch_falls_back_per_document(self, sample_text):
+        """Test failed batch items use the fallback summary."""
+
+        class PartialBatchClient:
+            def complete_chat_batch(self, batch_messages, temperature):
+                return [{"content": "ok"}, {"content": ""}]
+
+        processor = DocumentProcessor(llm_client=PartialBatchClient())
+
+        summaries = processor.summarize_batch([sample_text, sample_text])
+
+        assert summaries[0] == "ok"
+        assert summaries[1] == processor.summarizer._create_fallback_summary(sample_text)
+
+    def test_summarize_batch_without_batch_support(self, sample_text, mock_llm_client):
+        """Test clients without complete_chat_batch fall back to concurrent requests."""
+        processor = DocumentProcessor(llm_client=mock_llm_client)
+
+        summaries = processor.summarize_batch([sample_text, sample_text], ["a.txt", "b.txt"])
+
+        assert len(summaries) == 2
+        assert all("mock summary" in s.lower() for s in summaries)
+
+    def test_process_many(self, tmp_path, sample_text):
+        """Test processing several files concurrently."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"doc{i}.txt"
+            path.write_text(sample_text)
+            paths.append(path)
+
+        processor = DocumentProcessor()
+
+        results = processor.process_many(paths, max_concurrency=2)
+
+        assert len(results) == 3
+        for path, result in zip(paths, results):
+            assert isinstance(result, ProcessResult)
+            assert result.chunks[0].filename == path.name
+
+    def test_process_batch_captures_errors(self, sample_txt_file):
+        """Test batch processing reports failed files without aborting."""
+        processor = DocumentProcessor()
+        progress_calls = []
+
+        results = processor.process_batch(
+            [sample_txt_file, "/nonexistent/file.txt", sample_txt_file],
+            progress=lambda done, total: progress_calls.append((done, total)),
+        )
+
+        assert [r.status for r in results] == ["success", "error", "success"]
+        assert "File not found" in results[1].error
+        assert results[0].error is None
+        assert len(results[2].chunks) > 0
+        assert progress_calls[-1] == (3, 3)
+        assert sorted(done for done, _ in progress_calls) == [1, 2, 3]
+
+    def test_process_many_raises_on_error(self, sample_txt_file):
+        """Test process_many propagates per-file errors."""
+        processor = DocumentProcessor()
+
+        with pytest.raises(ContentExtractionError):
+            processor.process_many([sample_txt_file, "/nonexistent/file.txt"])
+
+    def test_embed_chunks_batches_requests(self, long_text):
+        """Test chunks are embedded in batched requests."""
+
+        class MockEmbeddingClient:
+            def __init__(self):
+                self.batch_sizes = []
+
+            def embed(self, texts):
+                self.batch_sizes.append(len(texts))
+                return [[float(len(text)), 1.0] for text in texts]
+
+        client = MockEmbeddingClient()
+        processor = DocumentProcessor(
+            chunk_size=100, chunk_overlap=10, min_chunk_size=10, embedding_client=client
+        )
+        chunks = processor.chunk_text(long_text)
+
+        processor.embed_chunks(chunks, batch_size=2)
+
+        assert sum(client.batch_sizes) == len(chunks)
+        assert max(client.batch_sizes) <= 2
+        for chunk in chunks:
+            assert chunk.embedding == [float(len(chunk.chunk_text)), 1.0]
+
+        search_docs = processor.chunks_to_search_documents(chunks)
+        assert search_docs[0]["_vectors"]["default"] == chunks[0].embedding
+
+    def test_embed_chunks_without_client(self, sample_text):
+        """Test embedding without an embedding client raises error."""
+        processor = DocumentProcessor()
+        chunks = processor.chunk_text(sample_text)
+
+        with pytest.raises(ValueError, match="No embedding client"):
+            processor.embed_chunks(chunks)
+
+    def test_process_streaming_embed_and_index(self, long_text_file, mock_meilisearch_client):
+        """Test streaming chunks are embedded and indexed in batches."""
+
+        class MockEmbeddingClient:
+            def embed(self, texts):
+                return [[1.0, 0.0] for _ in texts]
+
+        indexer = MeiliSearchIndexer(
+            url="http://localhost:7700", api_key="test_key", client=mock_meilisearch_client
+        )
+        processor = DocumentProcessor(
+            chunk_size=100,
+            chunk_overlap=10,
+            min_chunk_size=10,
+            embedding_client=MockEmbeddingClient(),
+        )
+
+        mock_meilisearch_client.index("document_chunks").record_documents = True
+
+        result = processor.process(long_text_file, streaming=True)
+
+        assert not isinstance(result.chunks, list)
+        assert result.chunk_count == 0
+
+        indexed = processor.embed_and_index(result.chunks, indexer, "document_chunks", batch_size=2)
+
+        documents = mock_meilisearch_client.index("document_chunks").documents
+        assert indexed == len(documents) == result.stats.total_chunks > 2
+        assert all(doc["_vectors"]["default"] == [1.0, 0.0] for doc in documents)
+
     def test_chunks_to_search_documents(self, sample_txt_file):
         """Test converting chunks to search document format."""
         processor = DocumentProcessor()
@@ -155,6 +484,7 @@ class TestDocumentProcessor:
             assert "chunk_text" in doc
             assert "file_id" in doc
             assert "chunk_number" in doc
+            assert "_vectors" not in doc
 
     def test_process_empty_file(self, tmp_path):
         """Test processing empty file."""
@@ -195,3 +525,6 @@ class TestDocumentProcessor:
         assert result.metadata == {}
         assert result.page_count == 1
         assert result.chunk_count == 0
+        assert result.stats.total_chunks == 0
+        assert result.status == "success"
+        assert result.error is None
@@ -2,6 +2,9 @@
 Tests for DocumentSummarizer.
 """
 
+import asyncio
+import threading
+
 import pytest
 
 from docprocessor.core.summarizer import DocumentSummarizer, SummarizationError
@@ -193,6 +196,63 @@ class TestDocumentSummarizer:
         # Should truncate at sentence boundary
         assert fallback.endswith((".", " [...]", ". [...]"))
 
+    def test_asummarize_uses_async_client(self, sample_text):
+        """Test asummarize awaits acomplete_chat when the client provides it."""
+
+        class AsyncLLMClient:
+            def complete_chat(self, messages, temperature):
+                raise AssertionError("sync path should not be used")
+
+            async def acomplete_chat(self, messages, temperature):
+                return {"content": "Async summary."}
+
+        summarizer = DocumentSummarizer(llm_client=AsyncLLMClient())
+
+        summary = asyncio.run(summarizer.asummarize(sample_text, "test.txt"))
+
+        assert summary == "Async summary."
+
+    def test_asummarize_with_sync_client(self, sample_text, mock_llm_client):
+        """Test asummarize runs sync-only clients in a worker thread."""
+        summarizer = DocumentSummarizer(llm_client=mock_llm_client)
+
+        summary = asyncio.run(summarizer.asummarize(sample_text, "test.txt"))
+
+        assert "mock summary" in summary.lower()
+
+    def test_asummarize_cache_runs_off_event_loop(self, sample_text, mock_llm_client):
+        """Test asummarize calls the summary cache from worker threads, not the loop."""
+        loop_thread = threading.get_ident()
+        threads = []
+
+        class RecordingCache:
+            def get(self, text, namespace):
+                threads.append(threading.get_ident())
+                return None
+
+            def set(self, text, namespace, summary):
+                threads.append(threading.get_ident())
+
+        summarizer = DocumentSummarizer(llm_client=mock_llm_client, cache=RecordingCache())
+
+        asyncio.run(summarizer.asummarize(sample_text, "test.txt"))
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+
+    def test_asummarize_with_fallback_on_failure(self, sample_text):
+        """Test asummarize_with_fallback returns fallback on error."""
+
+        class FailingAsyncClient:
+            async def acomplete_chat(self, messages, temperature):
+                raise Exception("API error")
+
+        summarizer = DocumentSummarizer(llm_client=FailingAsyncClient())
+
+        summary = asyncio.run(summarizer.asummarize_with_fallback(sample_text, "test.txt"))
+
+        assert summary == summarizer._create_fallback_summary(sample_text)
+
 
 class TestSummarizationError:
     """Tests for SummarizationError exception."""
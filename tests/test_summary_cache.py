@@ -0,0 +1,204 @@
+"""
+Tests for LRUSemanticCache.
+"""
+
+import numpy as np
+
+from docprocessor import DocumentProcessor
+from docprocessor.core.summarizer import DocumentSummarizer
+from docprocessor.core.summary_cache import LRUSemanticCache
+
+
+def keyword_embedder(text):
+    """Tiny deterministic embedder: counts of a few keywords."""
+    words = text.lower().split()
+    return np.array([words.count(w) for w in ("solar", "wind", "water", "energy")], dtype=float)
+
+
+class CountingLLMClient:
+    """LLM client that counts how often it is called."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete_chat(self, messages, temperature):
+        self.calls += 1
+        return {"content": f"Summary number {self.calls}."}
+
+
+class TestLRUSemanticCache:
+    """Tests for LRUSemanticCache class."""
+
+    def test_exact_hit(self):
+        """Test exact lookups ignore whitespace differences."""
+        cache = LRUSemanticCache()
+
+        cache.set("Some   document\ntext", "model:500", "A summary.")
+
+        assert cache.get("Some document text", "model:500") == "A summary."
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_miss(self):
+        """Test lookup of unknown text."""
+        cache = LRUSemanticCache()
+
+        assert cache.get("Unknown text", "model:500") is None
+        assert cache.misses == 1
+        assert cache.hit_rate == 0.0
+
+    def test_namespace_isolation(self):
+        """Test summaries are not shared across namespaces."""
+        cache = LRUSemanticCache()
+
+        cache.set("Document text", "model-a:500", "Summary A.")
+
+        assert cache.get("Document text", "model-b:500") is None
+        assert cache.get("Document text", "model-a:500") == "Summary A."
+
+    def test_semantic_hit(self):
+        """Test near-duplicate text is served by embedding similarity."""
+        cache = LRUSemanticCache(embedder=keyword_embedder, similarity_threshold=0.95)
+
+        cache.set("solar energy solar energy", "model:500", "Solar summary.")
+
+        assert cache.get("energy solar energy solar", "model:500") == "Solar summary."
+        assert cache.get("wind water wind water", "model:500") is None
+
+    def test_pending_embeddings_are_bounded(self):
+        """Test misses never followed by set() do not keep embeddings without bound."""
+        cache = LRUSemanticCache(maxsize=2, embedder=keyword_embedder)
+
+        for text in ("solar", "wind", "water energy"):
+            assert cache.get(text, "model:500") is None
+
+        assert len(cache._pending) == 2
+
+    def test_quantized_semantic_hit(self):
+        """Test int8-quantized embeddings still serve near-duplicate text."""
+        cache = LRUSemanticCache(embedder=keyword_embedder, quantize=True)
+
+        cache.set("solar energy solar energy", "model:500", "Solar summary.")
+        cache.set("wind energy", "model:500", "Wind summary.")
+
+        assert cache.get("energy solar energy solar", "model:500") == "Solar summary."
+        assert cache.get("energy wind", "model:500") == "Wind summary."
+        assert cache.get("water water", "model:500") is None
+
+        embeddings = cache._matrices["model:500"]
+        assert embeddings.matrix.dtype == np.int8
+        assert embeddings.scales.shape == (2,)
+
+    def test_embedding_matrix_grows_in_place(self):
+        """Test inserts past the initial capacity keep every row addressable."""
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(40, 8)).astype(np.float32)
+        cache = LRUSemanticCache(embedder=lambda text: vectors[int(text)])
+
+        cache.get("0", "ns")  # Loads the (empty) namespace matrix
+        for i in range(40):
+            cache.set(str(i), "ns", f"Summary {i}.")
+        cache.set("3", "ns", "Summary 3, again.")
+
+        embeddings = cache._matrices["ns"]
+        assert len(embeddings) == 40
+        assert embeddings.rows[LRUSemanticCache.make_key("39", "ns")] == 39
+        assert cache.get("25", "ns") == "Summary 25."
+
+    def test_embedding_dimension_mismatch_is_not_raised(self):
+        """Test an embedding of another dimension is stored for exact matches only."""
+        dims = {"solar": 4, "odd": 3}
+        cache = LRUSemanticCache(embedder=lambda text: np.ones(dims[text.split()[0]]))
+
+        cache.set("solar panels", "ns", "Solar.")
+        cache.set("odd one", "ns", "Odd.")
+
+        assert cache.get("odd one", "ns") == "Odd."
+        assert cache.get("odd two", "ns") is None
+        assert len(cache._matrices["ns"]) == 1
+
+    def test_quantized_similarities_match_float(self):
+        """Test int8 similarities stay close to float32 cosine similarities."""
+        rng = np.random.default_rng(0)
+        matrix = rng.normal(size=(50, 64)).astype(np.float32)
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        vector = matrix[7]
+
+        quantized, scales = LRUSemanticCache._quantize(matrix)
+        similarities = LRUSemanticCache._quantized_similarities(quantized, scales, vector)
+
+        np.testing.assert_allclose(similarities, matrix @ vector, atol=0.02)
+
+    def test_lru_eviction_keeps_persistent_tier(self):
+        """Test entries evicted from memory are still served from SQLite."""
+        cache = LRUSemanticCache(maxsize=1)
+
+        cache.set("first document", "ns", "First.")
+        cache.set("second document", "ns", "Second.")
+
+        assert len(cache._memory) == 1
+        assert cache.get("first document", "ns") == "First."
+
+    def test_persistence(self, tmp_path):
+        """Test summaries survive reopening the database."""
+        db_path = str(tmp_path / "summaries.db")
+
+        cache = LRUSemanticCache(path=db_path, embedder=keyword_embedder)
+        cache.set("solar energy", "ns", "Stored.")
+        cache.close()
+
+        reopened = LRUSemanticCache(path=db_path, embedder=keyword_embedder)
+
+        assert reopened.get("solar energy", "ns") == "Stored."
+        assert reopened.get("energy solar", "ns") == "Stored."
+
+    def test_clear(self):
+        """Test clearing the cache."""
+        cache = LRUSemanticCache()
+        cache.set("text", "ns", "Summary.")
+
+        cache.clear()
+
+        assert cache.get("text", "ns") is None
+
+
+class TestSummarizerCaching:
+    """Tests for summary caching in DocumentSummarizer and DocumentProcessor."""
+
+    def test_summarizer_uses_cache(self, sample_text):
+        """Test repeated summarization calls the LLM only once."""
+        client = CountingLLMClient()
+        summarizer = DocumentSummarizer(llm_client=client, cache=LRUSemanticCache())
+
+        first = summarizer.summarize(sample_text, "a.txt")
+        second = summarizer.summarize(sample_text, "b.txt")
+
+        assert first == second
+        assert client.calls == 1
+
+    def test_cache_namespace_includes_target_words(self, sample_text):
+        """Test a different summary length does not reuse cached summaries."""
+        client = CountingLLMClient()
+        cache = LRUSemanticCache()
+
+        DocumentSummarizer(llm_client=client, target_words=100, cache=cache).summarize(
+            sample_text, "a.txt"
+        )
+        DocumentSummarizer(llm_client=client, target_words=300, cache=cache).summarize(
+            sample_text, "a.txt"
+        )
+
+        assert client.calls == 2
+
+    def test_processor_reports_cache_hit_rate(self, sample_txt_file):
+        """Test the processor reports the cache hit rate, not per-document metadata."""
+        processor = DocumentProcessor(
+            llm_client=CountingLLMClient(), summary_cache=LRUSemanticCache()
+        )
+
+        processor.process(sample_txt_file, summarize=True)
+        result = processor.process(sample_txt_file, summarize=True)
+
+        assert processor.summary_cache_hit_rate == 0.5
+        assert "cache_hit_rate" not in result.metadata
+        assert DocumentProcessor().summary_cache_hit_rate is None
@@ -0,0 +1,60 @@
+"""
+Tests for model warm-up.
+"""
+
+import importlib
+
+import docprocessor
+from docprocessor import warmup
+
+
+class TestWarmUp:
+    """Tests for warm_up function."""
+
+    def test_exported(self):
+        """Test warm_up is part of the public API."""
+        assert "warm_up" in docprocessor.__all__
+
+    def test_loads_embedding_model(self, monkeypatch):
+        """Test the embedding model is loaded synchronously when requested."""
+        loaded = []
+        monkeypatch.setattr(warmup, "load_embedding_model", loaded.append)
+
+        thread = warmup.warm_up(embed_model="test-model", background=False)
+
+        assert thread is None
+        assert loaded == ["test-model"]
+
+    def test_background_thread(self, monkeypatch):
+        """Test warm-up runs in a daemon thread by default."""
+        loaded = []
+        monkeypatch.setattr(warmup, "load_embedding_model", loaded.append)
+
+        thread = warmup.warm_up(embed_model="test-model")
+        thread.join(timeout=5)
+
+        assert thread.daemon
+        assert loaded == ["test-model"]
+
+    def test_failures_are_not_raised(self, monkeypatch):
+        """Test a failing model load is logged instead of raised."""
+
+        def fail(model_name):
+            raise ImportError("sentence-transformers not installed")
+
+        monkeypatch.setattr(warmup, "load_embedding_model", fail)
+
+        warmup.warm_up(embed_model="test-model", background=False)
+
+    def test_env_warm_up_on_import(self, monkeypatch):
+        """Test DOCPROCESSOR_WARMUP starts warm-up on import with the configured model."""
+        calls = []
+        monkeypatch.setenv("DOCPROCESSOR_WARMUP", "1")
+        monkeypatch.setenv("DOCPROCESSOR_WARMUP_EMBED_MODEL", "test-model")
+        monkeypatch.setattr(warmup, "warm_up", lambda **kwargs: calls.append(kwargs))
+        # Restore the real warm_up on the package after the reload below
+        monkeypatch.setattr(docprocessor, "warm_up", docprocessor.warm_up)
+
+        importlib.reload(docprocessor)
+
+        assert calls == [{"embed_model": "test-model"}]